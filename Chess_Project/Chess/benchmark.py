@@ -0,0 +1,125 @@
+"""
+Benchmark Module for Chess Game
+
+This module measures the throughput of the hot parts of the chess model, so the effect of an optimization can be
+tracked. Every benchmark runs over the same positions, taken from seeded random games, and reports operations per
+second.
+
+Usage:
+    python -m Chess_Project.Chess.benchmark [attacks] [movegen] [--seconds SECONDS]
+
+"""
+from Chess_Project.Chess.model.game_state_class import GameState
+from array import array
+import argparse
+import random
+import time
+
+
+def sample_positions(count=32, plies=40, seed=2024):
+    """
+    Collect positions from seeded random games.
+
+    Args:
+        count (int): The number of games to play.
+        plies (int): The maximum number of plies played in every game.
+        seed (int): The seed of the random move choices.
+
+    Returns:
+        list: GameState objects, each one at the end of a game.
+    """
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        game_state = GameState()
+        for _ in range(rng.randrange(plies // 2, plies + 1)):
+            moves = game_state.get_valid_moves()
+            if not moves:
+                break
+            game_state.make_move(moves[rng.randrange(len(moves))])
+        positions.append(game_state)
+    return positions
+
+
+def bench_attack_queries(positions, seconds=2.0):
+    """
+    Measure how many square_under_attack queries are answered per second.
+
+    Args:
+        positions (list): The GameState objects to query.
+        seconds (float): The minimum duration of the measurement.
+
+    Returns:
+        float: The number of attack queries per second.
+
+    Every round asks, for every position, whether each of the 64 squares is attacked by the opponent.
+    """
+    squares = [(r, c) for r in range(8) for c in range(8)]
+    queries = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for game_state in positions:
+            for r, c in squares:
+                game_state.square_under_attack(r, c)
+        queries += len(positions) * len(squares)
+    return queries / (time.perf_counter() - start)
+
+
+def bench_move_generation(positions, seconds=2.0):
+    """
+    Measure how many positions per second get their legal moves generated into a move buffer.
+
+    Args:
+        positions (list): The GameState objects to generate the moves of.
+        seconds (float): The minimum duration of the measurement.
+
+    Returns:
+        float: The number of move generations per second.
+
+    The same array('H') buffer is emptied and refilled for every position, as the search does, so no Move object
+    is allocated.
+    """
+    buffer = array('H')
+    generations = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for game_state in positions:
+            del buffer[:]
+            game_state.generate_moves(buffer)
+        generations += len(positions)
+    return generations / (time.perf_counter() - start)
+
+
+BENCHMARKS = {
+    "attacks": ("attack queries", bench_attack_queries),
+    "movegen": ("move generations", bench_move_generation),
+}
+
+
+def main(argv=None):
+    """
+    Run the selected benchmarks and print their results.
+
+    Args:
+        argv (list): The command line arguments, sys.argv when None.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Measure the throughput of the chess model.")
+    parser.add_argument("benchmarks", nargs="*", metavar="benchmark",
+                        help=f"the benchmarks to run, among {', '.join(sorted(BENCHMARKS))} (all by default)")
+    parser.add_argument("--seconds", type=float, default=2.0, help="minimum duration of every benchmark")
+    args = parser.parse_args(argv)
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name!r}")
+
+    positions = sample_positions()
+    for name in args.benchmarks or sorted(BENCHMARKS):
+        label, benchmark = BENCHMARKS[name]
+        print(f"{label}: {benchmark(positions, args.seconds):,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,13 @@ from Chess_Project.Chess.model.moves.move_class import Move
 from Chess_Project.Chess.model.game_state_class import GameState
 from Chess_Project.Chess.view import menu_buttons_view as menu
 import pygame as p
+import threading
+import traceback
 import sys
 
+AI_MOVE_EVENT = p.USEREVENT + 1  # posted by the AI thread when its search is complete
+MOVE_LOG_SCROLL_LINES = 3  # lines of the move log scrolled by a notch of the mouse wheel
+
 
 class ChessController:
     """
@@ -14,12 +19,20 @@ class ChessController:
         Attributes:
         - chess_model (ChessModel): An instance of the chess model.
         - chess_view (ChessView): An instance of the chess view.
+        - ai_thread (Thread): The thread searching the AI move, None when the AI is not thinking.
+        - ai_stop (Event): Set to abandon the search of the AI thread.
+        - ai_search_id (int): The number of the latest AI search, to recognize the results of abandoned ones.
+        - ai_failed_key (int): The Zobrist key of the position where the AI search failed, not searched again until
+          an undo or a reset.
 
         Methods:
+        - think(): Starts the AI search in the background when it is the AI's turn.
+        - cancel_thinking(): Abandons the AI search in progress.
+        - close(): Abandons the AI search and stops the AI worker processes.
         - handle_input(screen, event): Handles user input during the game.
         - handle_menu_input(event): Handles user input in the game menu.
         - game_initialization(white_player, black_player, game_situation, running): Initializes the game parameters.
-        - end_game(screen): Displays the end game message based on the game state.
+        - end_game(screen): Displays the end game message based on the game state, returns the area drawn.
     """
     def __init__(self):
         """
@@ -28,6 +41,70 @@ class ChessController:
         self.chess_model = model.ChessModel()
         self.chess_model.valid_moves = self.chess_model.game_state.get_valid_moves()
         self.chess_view = view.ChessView()
+        self.ai_thread = None
+        self.ai_stop = threading.Event()
+        self.ai_search_id = 0
+        self.ai_failed_key = None
+
+    def think(self):
+        """
+        Starts the AI search in a background thread when it is the AI's turn, so the game keeps being drawn while
+        the AI thinks. Called once per frame; the thread posts an AI_MOVE_EVENT with the search result when done.
+        """
+        if self.ai_thread is not None:
+            if not self.ai_stop.is_set() or self.ai_thread.is_alive():
+                return  # thinking, its move not played yet, or an abandoned search still unwinding
+            self.ai_thread = None
+        game_state = self.chess_model.game_state
+        human_turn = (game_state.white_to_move and self.chess_model.white_player) or (
+                not game_state.white_to_move and self.chess_model.black_player)
+        if self.chess_model.game_over or human_turn or not self.chess_model.valid_moves \
+                or game_state.zobrist_key == self.ai_failed_key:
+            return
+
+        self.ai_search_id += 1
+        self.ai_stop = threading.Event()
+        # the search makes and takes back moves on its position, so it gets a copy of the one being drawn
+        position = GameState(game_state.to_fen())
+        self.ai_thread = threading.Thread(target=self.search_in_background,
+                                          args=(position, self.ai_search_id, self.ai_stop), daemon=True)
+        self.ai_thread.start()
+
+    def search_in_background(self, position, search_id, stop):
+        """
+        Searches the AI move, in the AI thread, and posts it to the event queue unless the search was abandoned.
+        A failed search is reported and posts no result, so that the game does not wait for the AI forever.
+
+        Args:
+            - position (GameState): A copy of the position to search.
+            - search_id (int): The number of the search.
+            - stop (Event): Set when the search is abandoned.
+        """
+        result = None
+        try:
+            result = self.chess_model.search_ai_move(position, stop.is_set)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            if not stop.is_set():
+                p.event.post(p.event.Event(AI_MOVE_EVENT, search_id=search_id, result=result))
+
+    def cancel_thinking(self):
+        """
+        Abandons the AI search in progress, before an undo or a reset; its result, if already posted, is ignored.
+        """
+        if self.ai_thread is not None:
+            self.ai_stop.set()
+
+    def close(self):
+        """
+        Abandons the AI search, waits for the AI thread and stops the AI worker processes.
+        """
+        self.cancel_thinking()
+        if self.ai_thread is not None:
+            self.ai_thread.join()
+            self.ai_thread = None
+        self.chess_model.close()
 
     def handle_input(self, screen, event):
         """
@@ -41,6 +118,10 @@ class ChessController:
         human_turn = (self.chess_model.game_state.white_to_move and self.chess_model.white_player) or (
                     not self.chess_model.game_state.white_to_move and self.chess_model.black_player)
 
+        # The input of the player skips the move animations, the board shown catching up with the game
+        if event.type == p.KEYDOWN or (event.type == p.MOUSEBUTTONDOWN and event.button <= 3):  # not the wheel
+            self.chess_view.skip_animations()
+
         # Quit the game
         if event.type == p.QUIT:
             self.chess_model.running = False
@@ -68,7 +149,6 @@ class ChessController:
                             if move == self.chess_model.valid_moves[i]:
                                 self.chess_model.game_state.make_move(self.chess_model.valid_moves[i])
                                 print("move made", self.chess_model.valid_moves[i].get_chess_notation())
-                                self.chess_model.game_state.move_log.append(self.chess_model.valid_moves[i])
                                 self.chess_model.animate = True
                                 self.chess_model.move_made = True
                                 self.chess_model.square_selected = ()
@@ -77,25 +157,46 @@ class ChessController:
                         if not self.chess_model.move_made:
                             self.chess_model.player_clicks = [self.chess_model.square_selected]
 
-            # AI move
-            if not self.chess_model.game_over and not human_turn:
-                move = self.chess_model.game_state.random_move(self.chess_model.valid_moves)
+        # Scroll the move log with the mouse wheel over it
+        elif event.type == p.MOUSEWHEEL:
+            if view.MOVE_LOG_RECT.collidepoint(p.mouse.get_pos()):
+                self.chess_view.scroll_move_log(-event.y * MOVE_LOG_SCROLL_LINES)
+
+        # AI move, searched in the background by think()
+        elif event.type == AI_MOVE_EVENT:
+            if event.search_id == self.ai_search_id and not self.ai_stop.is_set():
+                self.ai_thread = None
+                result = event.result
+                if result is None or result.best_move is None:
+                    # the position is not searched again until an undo or a reset
+                    print("AI search failed, undo (z) or reset (r) to continue")
+                    self.ai_failed_key = self.chess_model.game_state.zobrist_key
+                    return
+                move = result.best_move
                 self.chess_model.game_state.make_move(move)
-                self.chess_model.game_state.move_log.append(move)
+                print(f"AI move {move.get_chess_notation()}: score {result.score}, depth {result.depth}, "
+                      f"{result.nodes} nodes, {result.nodes_per_second():,.0f} nodes/s, "
+                      f"table hits {result.stats['table_hit_rate']:.1%}, "
+                      f"collisions {result.stats['table_collisions']}, "
+                      f"first move cutoffs {result.stats['first_move_cutoff_rate']:.1%}, "
+                      f"null move cutoffs {result.stats['null_move_cutoffs']}/{result.stats['null_move_tries']}, "
+                      f"reductions {result.stats['reductions']} ({result.stats['re_searches']} re-searched)")
                 self.chess_model.animate = True
                 self.chess_model.move_made = True
 
         elif event.type == p.KEYDOWN:
             if event.key == p.K_z:
+                self.cancel_thinking()
+                self.ai_failed_key = None
                 self.chess_model.game_state.undo_move()
-                if len(self.chess_model.game_state.move_log) != 0:
-                    self.chess_model.game_state.move_log.pop()
                 self.chess_model.animate = False
                 self.chess_model.move_made = True
                 self.chess_model.game_over = False
                 self.chess_model.game_state.check_mate = False
                 self.chess_model.game_state.stale_mate = False
             if event.key == p.K_r:
+                self.cancel_thinking()
+                self.ai_failed_key = None
                 self.chess_model.game_state = GameState()
                 self.chess_model.valid_moves = self.chess_model.game_state.get_valid_moves()
                 self.chess_model.square_selected = ()
@@ -105,6 +206,10 @@ class ChessController:
                 self.chess_model.game_over = False
                 self.chess_model.game_state.check_mate = False
                 self.chess_model.game_state.stale_mate = False
+            if event.key == p.K_PAGEUP:
+                self.chess_view.scroll_move_log(-view.MOVE_LOG_LINES)
+            if event.key == p.K_PAGEDOWN:
+                self.chess_view.scroll_move_log(view.MOVE_LOG_LINES)
             if event.key == p.K_q:
                 self.chess_model.running = False
                 self.chess_model.game_over = True
@@ -114,8 +219,8 @@ class ChessController:
 
         if self.chess_model.move_made:
             if self.chess_model.animate:
-                self.chess_view.animate_move(self.chess_model.game_state.move_log[-1], self.chess_view.screen,
-                                             self.chess_model.game_state.board, self.chess_view.clock)
+                self.chess_view.animate_move(self.chess_model.game_state.move_log[-1],
+                                             self.chess_model.game_state.board)
             self.chess_model.valid_moves = self.chess_model.game_state.get_valid_moves()
             self.chess_model.move_made = False
             self.chess_model.animate = False
@@ -161,13 +266,17 @@ class ChessController:
 
         Args:
             - screen: The Pygame screen surface.
+
+        Returns:
+            - pygame.Rect: The area of the screen drawn, None when the game is not over.
         """
         if self.chess_model.game_state.check_mate:
             self.chess_model.game_over = True
             if self.chess_model.game_state.white_to_move:
-                view.draw_end_game(screen, "Black wins by checkmate")
+                return view.draw_end_game(screen, "Black wins by checkmate")
             else:
-                view.draw_end_game(screen, "White wins by checkmate")
+                return view.draw_end_game(screen, "White wins by checkmate")
         elif self.chess_model.game_state.stale_mate:
             self.chess_model.game_over = True
-            view.draw_end_game(screen, "Stalemate")
+            return view.draw_end_game(screen, "Stalemate")
+        return None
@@ -23,9 +23,9 @@ def main():
             None
         """
 
-    # Initialize ChessView and ChessController
-    chess_view = view.ChessView()
+    # Initialize ChessController and its ChessView
     chess_controller = controller.ChessController()
+    chess_view = chess_controller.chess_view
 
     # menu loop
     while chess_controller.chess_view.game_situation == "menu":
@@ -44,17 +44,23 @@ def main():
                                          chess_controller.chess_view.game_situation,
                                          chess_controller.chess_view.running)
     # game loop
-    while chess_controller.chess_model.running and chess_controller.chess_model.game_situation == "game":
-        for event in p.event.get():
-            chess_controller.handle_input(chess_view.screen, event)
-
-        chess_view.draw(chess_controller.chess_model.game_state, chess_controller.chess_model.square_selected)
-
-        if chess_controller.chess_model.game_over:
-            chess_controller.end_game(chess_view.screen)
-
-        p.display.flip()
-        chess_view.clock.tick(view.MAX_FPS)
+    try:
+        while chess_controller.chess_model.running and chess_controller.chess_model.game_situation == "game":
+            chess_controller.think()  # starts the AI search in the background on its turn
+            for event in p.event.get():
+                chess_controller.handle_input(chess_view.screen, event)
+
+            # only the areas of the screen which changed are drawn and sent to the display
+            dirty = chess_view.draw(chess_controller.chess_model.game_state,
+                                    chess_controller.chess_model.square_selected)
+
+            if chess_controller.chess_model.game_over and dirty:
+                dirty.append(chess_controller.end_game(chess_view.screen))
+
+            p.display.update(dirty)
+            chess_view.clock.tick(view.MAX_FPS)
+    finally:
+        chess_controller.close()  # the AI thread and worker processes, also when the game exits with sys.exit
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+"""
+Bitboard Module for Chess Game
+
+This module contains the bitboard representation of a chess position used by the GameState class.
+Every piece type of every color is stored as a 64-bit integer in which bit (row * 8 + col) is set when such a piece
+stands on that square. Row 0 is the eighth rank, exactly as on the rendered board, so square indexes can be converted
+to the (row, col) pairs used by the rest of the game with divmod(square, 8).
+"""
+
+WHITE, BLACK = 0, 1
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+
+# piece indexes are color * 6 + piece type, EMPTY marks a free square in the mailbox
+PIECE_CODES = ("wp", "wN", "wB", "wR", "wQ", "wK", "bp", "bN", "bB", "bR", "bQ", "bK", "--")
+PIECE_INDEX = {code: index for index, code in enumerate(PIECE_CODES)}
+EMPTY = 12
+W_PAWN, W_KNIGHT, W_BISHOP, W_ROOK, W_QUEEN, W_KING = range(6)
+B_PAWN, B_KNIGHT, B_BISHOP, B_ROOK, B_QUEEN, B_KING = range(6, 12)
+
+FULL_BOARD = 0xFFFF_FFFF_FFFF_FFFF
+SQUARE_BB = [1 << square for square in range(64)]
+
+START_BOARD = [
+    ["bR", "bN", "bB", "bQ", "bK", "bB", "bN", "bR"],
+    ["bp", "bp", "bp", "bp", "bp", "bp", "bp", "bp"],
+    ["--", "--", "--", "--", "--", "--", "--", "--"],
+    ["--", "--", "--", "--", "--", "--", "--", "--"],
+    ["--", "--", "--", "--", "--", "--", "--", "--"],
+    ["--", "--", "--", "--", "--", "--", "--", "--"],
+    ["wp", "wp", "wp", "wp", "wp", "wp", "wp", "wp"],
+    ["wR", "wN", "wB", "wQ", "wK", "wB", "wN", "wR"]
+]
+
+
+def lsb(bb):
+    """
+    Get the index of the least significant set bit of a bitboard.
+
+    Args:
+        bb (int): A non-empty bitboard.
+
+    Returns:
+        int: The square index of the lowest set bit.
+    """
+    return (bb & -bb).bit_length() - 1
+
+
+def msb(bb):
+    """
+    Get the index of the most significant set bit of a bitboard.
+
+    Args:
+        bb (int): A non-empty bitboard.
+
+    Returns:
+        int: The square index of the highest set bit.
+    """
+    return bb.bit_length() - 1
+
+
+class Bitboards:
+    """
+    Bitboard representation of a chess position.
+
+    Attributes:
+        - pieces (list): Twelve bitboards, one for each piece type and color, indexed like PIECE_CODES.
+        - colors (list): The occupancy bitboards of the white and of the black pieces.
+        - occupied (int): The occupancy bitboard of all the pieces on the board.
+        - squares (list): A 64-entry mailbox with the piece index standing on every square (EMPTY if none).
+        - board (list): An 8x8 list of piece codes (e.g. "wp", "--") kept in sync for the renderers.
+
+    Methods:
+        - put_piece(piece, square): Places a piece on an empty square.
+        - remove_piece(piece, square): Removes a piece from the square it stands on.
+        - move_piece(piece, from_square, to_square): Moves a piece to an empty square.
+        - king_square(color): Returns the square of the king of the given color.
+    """
+    def __init__(self, board=None):
+        """
+        Initialize the bitboards, optionally from an 8x8 list of piece codes.
+
+        Args:
+            board (list): An 8x8 list of piece codes to load, or None for an empty board.
+        """
+        self.pieces = [0] * 12
+        self.colors = [0, 0]
+        self.occupied = 0
+        self.squares = [EMPTY] * 64
+        self.board = [["--"] * 8 for _ in range(8)]
+
+        if board is not None:
+            for row in range(8):
+                for col in range(8):
+                    if board[row][col] != "--":
+                        self.put_piece(PIECE_INDEX[board[row][col]], row * 8 + col)
+
+    def put_piece(self, piece, square):
+        """
+        Place a piece on an empty square.
+
+        Args:
+            piece (int): The piece index.
+            square (int): The square index.
+        """
+        bit = SQUARE_BB[square]
+        self.pieces[piece] |= bit
+        self.colors[piece // 6] |= bit
+        self.occupied |= bit
+        self.squares[square] = piece
+        self.board[square >> 3][square & 7] = PIECE_CODES[piece]
+
+    def remove_piece(self, piece, square):
+        """
+        Remove a piece from the square it stands on.
+
+        Args:
+            piece (int): The piece index.
+            square (int): The square index.
+        """
+        bit = SQUARE_BB[square]
+        self.pieces[piece] ^= bit
+        self.colors[piece // 6] ^= bit
+        self.occupied ^= bit
+        self.squares[square] = EMPTY
+        self.board[square >> 3][square & 7] = "--"
+
+    def move_piece(self, piece, from_square, to_square):
+        """
+        Move a piece to an empty square.
+
+        Args:
+            piece (int): The piece index.
+            from_square (int): The square the piece stands on.
+            to_square (int): The empty destination square.
+        """
+        bits = SQUARE_BB[from_square] | SQUARE_BB[to_square]
+        self.pieces[piece] ^= bits
+        self.colors[piece // 6] ^= bits
+        self.occupied ^= bits
+        self.squares[from_square] = EMPTY
+        self.squares[to_square] = piece
+        self.board[from_square >> 3][from_square & 7] = "--"
+        self.board[to_square >> 3][to_square & 7] = PIECE_CODES[piece]
+
+    def king_square(self, color):
+        """
+        Get the square of the king of the given color.
+
+        Args:
+            color (int): WHITE or BLACK.
+
+        Returns:
+            int: The square index of the king, or -1 if there is no such king on the board.
+        """
+        return lsb(self.pieces[color * 6 + KING])
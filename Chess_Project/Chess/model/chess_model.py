@@ -1,4 +1,8 @@
 from .game_state_class import GameState
+from .engine.transposition_table import TranspositionTable
+from .engine.search import search
+from .engine.smp import LazySMP
+import os
 
 
 class ChessModel:
@@ -17,9 +21,16 @@ class ChessModel:
         - game_state (GameState): An instance of the GameState class representing the current state of the game.
         - white_player (bool): True if the white player is human, False if AI.
         - black_player (bool): True if the black player is human, False if AI.
+        - ai_time_limit (float): The thinking time of the AI per move, in seconds.
+        - transposition_table (TranspositionTable): The search results of the AI, kept from one move to the next.
+        - ai_jobs (int): The number of processes the AI searches with, one per core by default.
+        - parallel_search (LazySMP): The worker processes of the AI when it searches with several, started with the
+          first AI move.
 
     Methods:
         - update(move): Update the game state after a move is made.
+        - search_ai_move(game_state, stop): Search the best move of the AI in a position.
+        - close(): Stop the worker processes of the AI.
 
     """
 
@@ -44,6 +55,10 @@ class ChessModel:
 
         self.white_player = True
         self.black_player = True
+        self.ai_time_limit = 1.0
+        self.transposition_table = TranspositionTable(16)
+        self.ai_jobs = os.cpu_count() or 1
+        self.parallel_search = None
 
     def update(self, move):
         """
@@ -54,3 +69,30 @@ class ChessModel:
         self.game_state.make_move(move)
         self.move_made = True
         self.animate = True
+
+    def search_ai_move(self, game_state, stop=None):
+        """
+            Search the best move of the AI in a position, in parallel when ai_jobs is above 1.
+
+            Args:
+                game_state (GameState): The position to search, a copy of the game state when the search runs in
+                    the background while the game is drawn.
+                stop (callable): Returns True when the search must be abandoned, None if it never must.
+
+            Returns:
+                SearchResult: The best move and the search statistics, without a best move when stopped early.
+        """
+        if self.ai_jobs <= 1:
+            return search(game_state, time_limit=self.ai_time_limit, table=self.transposition_table, stop=stop)
+        if self.parallel_search is None:
+            self.parallel_search = LazySMP(self.ai_jobs)
+            self.transposition_table = self.parallel_search.table
+        return self.parallel_search.search(game_state, time_limit=self.ai_time_limit, stop=stop)
+
+    def close(self):
+        """
+            Stop the worker processes of the AI and free their shared transposition table.
+        """
+        if self.parallel_search is not None:
+            self.parallel_search.close()
+            self.parallel_search = None
@@ -0,0 +1,177 @@
+"""
+Evaluation Module for Chess Game
+
+This module contains the static evaluation of the engine: the material of both sides plus a piece-square table bonus
+for every piece, which rewards centralized knights, advanced pawns, a sheltered king and so on. Every term has a
+midgame and an endgame value, blended by the game phase, which falls from MAX_PHASE to 0 as the pieces come off the
+board: the king then leaves its shelter for the center and the passed pawns gain value. Scores are in centipawns,
+from the point of view of the side to move, as the negamax search expects.
+
+The tables are written from white's point of view with the eighth rank first, so they are indexed by the square
+index (row * 8 + col) for white pieces, and by the mirrored square index (square ^ 56) for black pieces.
+
+The evaluation is not computed at the leaves: GameState keeps the sum of the PIECE_SQUARE_SCORES of its pieces and
+its phase as running totals, adjusted by every move and restored by every take back, so evaluate() only blends two
+numbers. A midgame and an endgame value are packed into one integer, the endgame value in the high bits, so that a
+single addition updates both.
+"""
+from ..bitboard import WHITE, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+
+PIECE_VALUES = (100, 320, 330, 500, 900, 0)  # by piece type, the king is never captured
+ENDGAME_PIECE_VALUES = (120, 300, 330, 520, 920, 0)
+
+PHASE_WEIGHTS = (0, 1, 1, 2, 4, 0)  # by piece type, the contribution of a piece to the game phase
+MAX_PHASE = 24  # the phase of the starting position
+
+PAWN_TABLE = (
+    0,  0,  0,  0,  0,  0,  0,  0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5,  5, 10, 25, 25, 10,  5,  5,
+    0,  0,  0, 20, 20,  0,  0,  0,
+    5, -5,-10,  0,  0,-10, -5,  5,
+    5, 10, 10,-20,-20, 10, 10,  5,
+    0,  0,  0,  0,  0,  0,  0,  0,
+)
+
+KNIGHT_TABLE = (
+    -50,-40,-30,-30,-30,-30,-40,-50,
+    -40,-20,  0,  0,  0,  0,-20,-40,
+    -30,  0, 10, 15, 15, 10,  0,-30,
+    -30,  5, 15, 20, 20, 15,  5,-30,
+    -30,  0, 15, 20, 20, 15,  0,-30,
+    -30,  5, 10, 15, 15, 10,  5,-30,
+    -40,-20,  0,  5,  5,  0,-20,-40,
+    -50,-40,-30,-30,-30,-30,-40,-50,
+)
+
+BISHOP_TABLE = (
+    -20,-10,-10,-10,-10,-10,-10,-20,
+    -10,  0,  0,  0,  0,  0,  0,-10,
+    -10,  0,  5, 10, 10,  5,  0,-10,
+    -10,  5,  5, 10, 10,  5,  5,-10,
+    -10,  0, 10, 10, 10, 10,  0,-10,
+    -10, 10, 10, 10, 10, 10, 10,-10,
+    -10,  5,  0,  0,  0,  0,  5,-10,
+    -20,-10,-10,-10,-10,-10,-10,-20,
+)
+
+ROOK_TABLE = (
+    0,  0,  0,  0,  0,  0,  0,  0,
+    5, 10, 10, 10, 10, 10, 10,  5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    0,  0,  0,  5,  5,  0,  0,  0,
+)
+
+QUEEN_TABLE = (
+    -20,-10,-10, -5, -5,-10,-10,-20,
+    -10,  0,  0,  0,  0,  0,  0,-10,
+    -10,  0,  5,  5,  5,  5,  0,-10,
+    -5,  0,  5,  5,  5,  5,  0, -5,
+    0,  0,  5,  5,  5,  5,  0, -5,
+    -10,  5,  5,  5,  5,  5,  0,-10,
+    -10,  0,  5,  0,  0,  0,  0,-10,
+    -20,-10,-10, -5, -5,-10,-10,-20,
+)
+
+KING_TABLE = (
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -20,-30,-30,-40,-40,-30,-30,-20,
+    -10,-20,-20,-20,-20,-20,-20,-10,
+    20, 20,  0,  0,  0,  0, 20, 20,
+    20, 30, 10,  0,  0, 10, 30, 20,
+)
+
+PAWN_ENDGAME_TABLE = (
+    0,  0,  0,  0,  0,  0,  0,  0,
+    80, 80, 80, 80, 80, 80, 80, 80,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    30, 30, 30, 30, 30, 30, 30, 30,
+    15, 15, 15, 15, 15, 15, 15, 15,
+    5,  5,  5,  5,  5,  5,  5,  5,
+    0,  0,  0,  0,  0,  0,  0,  0,
+    0,  0,  0,  0,  0,  0,  0,  0,
+)
+
+KING_ENDGAME_TABLE = (
+    -50,-40,-30,-20,-20,-30,-40,-50,
+    -30,-20,-10,  0,  0,-10,-20,-30,
+    -30,-10, 20, 30, 30, 20,-10,-30,
+    -30,-10, 30, 40, 40, 30,-10,-30,
+    -30,-10, 30, 40, 40, 30,-10,-30,
+    -30,-10, 20, 30, 30, 20,-10,-30,
+    -30,-30,  0,  0,  0,  0,-30,-30,
+    -50,-30,-30,-30,-30,-30,-30,-50,
+)
+
+PIECE_SQUARE_TABLES = (PAWN_TABLE, KNIGHT_TABLE, BISHOP_TABLE, ROOK_TABLE, QUEEN_TABLE, KING_TABLE)
+ENDGAME_PIECE_SQUARE_TABLES = (PAWN_ENDGAME_TABLE, KNIGHT_TABLE, BISHOP_TABLE, ROOK_TABLE, QUEEN_TABLE,
+                               KING_ENDGAME_TABLE)
+
+
+def make_score(midgame, endgame):
+    """
+    Pack a midgame and an endgame value into one integer; packed scores are added and subtracted as integers.
+    """
+    return (endgame << 32) + midgame
+
+
+# PIECE_SQUARE_SCORES[piece][square]: the packed material plus table bonus of a piece index (color * 6 + piece type),
+# positive for white pieces and negative for black pieces
+PIECE_SQUARE_SCORES = [
+    [make_score(PIECE_VALUES[kind] + PIECE_SQUARE_TABLES[kind][index],
+                ENDGAME_PIECE_VALUES[kind] + ENDGAME_PIECE_SQUARE_TABLES[kind][index]) * (1 if color == WHITE else -1)
+     for index in (range(64) if color == WHITE else [square ^ 56 for square in range(64)])]
+    for color in range(2) for kind in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING)
+]
+
+# PIECE_PHASES[piece]: the phase weight of a piece index
+PIECE_PHASES = PHASE_WEIGHTS * 2 + (0,)
+
+
+def compute_scores(bitboards):
+    """
+    Compute the running totals of the evaluation from scratch.
+
+    Args:
+        bitboards (Bitboards): The pieces of the position.
+
+    Returns:
+        tuple: The packed piece-square score of the position, from white's point of view, and its game phase.
+    """
+    score = 0
+    phase = 0
+    for piece, bb in enumerate(bitboards.pieces):
+        values = PIECE_SQUARE_SCORES[piece]
+        while bb:
+            low = bb & -bb
+            score += values[low.bit_length() - 1]
+            phase += PIECE_PHASES[piece]
+            bb ^= low
+    return score, phase
+
+
+def evaluate(game_state):
+    """
+    Evaluate a position statically, in O(1) from the running totals of the game state.
+
+    Args:
+        game_state (GameState): The position to evaluate.
+
+    Returns:
+        int: The score in centipawns, positive when the side to move is better.
+    """
+    score = game_state.piece_square_score
+    phase = min(game_state.phase, MAX_PHASE)  # promotions may raise the phase above the starting one
+    # unpack the score of make_score, the midgame value being signed in the low 32 bits
+    endgame = (score + (1 << 31)) >> 32
+    midgame = score - (endgame << 32)
+    score = (midgame * phase + endgame * (MAX_PHASE - phase)) // MAX_PHASE
+    return score if game_state.white_to_move else -score
@@ -0,0 +1,126 @@
+"""
+Move Ordering Module for Chess Game
+
+This module sorts the moves of a node so that the best ones are searched first, which is what makes alpha-beta
+prune: a node whose first move fails high skips all the others. The order is:
+
+    1. the move of the transposition table, best move of an earlier search of the position
+    2. captures and promotions, the most valuable victim first and, among those, the least valuable attacker first
+       (MVV-LVA)
+    3. the two killer moves of the ply, quiet moves which caused a cutoff in a sibling node
+    4. the other quiet moves, by their history score, the accumulated depth of the cutoffs they caused
+    5. the captures losing material according to the static exchange evaluation, the least losing first
+"""
+from ..moves.move_class import CAPTURE, EN_PASSANT, PROMOTION
+from ..bitboard import PAWN, KNIGHT
+from .see import see, SEE_VALUES
+
+TT_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 24
+KILLER_SCORES = (1 << 23, (1 << 23) - 1)
+HISTORY_LIMIT = (1 << 22) - 1
+
+# MVV_LVA[victim type][attacker type], promotions count as the capture of the promoted piece type
+MVV_LVA = [[(victim + 1) * 8 - attacker for attacker in range(6)] for victim in range(6)]
+
+
+class MoveOrderer:
+    """
+    Orders the moves of the search nodes and learns from their cutoffs.
+
+    Attributes:
+        killers (list): The two killer move codes of every ply, the newest first.
+        history (list): The history score of every (from, to) pair, indexed by from * 64 + to.
+        cutoffs (int): The number of nodes which failed high.
+        first_move_cutoffs (int): The nodes which failed high on their first move.
+
+    Methods:
+        order(game_state, moves, ply, tt_move): Returns the moves sorted from the most to the least promising.
+        record_cutoff(code, ply, depth, move_index): Learns from a move which failed high.
+        first_move_cutoff_rate(): Returns the fraction of the cutoffs made by the first move.
+    """
+
+    def __init__(self, max_ply):
+        """
+        Initializes empty killer and history tables.
+
+        Args:
+            max_ply (int): The maximum distance to the root of the searched positions.
+        """
+        self.killers = [[0, 0] for _ in range(max_ply + 1)]
+        self.history = [0] * (64 * 64)
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def order(self, game_state, moves, ply, tt_move=0):
+        """
+        Returns the moves sorted from the most to the least promising.
+
+        Args:
+            game_state (GameState): The position of the moves.
+            moves (array): The 16-bit move codes.
+            ply (int): The distance of the position to the root.
+            tt_move (int): The move of the transposition table, 0 for none.
+
+        Returns:
+            list: The move codes in search order.
+        """
+        squares = game_state.bitboards.squares
+        killer, second_killer = self.killers[ply]
+        history = self.history
+
+        def score(code):
+            if code == tt_move:
+                return TT_MOVE_SCORE
+            flags = code >> 12
+            if flags & PROMOTION:
+                victim = KNIGHT + (flags & 3)  # the promoted piece type
+                if flags & CAPTURE:
+                    victim = max(victim, squares[code >> 6 & 63] % 6)
+                return CAPTURE_SCORE + MVV_LVA[victim][PAWN]
+            if flags & CAPTURE:
+                victim = PAWN if flags == EN_PASSANT else squares[code >> 6 & 63] % 6
+                attacker = squares[code & 63] % 6
+                if SEE_VALUES[attacker] > SEE_VALUES[victim]:
+                    exchange = see(game_state, code)
+                    if exchange < 0:
+                        return exchange  # a losing capture, after the quiet moves
+                return CAPTURE_SCORE + MVV_LVA[victim][attacker]
+            if code == killer:
+                return KILLER_SCORES[0]
+            if code == second_killer:
+                return KILLER_SCORES[1]
+            return history[code & 0xFFF]
+
+        return sorted(moves, key=score, reverse=True)
+
+    def record_cutoff(self, code, ply, depth, move_index):
+        """
+        Learns from a move which failed high.
+
+        Args:
+            code (int): The move code.
+            ply (int): The distance of the position to the root.
+            depth (int): The remaining depth of the node.
+            move_index (int): The position of the move in the search order, 0 for the first one.
+        """
+        self.cutoffs += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+        if code >> 12 & (CAPTURE | PROMOTION):
+            return  # captures and promotions are already ordered first
+        killers = self.killers[ply]
+        if killers[0] != code:
+            killers[1] = killers[0]
+            killers[0] = code
+        index = code & 0xFFF
+        self.history[index] = min(self.history[index] + depth * depth, HISTORY_LIMIT)
+
+    def first_move_cutoff_rate(self):
+        """
+        Returns the fraction of the cutoffs made by the first move searched, a measure of the ordering quality.
+
+        Returns:
+            float: The first move cutoff rate, 0 before the first cutoff.
+        """
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
@@ -0,0 +1,638 @@
+"""
+Search Module for Chess Game
+
+This module contains the engine playing the AI side: a negamax search with alpha-beta pruning over the 16-bit move
+codes of GameState, extended at the leaves by a quiescence search of the captures, so that the static evaluation is
+only trusted in quiet positions. The search makes and takes back the moves on the
+game state it is given, which is left unchanged when it returns.
+
+Two selective techniques let it reach deeper in the same time, both optional:
+
+    - null move pruning: the side to move passes and the opponent gets a reduced search; if the position still
+      fails high, a real move would too and the node is cut. Passing is often the best "move" in pawn endings
+      (zugzwang), so the side to move must have a piece besides its pawns and king.
+    - late move reductions: the quiet moves ordered late rarely turn out best, so they are searched to a reduced
+      depth with a null window first, and searched again to the full depth only when they beat alpha.
+
+The search is a principal variation search (PVS): the first move of a node is searched with the full window, and
+every other move with a null window around alpha, which only proves it is not better; the rare move which beats
+alpha is searched again with the full window. With good move ordering, most nodes are then searched with the cheaper
+null window.
+
+The search deepens iteratively, one ply at a time, so a best move is always ready: when the time budget runs out in
+the middle of an iteration, that iteration is abandoned and the result of the last completed one is returned. The
+budget is either fixed or taken from a game clock by time_for_move. From ASPIRATION_MIN_DEPTH on, an iteration
+starts with a narrow aspiration window around the score of the previous one, widened and searched again when the
+score falls outside.
+
+The search can return the best multi_pv lines instead of one (multi-PV), for analysis: the root keeps the multi_pv
+best moves, and a root move must beat the worst of them, instead of the best one, to be searched with the full
+window. The aspiration windows are then not used. The lines are read from the transposition table.
+
+Usage:
+    result = search(game_state, time_limit=1.0)
+    game_state.make_move(result.best_move)
+
+    result = search(game_state, depth=6, multi_pv=3)
+    for score, codes in result.lines:
+        print(score, line_notation(game_state, codes))
+
+"""
+from ..moves.move_class import Move, CAPTURE, EN_PASSANT, PROMOTION
+from ..bitboard import WHITE, BLACK, PAWN, QUEEN, KING
+from .evaluation import evaluate, PIECE_VALUES
+from .move_ordering import MoveOrderer
+from .see import see
+from .transposition_table import (TranspositionTable, EXACT, LOWER, UPPER, entry_move, entry_score, entry_depth,
+                                  entry_bound)
+from array import array
+import time
+
+INFINITY = 1_000_000
+MATE_SCORE = 100_000  # the score of a mate at the root, reduced by one for every ply before it
+MAX_PLY = 128
+
+DEFAULT_DEPTH = 3
+
+TIME_CHECK_INTERVAL = 1024  # nodes searched between two looks at the clock, must be a power of two
+NEXT_ITERATION_FRACTION = 0.5  # no new iteration is started once this fraction of the budget is spent
+DEFAULT_MOVES_TO_GO = 30  # moves the remaining clock time is shared among when the game has no time control
+DEFAULT_TABLE_MEGABYTES = 16
+
+DELTA_MARGIN = 200  # positional gain a capture may bring on top of the captured material, for delta pruning
+SEE_PRUNING_DEPTH = 3  # captures losing material are pruned up to this remaining depth
+SEE_PRUNING_MARGIN = 100  # material, per ply of remaining depth, a pruned capture must lose
+
+NULL_MOVE_MIN_DEPTH = 3  # null move pruning is tried from this remaining depth
+NULL_MOVE_REDUCTION = 2  # depth reduction of the null move search, one more from NULL_MOVE_DEEP_DEPTH
+NULL_MOVE_DEEP_DEPTH = 6
+LMR_MIN_DEPTH = 3  # late move reductions apply from this remaining depth
+LMR_MIN_INDEX = 3  # moves before this position in the search order are never reduced
+LMR_DEEP_INDEX = 8  # moves from this position are reduced by one more ply, at LMR_DEEP_DEPTH and deeper
+LMR_DEEP_DEPTH = 6
+
+ASPIRATION_MIN_DEPTH = 4  # iterations from this depth start with an aspiration window
+ASPIRATION_WINDOW = 30  # half width of the first aspiration window, doubled after every failure
+ASPIRATION_MAX_WINDOW = 500  # wider windows are opened completely
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget is spent, to unwind the current iteration.
+    """
+
+
+def time_for_move(clock, increment=0.0, moves_to_go=None):
+    """
+    Derive the time budget of a move from a game clock.
+
+    Args:
+        clock (float): The time left on the clock of the side to move, in seconds.
+        increment (float): The time added to the clock after every move, in seconds.
+        moves_to_go (int): The number of moves to play before the next time control, None if there is none.
+
+    Returns:
+        float: The time budget of the move, in seconds, never more than half of the clock.
+    """
+    budget = clock / (moves_to_go or DEFAULT_MOVES_TO_GO) + increment * 0.75
+    return max(0.0, min(budget, clock * 0.5))
+
+
+def line_notation(game_state, codes):
+    """
+    Write a line of moves in the notation of the move log.
+
+    Args:
+        game_state (GameState): The position the line starts from, left unchanged.
+        codes (list): The 16-bit codes of the moves of the line.
+
+    Returns:
+        str: The moves separated by spaces (e.g. "e2e4 e7e5 g1f3").
+    """
+    notation = []
+    for code in codes:
+        notation.append(Move.from_code(code, game_state.board).get_chess_notation())
+        game_state.push_move(code)
+    for _ in codes:
+        game_state.pop_move()
+    return " ".join(notation)
+
+
+def score_to_table(score, ply):
+    """
+    Convert a score for the transposition table, where mate scores count the plies from the position, not the root.
+
+    Args:
+        score (int): The score, relative to the root.
+        ply (int): The distance of the position to the root.
+
+    Returns:
+        int: The score relative to the position.
+    """
+    if score >= MATE_SCORE - MAX_PLY:
+        return score + ply
+    if score <= -MATE_SCORE + MAX_PLY:
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    """
+    Convert a score read from the transposition table back to a score relative to the root.
+
+    Args:
+        score (int): The score, relative to the position.
+        ply (int): The distance of the position to the root.
+
+    Returns:
+        int: The score relative to the root.
+    """
+    if score >= MATE_SCORE - MAX_PLY:
+        return score - ply
+    if score <= -MATE_SCORE + MAX_PLY:
+        return score + ply
+    return score
+
+
+class SearchResult:
+    """
+    The outcome of a search.
+
+    Attributes:
+        best_move (Move): The best move found, None when the side to move has no legal move.
+        move_code (int): The 16-bit code of the best move, 0 when there is none.
+        score (int): The score of the best move in centipawns, from the point of view of the side to move.
+        depth (int): The depth of the search, in plies.
+        nodes (int): The number of positions visited.
+        elapsed (float): The duration of the search, in seconds.
+        stats (dict): Further search statistics by name (e.g. "first_move_cutoff_rate", "null_move_cutoffs").
+        lines (list): The best lines found, best first, as (score, move codes) tuples; one line unless the search
+            was asked for more (multi-PV), none when there is no legal move.
+
+    Methods:
+        nodes_per_second(): Returns the search speed.
+    """
+
+    def __init__(self, best_move, move_code, score, depth, nodes, elapsed, stats=None, lines=None):
+        """
+        Initializes the search result.
+
+        Args:
+            best_move (Move): The best move found, None when there is no legal move.
+            move_code (int): The 16-bit code of the best move.
+            score (int): The score of the best move.
+            depth (int): The depth of the search.
+            nodes (int): The number of positions visited.
+            elapsed (float): The duration of the search, in seconds.
+            stats (dict): Further search statistics by name.
+            lines (list): The best lines found, as (score, move codes) tuples.
+        """
+        self.best_move = best_move
+        self.move_code = move_code
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.elapsed = elapsed
+        self.stats = stats if stats is not None else {}
+        self.lines = lines if lines is not None else []
+
+    def nodes_per_second(self):
+        """
+        Returns the search speed.
+
+        Returns:
+            float: The number of positions visited per second.
+        """
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class Searcher:
+    """
+    A negamax alpha-beta search over a game state.
+
+    Attributes:
+        game_state (GameState): The position searched, changed during the search and restored afterwards.
+        nodes (int): The number of positions visited so far.
+        deadline (float): The time.perf_counter() value at which the search stops, None for no limit.
+        stop (callable): Returns True when the search must stop before its deadline, None if it never must.
+        table (TranspositionTable): The transposition table, shared with the other searches of the game.
+        orderer (MoveOrderer): The move ordering, with the killer moves and the history of the search.
+        null_move (bool): True to use null move pruning.
+        late_move_reductions (bool): True to reduce the late quiet moves.
+        null_move_tries (int): The null move searches made.
+        null_move_cutoffs (int): The null move searches which cut their node.
+        reductions (int): The moves searched to a reduced depth.
+        re_searches (int): The reduced moves searched again to the full depth.
+        pvs_re_searches (int): The moves searched again with the full window after beating alpha.
+        aspiration_re_searches (int): The iterations searched again after failing outside their aspiration window.
+
+    Methods:
+        must_stop(): Tells whether the deadline has passed or the search was stopped.
+        search_iteration(depth, previous, guess, multi_pv): Searches the root position with aspiration windows.
+        search_root(depth, previous, alpha, beta, multi_pv): Searches the root position and returns its best moves.
+        principal_variation(code, max_length): Returns the line of a root move, read from the transposition table.
+        negamax(depth, alpha, beta, ply, allow_null): Returns the score of the current position.
+        has_pieces(): Tells whether the side to move has a piece besides its pawns and king.
+        quiescence(alpha, beta, ply): Returns the score of the current position once the captures are resolved.
+    """
+
+    def __init__(self, game_state, table, deadline=None, null_move=True, late_move_reductions=True, stop=None):
+        """
+        Initializes the searcher.
+
+        Args:
+            game_state (GameState): The position to search.
+            table (TranspositionTable): The transposition table.
+            deadline (float): The time.perf_counter() value at which the search stops, None for no limit.
+            stop (callable): Returns True when the search must stop, None if it never must.
+            null_move (bool): True to use null move pruning.
+            late_move_reductions (bool): True to reduce the late quiet moves.
+        """
+        self.game_state = game_state
+        self.table = table
+        self.orderer = MoveOrderer(MAX_PLY)
+        self.nodes = 0
+        self.deadline = deadline
+        self.stop = stop
+        self.null_move = null_move
+        self.late_move_reductions = late_move_reductions
+        self.null_move_tries = 0
+        self.null_move_cutoffs = 0
+        self.reductions = 0
+        self.re_searches = 0
+        self.pvs_re_searches = 0
+        self.aspiration_re_searches = 0
+
+    def must_stop(self):
+        """
+        Tells whether the search must stop, looked at every TIME_CHECK_INTERVAL nodes.
+
+        Returns:
+            bool: True if the deadline has passed or the stop callable returns True.
+        """
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            return True
+        return self.stop is not None and self.stop()
+
+    def search_iteration(self, depth, previous=(), guess=0, multi_pv=1):
+        """
+        Searches the root position to a fixed depth, within an aspiration window around a guessed score.
+
+        Args:
+            depth (int): The depth of the search, in plies, at least 1.
+            previous (list): The moves of the previous iteration, best first.
+            guess (int): The expected score, usually the score of the previous iteration.
+            multi_pv (int): The number of best moves to find.
+
+        Returns:
+            list: The best moves as (score, move_code) tuples, best first, as returned by search_root.
+
+        Raises:
+            SearchTimeout: If the deadline passes during the search.
+        """
+        if depth < ASPIRATION_MIN_DEPTH or multi_pv > 1:
+            return self.search_root(depth, previous, -INFINITY, INFINITY, multi_pv)
+        window = ASPIRATION_WINDOW
+        alpha, beta = guess - window, guess + window
+        while True:
+            lines = self.search_root(depth, previous, alpha, beta)
+            score = lines[0][0]
+            if alpha < score < beta or not lines[0][1]:
+                return lines
+            self.aspiration_re_searches += 1
+            window *= 2
+            if score <= alpha:
+                alpha = score - window if window <= ASPIRATION_MAX_WINDOW else -INFINITY
+            else:
+                beta = score + window if window <= ASPIRATION_MAX_WINDOW else INFINITY
+                previous = [lines[0][1]]  # the move which failed high is searched first
+
+    def search_root(self, depth, previous=(), alpha=-INFINITY, beta=INFINITY, multi_pv=1):
+        """
+        Searches the root position to a fixed depth.
+
+        Args:
+            depth (int): The depth of the search, in plies, at least 1.
+            previous (list): The moves to search first, usually the best moves of the previous iteration, best first.
+            alpha (int): The lower bound of the window of the root.
+            beta (int): The upper bound of the window of the root.
+            multi_pv (int): The number of best moves to find.
+
+        Returns:
+            list: Up to multi_pv (score, move_code) tuples, best first; a single (score, 0) tuple when the side to
+            move has no legal move. The scores are exact when they lie between alpha and beta, bounds otherwise.
+
+        Raises:
+            SearchTimeout: If the deadline passes during the search; the game state is then left with the moves of
+                the interrupted line made.
+        """
+        game_state = self.game_state
+        self.nodes += 1
+        moves = array('H')
+        checkers = game_state.generate_moves(moves)
+        if not moves:
+            return [(-MATE_SCORE if checkers else 0, 0)]
+        moves = self.orderer.order(game_state, moves, 0, previous[0] if previous else 0)
+        if len(previous) > 1:
+            rank = {code: index for index, code in enumerate(previous)}
+            moves.sort(key=lambda code: rank.get(code, len(rank)))  # a stable sort, the other moves keep their order
+
+        lines = []
+        for code in moves:
+            floor = alpha if len(lines) < multi_pv else max(alpha, lines[-1][0])  # the score to beat
+            game_state.push_move(code)
+            if len(lines) < multi_pv:
+                score = -self.negamax(depth - 1, -beta, -floor, 1)  # every move makes a line, its score is needed
+            else:
+                score = -self.negamax(depth - 1, -floor - 1, -floor, 1)
+                if floor < score < beta:
+                    self.pvs_re_searches += 1
+                    score = -self.negamax(depth - 1, -beta, -floor, 1)
+            game_state.pop_move()
+            if len(lines) < multi_pv or score > floor:
+                lines.append((score, code))
+                lines.sort(key=lambda line: -line[0])
+                del lines[multi_pv:]
+                if score >= beta:
+                    break  # fail high, the aspiration window is too low
+
+        score, best_code = lines[0]
+        if score >= beta:
+            bound = LOWER
+        elif score > alpha:
+            bound = EXACT
+        else:
+            bound = UPPER
+            best_code = 0
+        self.table.store(game_state.zobrist_key, best_code, score, depth, bound)
+        return lines
+
+    def principal_variation(self, code, max_length):
+        """
+        Returns the line of a root move: the move, then the best moves stored in the transposition table.
+
+        Args:
+            code (int): The 16-bit code of the root move.
+            max_length (int): The maximum number of moves of the line.
+
+        Returns:
+            list: The move codes of the line, starting with code.
+        """
+        game_state = self.game_state
+        line = [code]
+        game_state.push_move(code)
+        seen = {game_state.zobrist_key}
+        moves = array('H')
+        while len(line) < max_length:
+            data = self.table.probe(game_state.zobrist_key)
+            code = entry_move(data)
+            if not code:
+                break
+            del moves[:]
+            game_state.generate_moves(moves)
+            if code not in moves:
+                break  # a collision in the table
+            game_state.push_move(code)
+            line.append(code)
+            if game_state.zobrist_key in seen:
+                break  # a repetition
+            seen.add(game_state.zobrist_key)
+        for _ in line:
+            game_state.pop_move()
+        return line
+
+    def negamax(self, depth, alpha, beta, ply, allow_null=True):
+        """
+        Returns the score of the current position.
+
+        Args:
+            depth (int): The remaining depth, in plies.
+            alpha (int): The score the side to move is already sure to get.
+            beta (int): The score above which the opponent avoids this position.
+            ply (int): The distance to the root, in plies.
+            allow_null (bool): False right after a null move, so that two passes never follow each other.
+
+        Returns:
+            int: The score of the position from the point of view of the side to move, exact when it lies between
+            alpha and beta, a bound otherwise.
+        """
+        self.nodes += 1
+        if not self.nodes & (TIME_CHECK_INTERVAL - 1) and self.must_stop():
+            raise SearchTimeout
+        game_state = self.game_state
+        if depth <= 0:
+            return self.quiescence(alpha, beta, ply)
+
+        key = game_state.zobrist_key
+        data = self.table.probe(key)
+        tt_move = entry_move(data)
+        if data and entry_depth(data) >= depth:
+            score = score_from_table(entry_score(data), ply)
+            bound = entry_bound(data)
+            if bound == EXACT or (bound == LOWER and score >= beta) or (bound == UPPER and score <= alpha):
+                return score
+
+        moves = array('H')
+        checkers = game_state.generate_moves(moves)
+        if not moves:
+            return -MATE_SCORE + ply if checkers else 0  # checkmate, the sooner the worse, or stalemate
+
+        if self.null_move and allow_null and not checkers and depth >= NULL_MOVE_MIN_DEPTH \
+                and beta < MATE_SCORE - MAX_PLY and self.has_pieces() and evaluate(game_state) >= beta:
+            reduction = NULL_MOVE_REDUCTION + (depth >= NULL_MOVE_DEEP_DEPTH)
+            self.null_move_tries += 1
+            game_state.push_null_move()
+            score = -self.negamax(depth - 1 - reduction, -beta, -beta + 1, ply + 1, False)
+            game_state.pop_move()
+            if score >= beta:
+                self.null_move_cutoffs += 1
+                return beta  # even passing fails high, a mate score found after a pass is not trusted
+
+        original_alpha = alpha
+        best = -INFINITY
+        best_code = 0
+        see_pruning = not checkers and depth <= SEE_PRUNING_DEPTH
+        reducing = self.late_move_reductions and not checkers and depth >= LMR_MIN_DEPTH
+        for index, code in enumerate(self.orderer.order(game_state, moves, ply, tt_move)):
+            if see_pruning and index and code >> 12 & CAPTURE and see(game_state, code) < -SEE_PRUNING_MARGIN * depth:
+                continue  # a capture losing material near the leaves
+            game_state.push_move(code)
+            if not index:
+                score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)
+            else:
+                reduction = 0
+                if reducing and index >= LMR_MIN_INDEX and not code >> 12 & (CAPTURE | PROMOTION) \
+                        and not game_state.in_check():
+                    reduction = 1 + (index >= LMR_DEEP_INDEX and depth >= LMR_DEEP_DEPTH)
+                    self.reductions += 1
+                score = -self.negamax(depth - 1 - reduction, -alpha - 1, -alpha, ply + 1)
+                if reduction and score > alpha:
+                    self.re_searches += 1
+                    score = -self.negamax(depth - 1, -alpha - 1, -alpha, ply + 1)
+                if alpha < score < beta:
+                    self.pvs_re_searches += 1
+                    score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)
+            game_state.pop_move()
+            if score > best:
+                best = score
+                best_code = code
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self.orderer.record_cutoff(code, ply, depth, index)
+                        break  # the opponent will not allow this position
+
+        if best >= beta:
+            bound = LOWER
+        elif best > original_alpha:
+            bound = EXACT
+        else:
+            bound = UPPER
+            best_code = 0  # every move failed low, none of them is known to be best
+        self.table.store(key, best_code, score_to_table(best, ply), depth, bound)
+        return best
+
+    def has_pieces(self):
+        """
+        Tell whether the side to move has a piece besides its pawns and king, the zugzwang guard of null move pruning.
+
+        Returns:
+            bool: True if the side to move has a knight, bishop, rook or queen.
+        """
+        bitboards = self.game_state.bitboards
+        color = WHITE if self.game_state.white_to_move else BLACK
+        pieces = bitboards.pieces
+        return bool(bitboards.colors[color] & ~(pieces[color * 6 + PAWN] | pieces[color * 6 + KING]))
+
+    def quiescence(self, alpha, beta, ply):
+        """
+        Returns the score of the current position once the captures are resolved.
+
+        Args:
+            alpha (int): The score the side to move is already sure to get.
+            beta (int): The score above which the opponent avoids this position.
+            ply (int): The distance to the root, in plies.
+
+        Returns:
+            int: The score of the position from the point of view of the side to move, a bound when it lies outside
+            alpha and beta.
+
+        Only captures and promotions are searched. The side to move may also stand pat, keep the static evaluation,
+        since it is not forced to capture; captures which cannot bring the score up to alpha, even with a margin,
+        are skipped (delta pruning), as are the captures losing material according to the static exchange
+        evaluation. In check, every evasion is searched and there is no standing pat.
+        """
+        self.nodes += 1
+        if not self.nodes & (TIME_CHECK_INTERVAL - 1) and self.must_stop():
+            raise SearchTimeout
+        game_state = self.game_state
+        moves = array('H')
+
+        if game_state.in_check():
+            game_state.generate_moves(moves)
+            if not moves:
+                return -MATE_SCORE + ply
+            if ply >= MAX_PLY:
+                return evaluate(game_state)  # the killer moves stop at MAX_PLY, so does a long sequence of checks
+            best = stand_pat = -INFINITY
+        else:
+            best = stand_pat = evaluate(game_state)
+            if stand_pat >= beta or ply >= MAX_PLY:
+                return stand_pat
+            if stand_pat + PIECE_VALUES[QUEEN] + DELTA_MARGIN <= alpha:
+                return stand_pat  # even winning a queen would not help
+            if stand_pat > alpha:
+                alpha = stand_pat
+            game_state.generate_captures(moves)
+
+        squares = game_state.bitboards.squares
+        for code in self.orderer.order(game_state, moves, ply):
+            flags = code >> 12
+            if stand_pat > -INFINITY and not flags & PROMOTION:
+                victim = PAWN if flags == EN_PASSANT else squares[code >> 6 & 63] % 6
+                if stand_pat + PIECE_VALUES[victim] + DELTA_MARGIN <= alpha:
+                    continue  # delta pruning
+                if PIECE_VALUES[squares[code & 63] % 6] > PIECE_VALUES[victim] and see(game_state, code) < 0:
+                    continue  # a losing capture
+            game_state.push_move(code)
+            score = -self.quiescence(-beta, -alpha, ply + 1)
+            game_state.pop_move()
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best
+
+
+def search(game_state, depth=None, time_limit=None, clock=None, increment=0.0, table=None, null_move=True,
+           late_move_reductions=True, multi_pv=1, start_depth=1, stop=None):
+    """
+    Find the best move of the side to move by iterative deepening.
+
+    Args:
+        game_state (GameState): The position to search, left unchanged.
+        depth (int): The maximum depth of the search, in plies, None for no maximum.
+        time_limit (float): The time budget in seconds, None for no limit.
+        clock (float): The time left on the clock of the side to move, in seconds, used to derive the time budget
+            when no time limit is given.
+        increment (float): The time added to the clock after every move, in seconds.
+        table (TranspositionTable): The transposition table, kept from one move to the next by the caller, None for
+            a new table of DEFAULT_TABLE_MEGABYTES.
+        null_move (bool): True to use null move pruning.
+        late_move_reductions (bool): True to reduce the late quiet moves.
+        multi_pv (int): The number of best lines to return, at least 1.
+        start_depth (int): The depth of the first iteration, 1 unless the search helps a parallel one.
+        stop (callable): Returns True when the search must stop, e.g. the is_set method of a threading.Event; None
+            if it never must. The result is then the one of the last completed iteration.
+
+    Returns:
+        SearchResult: The best move of the last completed iteration, its score and the search statistics. There is
+        no best move when the search was stopped before completing an iteration.
+
+    The first iteration always completes unless the search is stopped, so there is a move to play even with a tiny
+    budget. Without depth, time limit and clock, the search stops at DEFAULT_DEPTH.
+    """
+    if time_limit is None and clock is not None:
+        time_limit = time_for_move(clock, increment)
+    if depth is None and time_limit is None:
+        depth = DEFAULT_DEPTH
+    start = time.perf_counter()
+    deadline = start + time_limit if time_limit is not None else None
+    if table is None:
+        table = TranspositionTable(DEFAULT_TABLE_MEGABYTES)
+    table.new_search()
+    probes, hits, collisions = table.probes, table.hits, table.collisions
+    searcher = Searcher(game_state, table, null_move=null_move, late_move_reductions=late_move_reductions,
+                        stop=stop)
+    root_ply = len(game_state.move_stack)
+
+    lines, reached = [], 0
+    score, move_code = 0, 0
+    for current in range(min(start_depth, MAX_PLY), min(depth or MAX_PLY, MAX_PLY) + 1):
+        searcher.deadline = deadline if reached else None
+        try:
+            found = searcher.search_iteration(current, [code for _, code in lines], lines[0][0] if lines else 0,
+                                              multi_pv)
+        except SearchTimeout:
+            while len(game_state.move_stack) > root_ply:  # take back the line the timeout interrupted
+                game_state.pop_move()
+            break
+        lines, reached = found, current
+        score, move_code = lines[0]
+        if not move_code or (multi_pv == 1 and abs(score) >= MATE_SCORE - MAX_PLY):
+            break  # no legal move, or a forced mate was found
+        if deadline is not None and time.perf_counter() - start >= time_limit * NEXT_ITERATION_FRACTION:
+            break  # the next iteration would not finish in time
+
+    elapsed = time.perf_counter() - start
+    best_move = Move.from_code(move_code, game_state.board) if move_code else None
+    stats = {"first_move_cutoff_rate": searcher.orderer.first_move_cutoff_rate(),
+             "null_move_tries": searcher.null_move_tries, "null_move_cutoffs": searcher.null_move_cutoffs,
+             "reductions": searcher.reductions, "re_searches": searcher.re_searches,
+             "pvs_re_searches": searcher.pvs_re_searches, "aspiration_re_searches": searcher.aspiration_re_searches,
+             "table_hit_rate": (table.hits - hits) / (table.probes - probes) if table.probes > probes else 0.0,
+             "table_collisions": table.collisions - collisions}
+    lines = [(value, searcher.principal_variation(code, reached)) for value, code in lines if code]
+    return SearchResult(best_move, move_code, score, reached, searcher.nodes, elapsed, stats, lines)
@@ -0,0 +1,86 @@
+"""
+Static Exchange Evaluation Module for Chess Game
+
+This module computes the material outcome of the sequence of captures a move starts on its destination square, both
+sides always recapturing with their least valuable attacker and stopping when recapturing would lose material. No
+move is made: the attackers are looked up on the bitboards, removed from a local occupancy as they capture, and the
+sliders they uncover behind them (x-rays) join the exchange. Pins are ignored.
+
+The search uses it to skip the captures which lose material and to order them after the good ones.
+"""
+from ..moves.attacks import attackers_to, rook_attacks, bishop_attacks
+from ..moves.move_class import EN_PASSANT, PROMOTION
+from ..bitboard import (SQUARE_BB, EMPTY, PAWN, KNIGHT, KING, W_BISHOP, W_ROOK, W_QUEEN, B_BISHOP, B_ROOK,
+                        B_QUEEN)
+from .evaluation import PIECE_VALUES
+
+# exchange values by piece type, the king being worth more than anything it could win
+SEE_VALUES = PIECE_VALUES[:KING] + (20000,)
+
+
+def see(game_state, code):
+    """
+    Evaluate the exchange a move starts on its destination square.
+
+    Args:
+        game_state (GameState): The position, before the move.
+        code (int): The 16-bit code of the move, usually a capture.
+
+    Returns:
+        int: The material won by the side making the move at the end of the exchange, in centipawns, negative
+        when the move loses material.
+    """
+    bitboards = game_state.bitboards
+    pieces = bitboards.pieces
+    colors = bitboards.colors
+    squares = bitboards.squares
+    start = code & 63
+    end = code >> 6 & 63
+    flags = code >> 12
+
+    mover = squares[start]
+    occupied = bitboards.occupied ^ SQUARE_BB[start]
+    if flags == EN_PASSANT:
+        gain = SEE_VALUES[PAWN]
+        occupied ^= SQUARE_BB[(start & ~7) | (end & 7)]
+    else:
+        victim = squares[end]
+        gain = SEE_VALUES[victim % 6] if victim != EMPTY else 0
+    on_square = SEE_VALUES[mover % 6]  # the value of the piece standing on the square, next to be captured
+    if flags & PROMOTION:
+        promoted = SEE_VALUES[KNIGHT + (flags & 3)]
+        gain += promoted - SEE_VALUES[PAWN]
+        on_square = promoted
+
+    gains = [gain]
+    rooks = pieces[W_ROOK] | pieces[B_ROOK] | pieces[W_QUEEN] | pieces[B_QUEEN]
+    bishops = pieces[W_BISHOP] | pieces[B_BISHOP] | pieces[W_QUEEN] | pieces[B_QUEEN]
+    attackers = attackers_to(bitboards, end, occupied) & occupied
+    side = mover // 6 ^ 1
+    while True:
+        side_attackers = attackers & colors[side]
+        if not side_attackers:
+            break
+        for kind in range(PAWN, KING + 1):  # least valuable attacker
+            candidates = side_attackers & pieces[side * 6 + kind]
+            if candidates:
+                break
+        if kind == KING and attackers & colors[side ^ 1]:
+            break  # the king cannot capture on a defended square
+
+        gain = on_square - gains[-1]
+        if max(-gains[-1], gain) < 0:
+            break  # the capture would not change the outcome of the exchange
+        gains.append(gain)
+        on_square = SEE_VALUES[kind]
+        occupied ^= candidates & -candidates
+        # remove the capturing piece and add the sliders it uncovered
+        attackers = (attackers | (rook_attacks(end, occupied) & rooks) | (bishop_attacks(end, occupied) & bishops)) \
+            & occupied
+        side ^= 1
+
+    # every side may stop capturing when going on would lose: fold the gains back from the end
+    while len(gains) > 1:
+        last = gains.pop()
+        gains[-1] = -max(-gains[-1], last)
+    return gains[0]
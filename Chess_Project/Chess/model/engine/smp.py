@@ -0,0 +1,173 @@
+"""
+Lazy SMP Module for Chess Game
+
+This module runs the search on several cores. The global interpreter lock keeps threads from searching in parallel,
+so the search runs in worker processes instead, which all search the same root position and share one transposition
+table held in a multiprocessing.shared_memory block (Lazy SMP). No other communication is needed: the workers find
+the results of each other in the table, and the odd workers start one ply deeper than the even ones so that they
+explore different parts of the tree instead of repeating the same search. Writes to the table are not locked, the
+table reads an entry torn by concurrent writes as a miss.
+
+The main process only collects the results: when the first worker completes its search, a stop flag at the end of the
+shared block makes the other workers return the last iteration they completed, and the deepest result wins.
+
+Usage:
+    with LazySMP(jobs=4) as smp:
+        result = smp.search(game_state, time_limit=1.0)
+"""
+from ..moves.move_class import Move
+from ..game_state_class import GameState
+from .search import search, SearchResult, DEFAULT_TABLE_MEGABYTES
+from .transposition_table import TranspositionTable, table_bytes
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+import multiprocessing
+import time
+
+STOP_FLAG_BYTES = 8  # the stop flag follows the table in the shared block, at table_bytes(megabytes)
+STOP_POLL_INTERVAL = 0.01  # seconds between two calls to the stop callable of a search
+
+_worker_memory = None
+_worker_table = None
+_worker_stop_offset = None
+
+
+def attach_worker(name, megabytes):
+    """
+    Attach a worker process to the shared transposition table, once when the process starts.
+
+    Args:
+        name (str): The name of the shared memory block.
+        megabytes (float): The size of the table.
+    """
+    global _worker_memory, _worker_table, _worker_stop_offset
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    _worker_table = TranspositionTable(megabytes, _worker_memory.buf)
+    # not at the end of the block, whose size may be rounded up to a page when it is attached
+    _worker_stop_offset = table_bytes(megabytes)
+
+
+def smp_task(fen, index, age, depth, time_limit, multi_pv):
+    """
+    Search a position shipped to a worker process.
+
+    Args:
+        fen (str): The position in FEN.
+        index (int): The number of the worker, the odd ones starting one ply deeper.
+        age (int): The age of the table in the main process before the search.
+        depth (int): The maximum depth of the search, None for no maximum.
+        time_limit (float): The time budget in seconds, None for no limit.
+        multi_pv (int): The number of best lines to find.
+
+    Returns:
+        tuple: (move_code, score, depth, nodes, lines, stats) of the search of the worker.
+    """
+    table = _worker_table
+    table.age = age  # search() ages the table like the main process does
+    stop_flag = _worker_memory.buf[_worker_stop_offset:_worker_stop_offset + STOP_FLAG_BYTES]
+    offset = index & 1
+    result = search(GameState(fen), depth=depth + offset if depth is not None else None, time_limit=time_limit,
+                    table=table, multi_pv=multi_pv, start_depth=1 + offset, stop=lambda: stop_flag[0] != 0)
+    stop_flag.release()
+    return result.move_code, result.score, result.depth, result.nodes, result.lines, result.stats
+
+
+class LazySMP:
+    """
+    A pool of worker processes searching together through a shared transposition table.
+
+    Attributes:
+        jobs (int): The number of worker processes.
+        memory (SharedMemory): The shared block holding the table, followed by the stop flag.
+        stop_offset (int): The offset of the stop flag in the shared block.
+        table (TranspositionTable): The view of the main process on the shared table.
+        executor (ProcessPoolExecutor): The worker processes, kept from one search to the next.
+
+    Methods:
+        search(game_state, depth, time_limit, multi_pv, stop): Searches a position with all the workers.
+        close(): Stops the workers and frees the shared memory.
+    """
+
+    def __init__(self, jobs, megabytes=DEFAULT_TABLE_MEGABYTES):
+        """
+        Allocates the shared table and starts the worker processes.
+
+        Args:
+            jobs (int): The number of worker processes, at least 1.
+            megabytes (float): The size of the shared table.
+        """
+        self.jobs = jobs
+        self.stop_offset = table_bytes(megabytes)
+        self.memory = shared_memory.SharedMemory(create=True, size=self.stop_offset + STOP_FLAG_BYTES)
+        self.table = TranspositionTable(megabytes, self.memory.buf)
+        self.table.clear()
+        # the workers are started by the first search, which may run in a thread of the game: forking a process
+        # with several threads can deadlock the child, spawned workers start from a fresh interpreter instead
+        self.executor = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn"),
+                                            initializer=attach_worker, initargs=(self.memory.name, megabytes))
+
+    def search(self, game_state, depth=None, time_limit=None, multi_pv=1, stop=None):
+        """
+        Find the best move of the side to move with all the workers.
+
+        Args:
+            game_state (GameState): The position to search, left unchanged.
+            depth (int): The maximum depth of the first worker, None for no maximum.
+            time_limit (float): The time budget in seconds, None for no limit.
+            multi_pv (int): The number of best lines to return.
+            stop (callable): Returns True when the search must stop, None if it never must; polled every
+                STOP_POLL_INTERVAL seconds and relayed to the workers through the stop flag.
+
+        Returns:
+            SearchResult: The result of the deepest search, with the nodes of all the workers.
+
+        Raises:
+            Exception: The error of the first worker, if all of them failed; the failures of some of the workers
+                are only counted in the failed_workers statistic.
+        """
+        start = time.perf_counter()
+        fen = game_state.to_fen()
+        stop_flag = self.memory.buf[self.stop_offset:self.stop_offset + STOP_FLAG_BYTES]
+        stop_flag[0] = 0
+        age = self.table.age
+        self.table.new_search()
+        futures = [self.executor.submit(smp_task, fen, index, age, depth, time_limit, multi_pv)
+                   for index in range(self.jobs)]
+        while not wait(futures[:1], STOP_POLL_INTERVAL if stop is not None else None).done:
+            if stop():
+                break
+        stop_flag[0] = 1  # the first worker is done or the search is stopped, the others return their last iteration
+        stop_flag.release()
+        results = []
+        errors = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:  # a failed worker, the others may still have a move
+                errors.append(error)
+        if not results:
+            raise errors[0]
+
+        nodes = sum(result[3] for result in results)
+        # the deepest result with a move, the first worker winning ties
+        move_code, score, reached, _, lines, stats = max(
+            (result for result in results if result[0]), key=lambda result: result[2], default=results[0])
+        best_move = Move.from_code(move_code, game_state.board) if move_code else None
+        stats = dict(stats, jobs=self.jobs, worker_depths=[result[2] for result in results],
+                     failed_workers=len(errors))
+        return SearchResult(best_move, move_code, score, reached, nodes, time.perf_counter() - start, stats, lines)
+
+    def close(self):
+        """
+        Stops the workers and frees the shared memory.
+        """
+        self.executor.shutdown()
+        self.table.words.release()
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,243 @@
+"""
+Transposition Table Module for Chess Game
+
+This module contains the transposition table of the engine: a fixed-size hash table, allocated once, which remembers
+the result of the positions already searched, keyed on their Zobrist key. A position reached again by another move
+order, or searched again by the next iteration, then costs a lookup instead of a subtree.
+
+Every entry takes two 64-bit words of one preallocated array('Q'): the Zobrist key XORed with the data word, and the
+data word packing
+
+    bits  0-15  the best move code (0 when unknown)
+    bits 16-36  the score plus SCORE_OFFSET
+    bits 37-44  the depth of the search which produced the score
+    bits 45-46  the bound type (EXACT, LOWER or UPPER)
+    bits 47-54  the age, the number of the search which stored the entry
+
+Entries come in buckets of two: the first one is depth-preferred, it keeps the deepest result unless it was stored
+by an older search, and the second one always takes the newest result otherwise.
+
+The table can also live in a buffer it does not own, such as the memory of a multiprocessing.shared_memory block,
+for the processes of a parallel search to share it without locks. The XOR of the key with the data makes that safe:
+an entry torn by two processes writing it at the same time no longer matches its key, so it reads as a miss instead
+of returning the data of another position.
+"""
+from array import array
+
+EXACT, LOWER, UPPER = 1, 2, 3  # the score is exact, a lower bound (fail high) or an upper bound (fail low)
+
+SCORE_OFFSET = 1 << 20
+SCORE_SHIFT = 16
+DEPTH_SHIFT = 37
+BOUND_SHIFT = 45
+AGE_SHIFT = 47
+MOVE_MASK = 0xFFFF
+SCORE_MASK = (1 << 21) - 1
+DEPTH_MASK = 0xFF
+BOUND_MASK = 3
+AGE_MASK = 0xFF
+
+ENTRY_WORDS = 2
+BUCKET_WORDS = 2 * ENTRY_WORDS
+BUCKET_BYTES = BUCKET_WORDS * 8
+
+
+def table_bytes(megabytes):
+    """
+    Returns the size of the entries of a table, the memory budget rounded down to a power of two buckets.
+
+    Args:
+        megabytes (float): The memory budget.
+
+    Returns:
+        int: The size of the table, in bytes.
+    """
+    buckets = max(1, int(megabytes * 1024 * 1024) // BUCKET_BYTES)
+    return (1 << (buckets.bit_length() - 1)) * BUCKET_BYTES
+
+
+def pack_entry(move, score, depth, bound, age):
+    """
+    Pack the fields of an entry into its data word.
+
+    Args:
+        move (int): The best move code, 0 when unknown.
+        score (int): The score, between -SCORE_OFFSET and SCORE_OFFSET.
+        depth (int): The depth of the search, between 0 and 255.
+        bound (int): EXACT, LOWER or UPPER.
+        age (int): The age of the entry, between 0 and 255.
+
+    Returns:
+        int: The data word.
+    """
+    return (move | (score + SCORE_OFFSET) << SCORE_SHIFT | depth << DEPTH_SHIFT | bound << BOUND_SHIFT
+            | age << AGE_SHIFT)
+
+
+def entry_move(data):
+    """
+    Returns the best move code of a data word, 0 when unknown.
+    """
+    return data & MOVE_MASK
+
+
+def entry_score(data):
+    """
+    Returns the score of a data word.
+    """
+    return (data >> SCORE_SHIFT & SCORE_MASK) - SCORE_OFFSET
+
+
+def entry_depth(data):
+    """
+    Returns the depth of a data word.
+    """
+    return data >> DEPTH_SHIFT & DEPTH_MASK
+
+
+def entry_bound(data):
+    """
+    Returns the bound type of a data word.
+    """
+    return data >> BOUND_SHIFT & BOUND_MASK
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table in a preallocated array of 64-bit words.
+
+    Attributes:
+        buckets (int): The number of buckets, a power of two.
+        words (array): The entries, two words each, two entries per bucket; a memoryview of 64-bit words when the
+            table lives in an external buffer.
+        age (int): The number of the current search, stored in the new entries.
+        probes (int): The number of lookups.
+        hits (int): The lookups which found the position.
+        collisions (int): The lookups which found the bucket holding other positions only.
+        stores (int): The number of entries written.
+        overwrites (int): The entries written over another position.
+
+    Methods:
+        new_search(): Ages the entries of the previous searches.
+        clear(): Empties the table and resets the statistics.
+        probe(key): Returns the data word of a position, 0 if it is not in the table.
+        store(key, move, score, depth, bound): Stores the result of a search.
+        hit_rate(): Returns the fraction of the lookups which found the position.
+        usage(): Returns the fraction of the entries written by the current search.
+    """
+
+    def __init__(self, megabytes=16, buffer=None):
+        """
+        Allocates the table.
+
+        Args:
+            megabytes (float): The memory budget; the number of buckets is rounded down to a power of two.
+            buffer (buffer): A writable buffer of at least table_bytes(megabytes) bytes to keep the entries in, for
+                instance the memory of a shared memory block, None to allocate them. Its content is kept.
+        """
+        size = table_bytes(megabytes)
+        self.buckets = size // BUCKET_BYTES
+        if buffer is None:
+            self.words = array('Q', bytes(size))
+        else:
+            self.words = memoryview(buffer).cast('B')[:size].cast('Q')
+        self.age = 0
+        self.probes = 0
+        self.hits = 0
+        self.collisions = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_search(self):
+        """
+        Ages the entries of the previous searches, which the depth-preferred slots no longer protect.
+        """
+        self.age = (self.age + 1) & AGE_MASK
+
+    def clear(self):
+        """
+        Empties the table and resets the statistics.
+        """
+        self.words[:] = array('Q', bytes(self.buckets * BUCKET_BYTES))
+        self.age = 0
+        self.probes = self.hits = self.collisions = self.stores = self.overwrites = 0
+
+    def probe(self, key):
+        """
+        Looks up a position.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            int: The data word of the position, 0 if it is not in the table.
+        """
+        self.probes += 1
+        words = self.words
+        index = (key & (self.buckets - 1)) * BUCKET_WORDS
+        data = words[index + 1]
+        if data and words[index] ^ data == key:
+            self.hits += 1
+            return data
+        other = words[index + 3]
+        if other and words[index + 2] ^ other == key:
+            self.hits += 1
+            return other
+        if data or other:
+            self.collisions += 1
+        return 0
+
+    def store(self, key, move, score, depth, bound):
+        """
+        Stores the result of a search.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            move (int): The best move code, 0 when unknown.
+            score (int): The score.
+            depth (int): The depth of the search.
+            bound (int): EXACT, LOWER or UPPER.
+
+        The depth-preferred entry is replaced by a result at least as deep, by any result of the same position, or
+        when it was stored by an older search; the always-replace entry takes the result otherwise. A result without
+        a move keeps the move already known for the position.
+        """
+        words = self.words
+        index = (key & (self.buckets - 1)) * BUCKET_WORDS
+        data = words[index + 1]
+        if data and words[index] ^ data != key and data >> AGE_SHIFT == self.age \
+                and depth < data >> DEPTH_SHIFT & DEPTH_MASK:
+            index += ENTRY_WORDS
+            data = words[index + 1]
+        if data:
+            if words[index] ^ data == key:
+                if not move:
+                    move = data & MOVE_MASK
+            else:
+                self.overwrites += 1
+        self.stores += 1
+        data = pack_entry(move, score, min(depth, DEPTH_MASK), bound, self.age)
+        words[index] = key ^ data
+        words[index + 1] = data
+
+    def hit_rate(self):
+        """
+        Returns the fraction of the lookups which found the position.
+
+        Returns:
+            float: The hit rate, 0 before the first lookup.
+        """
+        return self.hits / self.probes if self.probes else 0.0
+
+    def usage(self):
+        """
+        Returns the fraction of the entries written by the current search, sampling the first thousand buckets.
+
+        Returns:
+            float: The fraction of the sampled entries of the current age.
+        """
+        words = self.words
+        sample = min(self.buckets, 1000)
+        used = sum(1 for index in range(1, sample * BUCKET_WORDS, ENTRY_WORDS)
+                   if words[index] and words[index] >> AGE_SHIFT == self.age)
+        return used / (sample * 2)
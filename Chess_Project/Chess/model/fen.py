@@ -0,0 +1,157 @@
+"""
+FEN Module for Chess Game
+
+This module reads and writes positions in the Forsyth-Edwards Notation, the one line text format used by chess
+tools to exchange positions (e.g. the perft reference positions). The halfmove clock is not tracked by the game
+state, it is read and ignored, and written as 0.
+"""
+from .moves.castle_moves import WKS, WQS, BKS, BQS
+from .bitboard import EMPTY, PIECE_CODES
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+CASTLING_LETTERS = (("K", WKS), ("Q", WQS), ("k", BKS), ("q", BQS))
+
+# the (row, col) and piece code of the king and the rook which must stand on their home squares for each right
+CASTLING_HOMES = {
+    WKS: (((7, 4), "wK"), ((7, 7), "wR")),
+    WQS: (((7, 4), "wK"), ((7, 0), "wR")),
+    BKS: (((0, 4), "bK"), ((0, 7), "bR")),
+    BQS: (((0, 4), "bK"), ((0, 0), "bR")),
+}
+
+
+def fen_letter_to_code(letter):
+    """
+    Convert a FEN piece letter to the piece code of the board.
+
+    Args:
+        letter (str): The FEN letter, uppercase for white (e.g. 'N' or 'p').
+
+    Returns:
+        str: The piece code (e.g. 'wN' or 'bp').
+    """
+    color = "w" if letter.isupper() else "b"
+    return color + ("p" if letter in "Pp" else letter.upper())
+
+
+def code_to_fen_letter(code):
+    """
+    Convert a piece code of the board to its FEN letter.
+
+    Args:
+        code (str): The piece code (e.g. 'wN' or 'bp').
+
+    Returns:
+        str: The FEN letter, uppercase for white.
+    """
+    letter = code[1].upper()
+    return letter if code[0] == "w" else letter.lower()
+
+
+def parse_fen(fen):
+    """
+    Parse a FEN string.
+
+    Args:
+        fen (str): The position in FEN; the halfmove clock and fullmove number fields are optional.
+
+    Returns:
+        tuple: (board, white_to_move, castling_rights, en_passant_square, fullmove_number), board being the 8x8 list
+        of piece codes, castling_rights the castle_moves bitmask, without the rights whose king or rook is not on its
+        home square, and en_passant_square -1 when there is none.
+
+    Raises:
+        ValueError: If the string is not a valid FEN.
+    """
+    fields = fen.split()
+    if len(fields) < 4:
+        raise ValueError(f"invalid FEN {fen!r}: expected at least 4 fields")
+    placement, side, castling, en_passant = fields[:4]
+
+    board = []
+    for rank in placement.split("/"):
+        row = []
+        for letter in rank:
+            if letter.isdigit():
+                row.extend(["--"] * int(letter))
+            elif letter in "PNBRQKpnbrqk":
+                row.append(fen_letter_to_code(letter))
+            else:
+                raise ValueError(f"invalid FEN {fen!r}: unknown piece {letter!r}")
+        if len(row) != 8:
+            raise ValueError(f"invalid FEN {fen!r}: rank {rank!r} does not have 8 squares")
+        board.append(row)
+    if len(board) != 8:
+        raise ValueError(f"invalid FEN {fen!r}: expected 8 ranks")
+    for king in ("wK", "bK"):
+        count = sum(row.count(king) for row in board)
+        if count != 1:
+            color = "white" if king[0] == "w" else "black"
+            raise ValueError(f"invalid FEN {fen!r}: expected one {color} king, found {count}")
+    for row in (0, 7):
+        if "wp" in board[row] or "bp" in board[row]:
+            raise ValueError(f"invalid FEN {fen!r}: pawn on rank {8 - row}")
+
+    if side not in ("w", "b"):
+        raise ValueError(f"invalid FEN {fen!r}: side to move must be 'w' or 'b'")
+
+    castling_rights = 0
+    if castling != "-":
+        for letter in castling:
+            rights = dict(CASTLING_LETTERS).get(letter)
+            if rights is None:
+                raise ValueError(f"invalid FEN {fen!r}: unknown castling right {letter!r}")
+            # a right whose king or rook left its home square is dropped, the move generator trusts the bitmask
+            if all(board[row][col] == piece for (row, col), piece in CASTLING_HOMES[rights]):
+                castling_rights |= rights
+
+    en_passant_square = -1
+    if en_passant != "-":
+        if len(en_passant) != 2 or en_passant[0] not in "abcdefgh" or en_passant[1] not in "36":
+            raise ValueError(f"invalid FEN {fen!r}: bad en passant square {en_passant!r}")
+        row, col = 8 - int(en_passant[1]), "abcdefgh".index(en_passant[0])
+        # the pawn which just moved two squares stands in front of the square, which it crossed from behind
+        forward, pawn = (1, "bp") if side == "w" else (-1, "wp")
+        if row != (2 if side == "w" else 5) or board[row][col] != "--" or board[row - forward][col] != "--" \
+                or board[row + forward][col] != pawn:
+            raise ValueError(f"invalid FEN {fen!r}: no pawn can be captured en passant on {en_passant!r}")
+        en_passant_square = row * 8 + col
+
+    fullmove_number = int(fields[5]) if len(fields) > 5 and fields[5].isdigit() else 1
+    return board, side == "w", castling_rights, en_passant_square, fullmove_number
+
+
+def to_fen(game_state):
+    """
+    Write the position of a game state in FEN.
+
+    Args:
+        game_state (GameState): The game state to write.
+
+    Returns:
+        str: The position in FEN.
+    """
+    squares = game_state.bitboards.squares
+    ranks = []
+    for row in range(8):
+        rank = ""
+        empty = 0
+        for col in range(8):
+            piece = squares[row * 8 + col]
+            if piece == EMPTY:
+                empty += 1
+                continue
+            if empty:
+                rank += str(empty)
+                empty = 0
+            rank += code_to_fen_letter(PIECE_CODES[piece])
+        if empty:
+            rank += str(empty)
+        ranks.append(rank)
+
+    castling = "".join(letter for letter, rights in CASTLING_LETTERS if game_state.castling_rights & rights) or "-"
+    square = game_state.en_passant_square
+    en_passant = "abcdefgh"[square & 7] + str(8 - (square >> 3)) if square >= 0 else "-"
+    side = "w" if game_state.white_to_move else "b"
+    return f"{'/'.join(ranks)} {side} {castling} {en_passant} 0 {game_state.fullmove_number}"
@@ -1,7 +1,12 @@
-from .moves.castle_moves import CastleRights
-from .moves.move_class import Move
-import copy as c
-import random
+from .moves.castle_moves import CastleRights, ALL_CASTLING_RIGHTS, CASTLING_RIGHTS_MASK
+from .moves import castle_moves, legal_moves, pieces_moves
+from .moves.move_class import Move, NULL_MOVE, DOUBLE_PAWN_PUSH, KING_CASTLE, QUEEN_CASTLE, EN_PASSANT, PROMOTION
+from .moves.attacks import is_square_attacked
+from .fen import parse_fen, to_fen
+from .zobrist import PIECE_KEYS, SIDE_KEY, CASTLING_KEYS, compute_key, en_passant_key
+from .engine.evaluation import PIECE_SQUARE_SCORES, PIECE_PHASES, compute_scores
+from .bitboard import Bitboards, START_BOARD, EMPTY, WHITE, BLACK, PAWN, KNIGHT, ROOK, KING
+from array import array
 
 
 class GameState:
@@ -10,7 +15,8 @@ class GameState:
     and game-specific attributes such as castling rights, en passant possibilities, and check/mate conditions.
 
     Attributes:
-        - board (list): A 2D list representing the current chessboard configuration.
+        - bitboards (Bitboards): The bitboard representation of the position, the source of truth for the board.
+        - board (list): A read-only 2D list of piece codes mirroring the bitboards, used by the renderers.
         - move_functions (dict): A dictionary mapping piece types to their respective move generation functions.
         - white_to_move (bool): True if it's currently white's turn, False if black's turn.
         - move_log (list): A list to store the history of moves made during the game.
@@ -18,13 +24,34 @@ class GameState:
         - black_king_location (tuple): The current location of the black king on the board.
         - check_mate (bool): True if the current player is in checkmate, False otherwise.
         - stale_mate (bool): True if the game is in a stalemate position, False otherwise.
+        - en_passant_square (int): The square index where en passant capture is possible, -1 if there is none.
         - en_passant_possible (tuple): Coordinates for the square where en passant capture is possible.
-        - current_castling_rights (CastleRights): An instance of the CastleRights class representing current castling rights.
-        - CastleRights_log (list): A list to store the history of castling rights during the game.
+        - castling_rights (int): The castling rights bits (castle_moves.WKS, WQS, BKS, BQS).
+        - current_castling_rights (CastleRights): A CastleRights copy of the current castling rights.
+        - move_stack (list): The undo records of the moves made, (code, captured piece, castling rights, en passant,
+          Zobrist key, piece-square score, phase).
+        - zobrist_key (int): The 64-bit Zobrist key of the position, updated incrementally by every move.
+        - piece_square_score (int): The packed midgame and endgame material and piece-square score of the position,
+          from white's point of view, updated incrementally by every move.
+        - phase (int): The game phase of the position, the phase weights of the pieces on the board.
+        - debug (bool): True to check the incremental Zobrist key and evaluation totals against a full recompute after
+          every move.
+        - start_ply (int): The number of plies played before the initial position, read from the FEN.
+        - fullmove_number (int): The FEN fullmove number of the position.
+        - valid_moves_cache (tuple): The result of the last move generation of get_valid_moves, (Zobrist key, moves,
+          check mate, stale mate), None before the first one.
+        - move_generations (int): Class attribute, the number of times get_valid_moves generated the moves of a
+          position, over all the game states.
 
     Methods:
         - make_move(move): Executes the given chess move on the board, updating the game state.
         - undo_move(): Undoes the last move made in the chess game, reverting the board to its previous state.
+        - push_move(code): Executes a 16-bit move code, without touching the move log.
+        - pop_move(): Undoes the last move code executed.
+        - push_null_move(): Passes the turn to the opponent, for the null move search.
+        - generate_moves(moves): Fills a move buffer with the codes of the legal moves.
+        - generate_captures(moves): Fills a move buffer with the codes of the legal captures and promotions.
+        - to_fen(): Returns the position in FEN.
         - get_all_possible_moves(): Generates all possible moves for the current player without considering checks.
         - get_valid_moves(): Generates all valid moves considering checks, checkmate, and stalemate conditions.
         - in_check(): Checks if the current player is in check.
@@ -39,37 +66,97 @@ class GameState:
         - get_bishop_moves(r, c, moves): Generates all possible moves for a bishop at the given position (r, c).
         - get_queen_moves(r, c, moves): Generates all possible moves for a queen at the given position (r, c).
         - get_king_moves(r, c, moves): Generates all possible moves for a king at the given position (r, c).
-        - random_move(valid_moves): Generates a random move from the list of valid moves.
 
     """
-    def __init__(self):
+    move_generations = 0
+
+    def __init__(self, fen=None, debug=False):
         """
             Initialize the game state.
-        """
-        self.board = [
-            ["bR", "bN", "bB", "bQ", "bK", "bB", "bN", "bR"],
-            ["bp", "bp", "bp", "bp", "bp", "bp", "bp", "bp"],
-            ["--", "--", "--", "--", "--", "--", "--", "--"],
-            ["--", "--", "--", "--", "--", "--", "--", "--"],
-            ["--", "--", "--", "--", "--", "--", "--", "--"],
-            ["--", "--", "--", "--", "--", "--", "--", "--"],
-            ["wp", "wp", "wp", "wp", "wp", "wp", "wp", "wp"],
-            ["wR", "wN", "wB", "wQ", "wK", "wB", "wN", "wR"]
-        ]
+
+            Args:
+                fen (str): The initial position in FEN, the standard starting position when None.
+                debug (bool): True to check the incremental Zobrist key and evaluation totals against a full recompute
+                    after every move and take back, which is slow but catches any update missing in push_move or
+                    pop_move.
+        """
+        if fen is None:
+            board, white_to_move, castling_rights, en_passant_square, fullmove_number = (
+                START_BOARD, True, ALL_CASTLING_RIGHTS, -1, 1)
+        else:
+            board, white_to_move, castling_rights, en_passant_square, fullmove_number = parse_fen(fen)
+        self.bitboards = Bitboards(board)
 
         self.move_functions = {'p': self.get_pawn_moves, 'R': self.get_rook_moves, 'N': self.get_knight_moves,
                                'B': self.get_bishop_moves, 'Q': self.get_queen_moves, 'K': self.get_king_moves}
-        self.white_to_move = True
+        self.white_to_move = white_to_move
         self.move_log = []
-        self.white_king_location = (7, 4)
-        self.black_king_location = (0, 4)
         self.check_mate = False
         self.stale_mate = False
-        self.en_passant_possible = ()  # coordinates for the square where en-passant capture is possible
+        self.en_passant_square = en_passant_square  # square index where en-passant capture is possible
+
+        self.castling_rights = castling_rights
+        self.move_stack = []
+        self.start_ply = (fullmove_number - 1) * 2 + (0 if white_to_move else 1)
+
+        self.debug = debug
+        self.zobrist_key = compute_key(self)
+        self.piece_square_score, self.phase = compute_scores(self.bitboards)
+        self.valid_moves_cache = None
+
+    @property
+    def board(self):
+        """
+            The 2D list of piece codes mirroring the bitboards (e.g. board[7][4] == "wK").
+
+            The list is kept in sync by the bitboards on every move and must not be modified directly.
+        """
+        return self.bitboards.board
+
+    @property
+    def white_king_location(self):
+        """
+            The (row, col) location of the white king, read from the white king bitboard.
+        """
+        return divmod(self.bitboards.king_square(WHITE), 8)
+
+    @property
+    def black_king_location(self):
+        """
+            The (row, col) location of the black king, read from the black king bitboard.
+        """
+        return divmod(self.bitboards.king_square(BLACK), 8)
 
-        self.current_castling_rights = CastleRights(True, True, True, True)
-        self.CastleRights_log = [CastleRights(self.current_castling_rights.wks, self.current_castling_rights.bks,
-                                              self.current_castling_rights.wqs, self.current_castling_rights.bqs)]
+    @property
+    def fullmove_number(self):
+        """
+            The FEN fullmove number, starting at 1 and incremented after every black move.
+        """
+        return (self.start_ply + len(self.move_stack)) // 2 + 1
+
+    @property
+    def en_passant_possible(self):
+        """
+            The (row, col) coordinates of the en passant square, () when no en passant capture is possible.
+        """
+        return divmod(self.en_passant_square, 8) if self.en_passant_square >= 0 else ()
+
+    @en_passant_possible.setter
+    def en_passant_possible(self, square):
+        self.en_passant_square = square[0] * 8 + square[1] if square else -1
+        self.zobrist_key = compute_key(self)
+
+    @property
+    def current_castling_rights(self):
+        """
+            A CastleRights copy of the castling rights bits; changing it has no effect, assign it back instead.
+        """
+        return CastleRights.from_bits(self.castling_rights)
+
+    @current_castling_rights.setter
+    def current_castling_rights(self, rights):
+        self.castling_rights = rights.to_bits()
+        self.zobrist_key = compute_key(self)
 
     def make_move(self, move):
         """
@@ -96,7 +183,7 @@ class GameState:
             - Updates the move log.
 
         - Pawn Promotion:
-            - If the move involves pawn promotion, replaces the pawn with a queen.
+            - If the move involves pawn promotion, replaces the pawn with the promoted piece.
 
         - En-passant:
             - If the move is an en-passant capture, removes the captured pawn.
@@ -105,7 +192,7 @@ class GameState:
             - If the move involves castling, adjusts the rook position accordingly.
 
         - Update King Positions:
-            - Updates the current positions of kings if they are moved.
+            - The king locations follow the king bitboards, so they are updated with the moved pieces.
 
         - Update En-passant Possibility:
             - Sets or clears the possibility of en-passant capture.
@@ -116,84 +203,202 @@ class GameState:
         - Update Turn:
             - Changes the player turn to the next player.
         """
-        self.board[move.start_row][move.start_col] = "--"
-        self.board[move.end_row][move.end_col] = move.piece_moved
+        self.push_move(move.code)
         self.move_log.append(move)  # for undo / history of the game
-        self.white_to_move = not self.white_to_move  # swap players
 
-        if move.piece_moved == 'wK':
-            self.white_king_location = (move.end_row, move.end_col)
-        elif move.piece_moved == 'bK':
-            self.black_king_location = (move.end_row, move.end_col)
+    def undo_move(self):
+        """
+            Undo the last move made in the chess game.
 
-        if move.is_pawn_promotion:
-            self.board[move.end_row][move.end_col] = move.piece_moved[0] + 'Q'  # iau culoarea si pun o regina la moment
+            Returns:
+                None
 
-        if move.is_en_passant_move:
-            self.board[move.start_row][move.end_col] = "--"
+            This method reverses the effects of the last move by restoring the board to its previous state.
+            It updates piece positions, player turns, en-passant possibilities, and castle rights, which are all
+            restored from the move stack.
 
-        if move.piece_moved[1] == 'p' and abs(move.start_row - move.end_row) == 2:
-            self.en_passant_possible = ((move.start_row + move.end_row)//2, move.start_col)
-        else:
-            self.en_passant_possible = ()
+            - Restore Board:
+                - Restores the board to its previous state by reversing the effects of the last move.
+        """
+        if len(self.move_stack) != 0:
+            if len(self.move_log) != 0:
+                self.move_log.pop()
+            self.pop_move()
 
-        if move.is_castle_move:
-            if move.end_col - move.start_col == 2:
-                self.board[move.end_row][move.end_col-1] = self.board[move.end_row][move.end_col+1]
-                self.board[move.end_row][move.end_col+1] = "--"
-            else:
-                self.board[move.end_row][move.end_col+1] = self.board[move.end_row][move.end_col-2]
-                self.board[move.end_row][move.end_col-2] = "--"
+    def push_move(self, code):
+        """
+            Execute a 16-bit move code on the board.
 
-        self.update_castle_rights(move)
-        self.CastleRights_log.append(CastleRights(self.current_castling_rights.wks, self.current_castling_rights.bks,
-                                                  self.current_castling_rights.wqs, self.current_castling_rights.bqs))
+            Args:
+                code (int): The code of a legal move, as generated by generate_moves.
 
-    def undo_move(self):
+            Returns:
+                None
+
+            This is the make move of the engine: it only updates the bitboards and the state needed to take the move
+            back, and saves that state on the move stack. Nothing is allocated besides the undo record, the move log
+            is left to make_move.
+
+            The Zobrist key is updated in O(1) by XORing out the features the move removes and XORing in the ones
+            it adds, and the evaluation totals by subtracting the scores of the pieces leaving a square and adding
+            the scores of the pieces arriving on one.
+        """
+        bitboards = self.bitboards
+        squares = bitboards.squares
+        start = code & 63
+        end = code >> 6 & 63
+        flags = code >> 12
+        piece = squares[start]
+        key = self.zobrist_key ^ en_passant_key(self) ^ CASTLING_KEYS[self.castling_rights]
+        values = PIECE_SQUARE_SCORES[piece]
+        score = self.piece_square_score + values[end] - values[start]
+        phase = self.phase
+
+        if flags == EN_PASSANT:
+            captured_square = (start & ~7) | (end & 7)
+            captured = squares[captured_square]
+            bitboards.remove_piece(captured, captured_square)
+            key ^= PIECE_KEYS[captured][captured_square]
+            score -= PIECE_SQUARE_SCORES[captured][captured_square]
+            phase -= PIECE_PHASES[captured]
+        else:
+            captured = squares[end]
+            if captured != EMPTY:
+                bitboards.remove_piece(captured, end)
+                key ^= PIECE_KEYS[captured][end]
+                score -= PIECE_SQUARE_SCORES[captured][end]
+                phase -= PIECE_PHASES[captured]
+        self.move_stack.append((code, captured, self.castling_rights, self.en_passant_square, self.zobrist_key,
+                                self.piece_square_score, self.phase))
+        bitboards.move_piece(piece, start, end)
+        key ^= PIECE_KEYS[piece][start] ^ PIECE_KEYS[piece][end]
+
+        if flags & PROMOTION:
+            promoted = piece - PAWN + KNIGHT + (flags & 3)
+            bitboards.remove_piece(piece, end)
+            bitboards.put_piece(promoted, end)
+            key ^= PIECE_KEYS[piece][end] ^ PIECE_KEYS[promoted][end]
+            score += PIECE_SQUARE_SCORES[promoted][end] - values[end]
+            phase += PIECE_PHASES[promoted]
+        elif flags == KING_CASTLE:
+            rook = piece - KING + ROOK
+            bitboards.move_piece(rook, end + 1, end - 1)
+            key ^= PIECE_KEYS[rook][end + 1] ^ PIECE_KEYS[rook][end - 1]
+            score += PIECE_SQUARE_SCORES[rook][end - 1] - PIECE_SQUARE_SCORES[rook][end + 1]
+        elif flags == QUEEN_CASTLE:
+            rook = piece - KING + ROOK
+            bitboards.move_piece(rook, end - 2, end + 1)
+            key ^= PIECE_KEYS[rook][end - 2] ^ PIECE_KEYS[rook][end + 1]
+            score += PIECE_SQUARE_SCORES[rook][end + 1] - PIECE_SQUARE_SCORES[rook][end - 2]
+        self.piece_square_score = score
+        self.phase = phase
+
+        self.en_passant_square = (start + end) >> 1 if flags == DOUBLE_PAWN_PUSH else -1
+        self.castling_rights &= CASTLING_RIGHTS_MASK[start] & CASTLING_RIGHTS_MASK[end]
+        self.white_to_move = not self.white_to_move  # swap players
+        self.zobrist_key = key ^ SIDE_KEY ^ CASTLING_KEYS[self.castling_rights] ^ en_passant_key(self)
+
+        if self.debug:
+            self.check_zobrist_key()
+            self.check_evaluation_totals()
+
+    def pop_move(self):
         """
-            Undo the last move made in the chess game.
+            Undo the last move code executed by push_move.
 
             Returns:
                 None
 
             Raises:
                 IndexError: If there are no moves to undo.
+        """
+        (code, captured, self.castling_rights, self.en_passant_square, self.zobrist_key, self.piece_square_score,
+         self.phase) = self.move_stack.pop()
+        if code == NULL_MOVE:
+            self.white_to_move = not self.white_to_move
+            return
+        bitboards = self.bitboards
+        start = code & 63
+        end = code >> 6 & 63
+        flags = code >> 12
+        piece = bitboards.squares[end]
+
+        if flags & PROMOTION:
+            bitboards.remove_piece(piece, end)
+            piece = piece - KNIGHT - (flags & 3) + PAWN
+            bitboards.put_piece(piece, end)
+        elif flags == KING_CASTLE:
+            bitboards.move_piece(piece - KING + ROOK, end - 1, end + 1)
+        elif flags == QUEEN_CASTLE:
+            bitboards.move_piece(piece - KING + ROOK, end + 1, end - 2)
+        bitboards.move_piece(piece, end, start)
+
+        if flags == EN_PASSANT:
+            bitboards.put_piece(captured, (start & ~7) | (end & 7))
+        elif captured != EMPTY:
+            bitboards.put_piece(captured, end)
+        self.white_to_move = not self.white_to_move
 
-            This method reverses the effects of the last move by restoring the board to its previous state.
-            It updates piece positions, player turns, en-passant possibilities, and castle rights.
+        if self.debug:
+            self.check_zobrist_key()
+            self.check_evaluation_totals()
 
-            - Restore Board:
-                - Restores the board to its previous state by reversing the effects of the last move.
+    def push_null_move(self):
         """
-        if len(self.move_log) != 0:
-            move = self.move_log.pop()
-            self.board[move.start_row][move.start_col] = move.piece_moved
-            self.board[move.end_row][move.end_col] = move.piece_captured
-            self.white_to_move = not self.white_to_move
-            if move.piece_moved == 'wK':
-                self.white_king_location = (move.start_row, move.start_col)
-            elif move.piece_moved == 'bK':
-                self.black_king_location = (move.start_row, move.start_col)
-
-            if move.is_en_passant_move:
-                self.board[move.end_row][move.end_col] = "--"
-                self.board[move.start_row][move.end_col] = move.piece_captured
-                self.en_passant_possible = (move.end_row, move.end_col)
-
-            if move.piece_moved[1] == 'p' and abs(move.start_row - move.end_row) == 2:
-                self.en_passant_possible = ()
-
-            self.CastleRights_log.pop()  # remove the last castle rights from the log
-            new_rights = c.deepcopy(self.CastleRights_log[-1])
-            self.current_castling_rights = new_rights
-
-            if move.is_castle_move:
-                if move.end_col - move.start_col == 2:  # kingside
-                    self.board[move.end_row][move.end_col + 1] = self.board[move.end_row][move.end_col - 1]
-                    self.board[move.end_row][move.end_col - 1] = "--"
-                else:  # queenside
-                    self.board[move.end_row][move.end_col - 2] = self.board[move.end_row][move.end_col + 1]
-                    self.board[move.end_row][move.end_col + 1] = "--"
+            Pass the turn to the opponent without moving, which is illegal in chess but lets the search measure how
+            strong a position is when the opponent may move twice. Taken back by pop_move like any move.
+
+            Returns:
+                None
+        """
+        self.move_stack.append((NULL_MOVE, EMPTY, self.castling_rights, self.en_passant_square, self.zobrist_key,
+                                self.piece_square_score, self.phase))
+        key = self.zobrist_key ^ en_passant_key(self) ^ SIDE_KEY
+        self.en_passant_square = -1
+        self.white_to_move = not self.white_to_move
+        self.zobrist_key = key
+
+        if self.debug:
+            self.check_zobrist_key()
+
+    def check_zobrist_key(self):
+        """
+            Check the incremental Zobrist key against a full recompute.
+
+            Returns:
+                None
+
+            Raises:
+                RuntimeError: If the incremental key does not match the key computed from scratch.
+        """
+        expected = compute_key(self)
+        if self.zobrist_key != expected:
+            raise RuntimeError(f"Zobrist key mismatch after {len(self.move_stack)} moves: "
+                               f"{self.zobrist_key:016x} instead of {expected:016x}")
+
+    def check_evaluation_totals(self):
+        """
+            Check the incremental piece-square score and phase against a full recompute.
+
+            Returns:
+                None
+
+            Raises:
+                RuntimeError: If the incremental totals do not match the totals computed from scratch.
+        """
+        expected = compute_scores(self.bitboards)
+        if (self.piece_square_score, self.phase) != expected:
+            raise RuntimeError(f"Evaluation totals mismatch after {len(self.move_stack)} moves: "
+                               f"{(self.piece_square_score, self.phase)} instead of {expected}")
+
+    def to_fen(self):
+        """
+            Get the position in FEN.
+
+            Returns:
+                str: The position in Forsyth-Edwards Notation.
+        """
+        return to_fen(self)
 
     def get_all_possible_moves(self):
         """
@@ -207,13 +412,14 @@ class GameState:
             and type of the piece on each square, and calls the corresponding move function.
         """
         moves = []
-        for row in range(len(self.board)):
-            for col in range(len(self.board[row])):
-                turn = self.board[row][col][0]  # get the color of the piece - w or b
-                if (turn == 'w' and self.white_to_move) or (
-                        turn == 'b' and not self.white_to_move):
-                    piece = self.board[row][col][1]
-                    self.move_functions[piece](row, col, moves)  # call the right move function based on piece type
+        bitboards = self.bitboards
+        own = bitboards.colors[WHITE if self.white_to_move else BLACK]
+        while own:  # squares are visited row by row, as in a scan of the board
+            low = own & -own
+            row, col = divmod(low.bit_length() - 1, 8)
+            piece = bitboards.board[row][col][1]
+            self.move_functions[piece](row, col, moves)  # call the right move function based on piece type
+            own ^= low
         return moves
 
     def get_valid_moves(self):
@@ -223,38 +429,60 @@ class GameState:
             Returns:
                 list: List of valid ChessMove objects.
 
-            This method retrieves all possible moves and filters out those that would leave
-            the current player in check. It also checks for checkmate and stalemate conditions.
+            This method generates the legal moves directly: the checking pieces and the pinned pieces are found
+            once for the position, so no move has to be made and undone to know it does not leave the king in check.
+            It also checks for checkmate and stalemate conditions.
+
+            The moves are generated as 16-bit codes, and wrapped in Move objects for the user interface.
+
+            The moves of the last position are cached under its Zobrist key, so asking again for the moves of the
+            same position, as the renderer does on every frame, costs nothing: only make_move, undo_move or a new
+            game change the key and run the generation again. The cached list is shared, it must not be modified.
+        """
+        cache = self.valid_moves_cache
+        if cache is not None and cache[0] == self.zobrist_key:
+            _, moves, self.check_mate, self.stale_mate = cache
+            return moves
+        GameState.move_generations += 1
+        codes = array('H')
+        checkers = self.generate_moves(codes)
+        board = self.board
+        moves = [Move.from_code(code, board) for code in codes]
+        if checkers:
+            self.check_mate = len(moves) == 0
+            self.stale_mate = False
+        else:
+            self.check_mate = False
+            self.stale_mate = len(moves) == 0
+        self.valid_moves_cache = (self.zobrist_key, moves, self.check_mate, self.stale_mate)
+        return moves
+
+    def generate_moves(self, moves):
         """
+            Fill a move buffer with the codes of the legal moves.
 
-        temp_en_passant_possible = self.en_passant_possible
-        temp_CastleRights = CastleRights(self.current_castling_rights.wks, self.current_castling_rights.bks,
-                                         self.current_castling_rights.wqs, self.current_castling_rights.bqs)
-        moves = self.get_all_possible_moves()
-        if self.white_to_move:
-            self.get_castle_moves(self.white_king_location[0], self.white_king_location[1], moves)
-        else:
-            self.get_castle_moves(self.black_king_location[0], self.black_king_location[1], moves)
+            Args:
+                moves (array): The move buffer, usually an array('H'), the codes are appended to it.
 
-        for i in range(len(moves) - 1, -1, -1):
-            self.make_move(moves[i])
-            self.white_to_move = not self.white_to_move
-            if self.in_check():
-                moves.remove(moves[i])
-            self.white_to_move = not self.white_to_move
-            self.undo_move()
-        if len(moves) == 0:
-            if self.in_check():
-                self.check_mate = True
-            else:
-                self.stale_mate = True
-        else:
-            self.check_mate = False
-            self.stale_mate = False
+            Returns:
+                int: The bitboard of the enemy pieces giving check, 0 if the side to move is not in check.
 
-        self.en_passant_possible = temp_en_passant_possible
-        self.current_castling_rights = temp_CastleRights
-        return moves
+            This is the move generator of the engine: no Move object is created, and the checkmate and stalemate
+            flags are left untouched.
+        """
+        return legal_moves.generate_legal_moves(self, moves)
+
+    def generate_captures(self, moves):
+        """
+            Fill a move buffer with the codes of the legal captures and promotions.
+
+            Args:
+                moves (array): The move buffer, usually an array('H'), the codes are appended to it.
+
+            Returns:
+                int: The bitboard of the enemy pieces giving check, 0 if the side to move is not in check.
+        """
+        return legal_moves.generate_legal_captures(self, moves)
 
     def in_check(self):
         """
@@ -285,17 +513,12 @@ class GameState:
         Returns:
             bool: True if the square is under attack, False otherwise.
 
-        This method calculates whether the square at position (r, c) on the chessboard is under attack
-        by any piece of the opponent. It does so by temporarily switching the turn to the opponent's side,
-        obtaining all possible moves for the opponent, and checking if any of those moves target the specified square.
+        This method looks outwards from the square for the opponent pieces able to reach it: pawns, knights and the
+        king through the precomputed attack tables, rooks, bishops and queens through the magic slider attacks.
+        No move is generated, so answering the question allocates nothing.
         """
-        self.white_to_move = not self.white_to_move
-        oppMoves = self.get_all_possible_moves()
-        self.white_to_move = not self.white_to_move
-        for move in oppMoves:
-            if move.end_row == r and move.end_col == col:
-                return True
-        return False
+        bitboards = self.bitboards
+        return is_square_attacked(bitboards, r * 8 + col, BLACK if self.white_to_move else WHITE, bitboards.occupied)
 
     def update_castle_rights(self, move):
         """
@@ -308,7 +531,8 @@ class GameState:
                 None
 
             This method adjusts the castle rights after a move is made. It considers the movement
-            of kings and rooks to determine whether castling is still possible for each side.
+            of kings and rooks to determine whether castling is still possible for each side: every square keeps a
+            mask of the rights which survive a move starting or ending there.
 
             Args:
                 move (ChessMove): The move for which castle rights need to be updated.
@@ -329,38 +553,12 @@ class GameState:
                 - If the black king moves, black loses the right to castle queenside.
                 - If the black queenside rook moves, black loses the right to castle queenside.
             """
-        if move.piece_moved == 'wK':
-            self.current_castling_rights.wks = False
-            self.current_castling_rights.wqs = False
-        elif move.piece_moved == 'bK':
-            self.current_castling_rights.bks = False
-            self.current_castling_rights.bqs = False
-        elif move.piece_moved == 'wR':
-            if move.start_row == 7:
-                if move.start_col == 0:
-                    self.current_castling_rights.wqs = False
-                elif move.start_col == 7:
-                    self.current_castling_rights.wks = False
-        elif move.piece_moved == 'bR':
-            if move.start_row == 0:
-                if move.start_col == 0:
-                    self.current_castling_rights.bqs = False
-                elif move.start_col == 7:
-                    self.current_castling_rights.bks = False
-
-        # if a rook is captured
-        if move.piece_captured == 'wR':
-            if move.end_row == 7:
-                if move.end_col == 0:
-                    self.current_castling_rights.wqs = False
-                elif move.end_col == 7:
-                    self.current_castling_rights.wks = False
-        elif move.piece_captured == 'bR':
-            if move.end_row == 0:
-                if move.end_col == 0:
-                    self.current_castling_rights.bqs = False
-                elif move.end_col == 7:
-                    self.current_castling_rights.bks = False
+        start = move.start_row * 8 + move.start_col
+        end = move.end_row * 8 + move.end_col
+        rights = self.castling_rights & CASTLING_RIGHTS_MASK[start] & CASTLING_RIGHTS_MASK[end]
+        # the Zobrist key follows the rights, which also invalidates the cached valid moves of the old position
+        self.zobrist_key ^= CASTLING_KEYS[self.castling_rights] ^ CASTLING_KEYS[rights]
+        self.castling_rights = rights
 
     def get_castle_moves(self, r, col, moves):
         """
@@ -375,14 +573,7 @@ class GameState:
             It considers both king-side and queen-side castling moves if they are valid.
 
         """
-        if self.square_under_attack(r, col):
-            return
-        if ((self.white_to_move and self.current_castling_rights.wks) or
-                (not self.white_to_move and self.current_castling_rights.bks)):
-            self.get_king_side_castle_moves(r, col, moves)
-        if ((self.white_to_move and self.current_castling_rights.wqs) or
-                (not self.white_to_move and self.current_castling_rights.bqs)):
-            self.get_queen_side_castle_moves(r, col, moves)
+        self._add_castle_moves(castle_moves.get_castle_moves, r, col, moves)
 
     def get_king_side_castle_moves(self, r, c, moves):
         """
@@ -396,9 +587,7 @@ class GameState:
             This method generates king-side castle moves for the king at the specified position on the chessboard.
 
         """
-        if self.board[r][c+1] == '--' and self.board[r][c+2] == '--':
-            if not self.square_under_attack(r, c+1) and not self.square_under_attack(r, c+2):
-                moves.append(Move((r, c), (r, c+2), self.board, is_castle_move=True))
+        self._add_castle_moves(castle_moves.get_king_side_castle_moves, r, c, moves)
 
     def get_queen_side_castle_moves(self, r, c, moves):
         """
@@ -412,9 +601,21 @@ class GameState:
             This method generates queen-side castle moves for the king at the specified position on the chessboard.
 
         """
-        if self.board[r][c-1] == '--' and self.board[r][c-2] == '--' and self.board[r][c-3] == '--':
-            if not self.square_under_attack(r, c-1) and not self.square_under_attack(r, c-2):
-                moves.append(Move((r, c), (r, c-2), self.board, is_castle_move=True))
+        self._add_castle_moves(castle_moves.get_queen_side_castle_moves, r, c, moves)
+
+    def _add_castle_moves(self, generator, r, c, moves):
+        """
+            Run a castle move generator and add its move codes to a list as Move objects.
+
+            Args:
+                generator (function): The castle_moves generator to run.
+                r (int): Row of the king.
+                c (int): Column of the king.
+                moves (list): List to store the generated moves.
+        """
+        codes = array('H')
+        generator(self, r, c, codes)
+        moves.extend(Move.from_code(code, self.board) for code in codes)
 
     def get_pawn_moves(self, r, c, moves):
         """
@@ -429,37 +630,7 @@ class GameState:
             It considers one and two square advances, captures diagonally, and en passant captures.
 
         """
-        if self.white_to_move:
-            if self.board[r - 1][c] == "--":  # one square pawn advance
-                moves.append(Move((r, c), (r - 1, c), self.board))
-                if r == 6 and self.board[r - 2][c] == "--":
-                    moves.append(Move((r, c), (r - 2, c), self.board))  # two square pawn advance - first move
-            if c - 1 >= 0:
-                if self.board[r - 1][c - 1][0] == 'b':
-                    moves.append(Move((r, c), (r - 1, c - 1), self.board))
-                elif (r - 1, c - 1) == self.en_passant_possible:
-                    moves.append(Move((r, c), (r - 1, c - 1), self.board, enpassant_possible=True))
-
-            if c + 1 <= 7:
-                if self.board[r - 1][c + 1][0] == 'b':
-                    moves.append(Move((r, c), (r - 1, c + 1), self.board))
-                elif (r - 1, c + 1) == self.en_passant_possible:
-                    moves.append(Move((r, c), (r - 1, c + 1), self.board, enpassant_possible=True))
-        else:
-            if self.board[r + 1][c] == "--":  # one square pawn advance
-                moves.append(Move((r, c), (r + 1, c), self.board))
-                if r == 1 and self.board[r + 2][c] == "--":
-                    moves.append(Move((r, c), (r + 2, c), self.board))
-            if c - 1 >= 0:
-                if self.board[r + 1][c - 1][0] == 'w':
-                    moves.append(Move((r, c), (r + 1, c - 1), self.board))
-                elif (r + 1, c - 1) == self.en_passant_possible:
-                    moves.append(Move((r, c), (r + 1, c - 1), self.board, enpassant_possible=True))
-            if c + 1 <= 7:
-                if self.board[r + 1][c + 1][0] == 'w':
-                    moves.append(Move((r, c), (r + 1, c + 1), self.board))
-                elif (r + 1, c + 1) == self.en_passant_possible:
-                    moves.append(Move((r, c), (r + 1, c + 1), self.board, enpassant_possible=True))
+        pieces_moves.get_pawn_moves(self, r, c, moves)
 
     def get_rook_moves(self, r, c, moves):
         """
@@ -473,72 +644,7 @@ class GameState:
             This method generates all possible moves for a rook at the specified position on the chessboard.
             It considers moves along the rows and columns until it encounters a piece or the edge of the board.
         """
-        if self.white_to_move:
-            for row in range(r - 1, -1, -1):
-                if self.board[row][c] == "--":
-                    moves.append(Move((r, c), (row, c), self.board))
-                elif self.board[row][c][0] == 'b':
-                    moves.append(Move((r, c), (row, c), self.board))
-                    break
-                else:
-                    break
-            for row in range(r + 1, 8):
-                if self.board[row][c] == "--":
-                    moves.append(Move((r, c), (row, c), self.board))
-                elif self.board[row][c][0] == 'b':
-                    moves.append(Move((r, c), (row, c), self.board))
-                    break
-                else:
-                    break
-            for col in range(c - 1, -1, -1):
-                if self.board[r][col] == "--":
-                    moves.append(Move((r, c), (r, col), self.board))
-                elif self.board[r][col][0] == 'b':
-                    moves.append(Move((r, c), (r, col), self.board))
-                    break
-                else:
-                    break
-            for col in range(c + 1, 8):
-                if self.board[r][col] == "--":
-                    moves.append(Move((r, c), (r, col), self.board))
-                elif self.board[r][col][0] == 'b':
-                    moves.append(Move((r, c), (r, col), self.board))
-                    break
-                else:
-                    break
-        else:
-            for row in range(r - 1, -1, -1):
-                if self.board[row][c] == "--":
-                    moves.append(Move((r, c), (row, c), self.board))
-                elif self.board[row][c][0] == 'w':
-                    moves.append(Move((r, c), (row, c), self.board))
-                    break
-                else:
-                    break
-            for row in range(r + 1, 8):
-                if self.board[row][c] == "--":
-                    moves.append(Move((r, c), (row, c), self.board))
-                elif self.board[row][c][0] == 'w':
-                    moves.append(Move((r, c), (row, c), self.board))
-                    break
-                else:
-                    break
-            for col in range(c - 1, -1, -1):
-                if self.board[r][col] == "--":
-                    moves.append(Move((r, c), (r, col), self.board))
-                elif self.board[r][col][0] == 'w':
-                    moves.append(Move((r, c), (r, col), self.board))
-                    break
-                else:
-                    break
-            for col in range(c + 1, 8):
-                if self.board[r][col] == "--":
-                    moves.append(Move((r, c), (r, col), self.board))
-                elif self.board[r][col][0] == 'w':
-                    moves.append(Move((r, c), (r, col), self.board))
-                    break
-                else:
-                    break
+        pieces_moves.get_rook_moves(self, r, c, moves)
 
     def get_knight_moves(self, r, c, moves):
         """
@@ -553,88 +659,7 @@ class GameState:
             It considers all eight possible knight moves, checking for validity and capturing opponent pieces.
 
             """
-        if self.white_to_move:
-            if r - 2 >= 0 and c - 1 >= 0:
-                if self.board[r - 2][c - 1] == "--":
-                    moves.append(Move((r, c), (r - 2, c - 1), self.board))
-                elif self.board[r - 2][c - 1][0] == 'b':
-                    moves.append(Move((r, c), (r - 2, c - 1), self.board))
-            if r - 2 >= 0 and c + 1 <= 7:
-                if self.board[r - 2][c + 1] == "--":
-                    moves.append(Move((r, c), (r - 2, c + 1), self.board))
-                elif self.board[r - 2][c + 1][0] == 'b':
-                    moves.append(Move((r, c), (r - 2, c + 1), self.board))
-            if r - 1 >= 0 and c - 2 >= 0:
-                if self.board[r - 1][c - 2] == "--":
-                    moves.append(Move((r, c), (r - 1, c - 2), self.board))
-                elif self.board[r - 1][c - 2][0] == 'b':
-                    moves.append(Move((r, c), (r - 1, c - 2), self.board))
-            if r - 1 >= 0 and c + 2 <= 7:
-                if self.board[r - 1][c + 2] == "--":
-                    moves.append(Move((r, c), (r - 1, c + 2), self.board))
-                elif self.board[r - 1][c + 2][0] == 'b':
-                    moves.append(Move((r, c), (r - 1, c + 2), self.board))
-            if r + 1 <= 7 and c - 2 >= 0:
-                if self.board[r + 1][c - 2] == "--":
-                    moves.append(Move((r, c), (r + 1, c - 2), self.board))
-                elif self.board[r + 1][c - 2][0] == 'b':
-                    moves.append(Move((r, c), (r + 1, c - 2), self.board))
-            if r + 1 <= 7 and c + 2 <= 7:
-                if self.board[r + 1][c + 2] == "--":
-                    moves.append(Move((r, c), (r + 1, c + 2), self.board))
-                elif self.board[r + 1][c + 2][0] == 'b':
-                    moves.append(Move((r, c), (r + 1, c + 2), self.board))
-            if r + 2 <= 7 and c - 1 >= 0:
-                if self.board[r + 2][c - 1] == "--":
-                    moves.append(Move((r, c), (r + 2, c - 1), self.board))
-                elif self.board[r + 2][c - 1][0] == 'b':
-                    moves.append(Move((r, c), (r + 2, c - 1), self.board))
-            if r + 2 <= 7 and c + 1 <= 7:
-                if self.board[r + 2][c + 1] == "--":
-                    moves.append(Move((r, c), (r + 2, c + 1), self.board))
-                elif self.board[r + 2][c + 1][0] == 'b':
-                    moves.append(Move((r, c), (r + 2, c + 1), self.board))
-        else:
-            if r - 2 >= 0 and c - 1 >= 0:
-                if self.board[r - 2][c - 1] == "--":
-                    moves.append(Move((r, c), (r - 2, c - 1), self.board))
-                elif self.board[r - 2][c - 1][0] == 'w':
-                    moves.append(Move((r, c), (r - 2, c - 1), self.board))
-            if r - 2 >= 0 and c + 1 <= 7:
-                if self.board[r - 2][c + 1] == "--":
-                    moves.append(Move((r, c), (r - 2, c + 1), self.board))
-                elif self.board[r - 2][c + 1][0] == 'w':
-                    moves.append(Move((r, c), (r - 2, c + 1), self.board))
-            if r - 1 >= 0 and c - 2 >= 0:
-                if self.board[r - 1][c - 2] == "--":
-                    moves.append(Move((r, c), (r - 1, c - 2), self.board))
-                elif self.board[r - 1][c - 2][0] == 'w':
-                    moves.append(Move((r, c), (r - 1, c - 2), self.board))
-            if r - 1 >= 0 and c + 2 <= 7:
-                if self.board[r - 1][c + 2] == "--":
-                    moves.append(Move((r, c), (r - 1, c + 2), self.board))
-                elif self.board[r - 1][c + 2][0] == 'w':
-                    moves.append(Move((r, c), (r - 1, c + 2), self.board))
-            if r + 1 <= 7 and c - 2 >= 0:
-                if self.board[r + 1][c - 2] == "--":
-                    moves.append(Move((r, c), (r + 1, c - 2), self.board))
-                elif self.board[r + 1][c - 2][0] == 'w':
-                    moves.append(Move((r, c), (r + 1, c - 2), self.board))
-            if r + 1 <= 7 and c + 2 <= 7:
-                if self.board[r + 1][c + 2] == "--":
-                    moves.append(Move((r, c), (r + 1, c + 2), self.board))
-                elif self.board[r + 1][c + 2][0] == 'w':
-                    moves.append(Move((r, c), (r + 1, c + 2), self.board))
-            if r + 2 <= 7 and c - 1 >= 0:
-                if self.board[r + 2][c - 1] == "--":
-                    moves.append(Move((r, c), (r + 2, c - 1), self.board))
-                elif self.board[r + 2][c - 1][0] == 'w':
-                    moves.append(Move((r, c), (r + 2, c - 1), self.board))
-            if r + 2 <= 7 and c + 1 <= 7:
-                if self.board[r + 2][c + 1] == "--":
-                    moves.append(Move((r, c), (r + 2, c + 1), self.board))
-                elif self.board[r + 2][c + 1][0] == 'w':
-                    moves.append(Move((r, c), (r + 2, c + 1), self.board))
+        pieces_moves.get_knight_moves(self, r, c, moves)
 
     def get_bishop_moves(self, r, c, moves):
         """
@@ -649,80 +674,7 @@ class GameState:
                 It considers all diagonal moves, checking for validity and capturing opponent pieces.
 
         """
-        if self.white_to_move:
-            for i in range(1, 8):
-                if r - i >= 0 and c - i >= 0:
-                    if self.board[r - i][c - i] == "--":
-                        moves.append(Move((r, c), (r - i, c - i), self.board))
-                    elif self.board[r - i][c - i][0] == 'b':
-                        moves.append(Move((r, c), (r - i, c - i), self.board))
-                        break
-                    else:
-                        break
-            for i in range(1, 8):
-                if r - i >= 0 and c + i <= 7:
-                    if self.board[r - i][c + i] == "--":
-                        moves.append(Move((r, c), (r - i, c + i), self.board))
-                    elif self.board[r - i][c + i][0] == 'b':
-                        moves.append(Move((r, c), (r - i, c + i), self.board))
-                        break
-                    else:
-                        break
-            for i in range(1, 8):
-                if r + i <= 7 and c - i >= 0:
-                    if self.board[r + i][c - i] == "--":
-                        moves.append(Move((r, c), (r + i, c - i), self.board))
-                    elif self.board[r + i][c - i][0] == 'b':
-                        moves.append(Move((r, c), (r + i, c - i), self.board))
-                        break
-                    else:
-                        break
-            for i in range(1, 8):
-                if r + i <= 7 and c + i <= 7:
-                    if self.board[r + i][c + i] == "--":
-                        moves.append(Move((r, c), (r + i, c + i), self.board))
-                    elif self.board[r + i][c + i][0] == 'b':
-                        moves.append(Move((r, c), (r + i, c + i), self.board))
-                        break
-                    else:
-                        break
-        else:
-            for i in range(1, 8):
-                if r - i >= 0 and c - i >= 0:
-                    if self.board[r - i][c - i] == "--":
-                        moves.append(Move((r, c), (r - i, c - i), self.board))
-                    elif self.board[r - i][c - i][0] == 'w':
-                        moves.append(Move((r, c), (r - i, c - i), self.board))
-                        break
-                    else:
-                        break
-            for i in range(1, 8):
-                if r - i >= 0 and c + i <= 7:
-                    if self.board[r - i][c + i] == "--":
-                        moves.append(Move((r, c), (r - i, c + i), self.board))
-                    elif self.board[r - i][c + i][0] == 'w':
-                        moves.append(Move((r, c), (r - i, c + i), self.board))
-                        break
-                    else:
-                        break
-            for i in range(1, 8):
-                if r + i <= 7 and c - i >= 0:
-                    if self.board[r + i][c - i] == "--":
-                        moves.append(Move((r, c), (r + i, c - i), self.board))
-                    elif self.board[r + i][c - i][0] == 'w':
-                        moves.append(Move((r, c), (r + i, c - i), self.board))
-                        break
-                    else:
-                        break
-            for i in range(1, 8):
-                if r + i <= 7 and c + i <= 7:
-                    if self.board[r + i][c + i] == "--":
-                        moves.append(Move((r, c), (r + i, c + i), self.board))
-                    elif self.board[r + i][c + i][0] == 'w':
-                        moves.append(Move((r, c), (r + i, c + i), self.board))
-                        break
-                    else:
-                        break
+        pieces_moves.get_bishop_moves(self, r, c, moves)
 
     def get_queen_moves(self, r, c, moves):
         """
@@ -737,8 +689,7 @@ class GameState:
             It combines the moves of a rook and a bishop, checking for validity and capturing opponent pieces.
 
         """
-        self.get_rook_moves(r, c, moves)
-        self.get_bishop_moves(r, c, moves)
+        pieces_moves.get_queen_moves(self, r, c, moves)
 
     def get_king_moves(self, r, c, moves):
         """
@@ -753,97 +704,4 @@ class GameState:
             It considers the king possible moves in all directions, checking for validity and capturing opponent pieces
 
         """
-        if self.white_to_move:
-            if r - 1 >= 0:
-                if self.board[r - 1][c] == "--":
-                    moves.append(Move((r, c), (r - 1, c), self.board))
-                elif self.board[r - 1][c][0] == 'b':
-                    moves.append(Move((r, c), (r - 1, c), self.board))
-            if r - 1 >= 0 and c - 1 >= 0:
-                if self.board[r - 1][c - 1] == "--":
-                    moves.append(Move((r, c), (r - 1, c - 1), self.board))
-                elif self.board[r - 1][c - 1][0] == 'b':
-                    moves.append(Move((r, c), (r - 1, c - 1), self.board))
-            if r - 1 >= 0 and c + 1 <= 7:
-                if self.board[r - 1][c + 1] == "--":
-                    moves.append(Move((r, c), (r - 1, c + 1), self.board))
-                elif self.board[r - 1][c + 1][0] == 'b':
-                    moves.append(Move((r, c), (r - 1, c + 1), self.board))
-            if c - 1 >= 0:
-                if self.board[r][c - 1] == "--":
-                    moves.append(Move((r, c), (r, c - 1), self.board))
-                elif self.board[r][c - 1][0] == 'b':
-                    moves.append(Move((r, c), (r, c - 1), self.board))
-            if c + 1 <= 7:
-                if self.board[r][c + 1] == "--":
-                    moves.append(Move((r, c), (r, c + 1), self.board))
-                elif self.board[r][c + 1][0] == 'b':
-                    moves.append(Move((r, c), (r, c + 1), self.board))
-            if r + 1 <= 7:
-                if self.board[r + 1][c] == "--":
-                    moves.append(Move((r, c), (r + 1, c), self.board))
-                elif self.board[r + 1][c][0] == 'b':
-                    moves.append(Move((r, c), (r + 1, c), self.board))
-            if r + 1 <= 7 and c - 1 >= 0:
-                if self.board[r + 1][c - 1] == "--":
-                    moves.append(Move((r, c), (r + 1, c - 1), self.board))
-                elif self.board[r + 1][c - 1][0] == 'b':
-                    moves.append(Move((r, c), (r + 1, c - 1), self.board))
-            if r + 1 <= 7 and c + 1 <= 7:
-                if self.board[r + 1][c + 1] == "--":
-                    moves.append(Move((r, c), (r + 1, c + 1), self.board))
-                elif self.board[r + 1][c + 1][0] == 'b':
-                    moves.append(Move((r, c), (r + 1, c + 1), self.board))
-        else:
-            if r - 1 >= 0:
-                if self.board[r - 1][c] == "--":
-                    moves.append(Move((r, c), (r - 1, c), self.board))
-                elif self.board[r - 1][c][0] == 'w':
-                    moves.append(Move((r, c), (r - 1, c), self.board))
-            if r - 1 >= 0 and c - 1 >= 0:
-                if self.board[r - 1][c - 1] == "--":
-                    moves.append(Move((r, c), (r - 1, c - 1), self.board))
-                elif self.board[r - 1][c - 1][0] == 'w':
-                    moves.append(Move((r, c), (r - 1, c - 1), self.board))
-            if r - 1 >= 0 and c + 1 <= 7:
-                if self.board[r - 1][c + 1] == "--":
-                    moves.append(Move((r, c), (r - 1, c + 1), self.board))
-                elif self.board[r - 1][c + 1][0] == 'w':
-                    moves.append(Move((r, c), (r - 1, c + 1), self.board))
-            if c - 1 >= 0:
-                if self.board[r][c - 1] == "--":
-                    moves.append(Move((r, c), (r, c - 1), self.board))
-                elif self.board[r][c - 1][0] == 'w':
-                    moves.append(Move((r, c), (r, c - 1), self.board))
-            if c + 1 <= 7:
-                if self.board[r][c + 1] == "--":
-                    moves.append(Move((r, c), (r, c + 1), self.board))
-                elif self.board[r][c + 1][0] == 'w':
-                    moves.append(Move((r, c), (r, c + 1), self.board))
-            if r + 1 <= 7:
-                if self.board[r + 1][c] == "--":
-                    moves.append(Move((r, c), (r + 1, c), self.board))
-                elif self.board[r + 1][c][0] == 'w':
-                    moves.append(Move((r, c), (r + 1, c), self.board))
-            if r + 1 <= 7 and c - 1 >= 0:
-                if self.board[r + 1][c - 1] == "--":
-                    moves.append(Move((r, c), (r + 1, c - 1), self.board))
-                elif self.board[r + 1][c - 1][0] == 'w':
-                    moves.append(Move((r, c), (r + 1, c - 1), self.board))
-            if r + 1 <= 7 and c + 1 <= 7:
-                if self.board[r + 1][c + 1] == "--":
-                    moves.append(Move((r, c), (r + 1, c + 1), self.board))
-                elif self.board[r + 1][c + 1][0] == 'w':
-                    moves.append(Move((r, c), (r + 1, c + 1), self.board))
-
-    def random_move(self, valid_moves):
-        """
-        Generate a random move from the list of valid moves.
-
-        Args:
-            valid_moves (list): List of valid moves.
-
-        Returns:
-            ChessMove: A random move from the list of valid moves.
-        """
-        return valid_moves[random.randint(0, len(valid_moves) - 1)]
+        pieces_moves.get_king_moves(self, r, c, moves)
@@ -0,0 +1,460 @@
+"""
+Attacks Module for Chess Game
+
+This module contains the attack tables of the move generator: the squares attacked by knights, kings and pawns from
+every square, the rays of the sliding pieces, and the squares between and on the line through two squares. Rook and
+bishop attacks are looked up in magic bitboard tables, built once and cached on disk in magic_attacks.bin. On top of
+the tables, attackers_to and is_square_attacked answer whether a square is attacked by looking outward from it.
+"""
+from ..bitboard import (SQUARE_BB, FULL_BOARD, WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING,
+                        W_PAWN, W_KNIGHT, W_BISHOP, W_ROOK, W_QUEEN, W_KING,
+                        B_PAWN, B_KNIGHT, B_BISHOP, B_ROOK, B_QUEEN, B_KING, lsb, msb)
+from array import array
+import os
+import random
+import sys
+import tempfile
+import zlib
+
+# (row, col) steps of the pieces that jump to a fixed set of squares
+KNIGHT_STEPS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+KING_STEPS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# ray directions, the first four go towards higher square indexes and the last four towards lower ones
+EAST, SOUTH, SOUTH_EAST, SOUTH_WEST, WEST, NORTH, NORTH_WEST, NORTH_EAST = range(8)
+DIRECTION_STEPS = ((0, 1), (1, 0), (1, 1), (1, -1), (0, -1), (-1, 0), (-1, -1), (-1, 1))
+ROOK_DIRECTIONS = (EAST, SOUTH, WEST, NORTH)
+BISHOP_DIRECTIONS = (SOUTH_EAST, SOUTH_WEST, NORTH_WEST, NORTH_EAST)
+
+
+def _step_attacks(square, steps):
+    """
+    Build the bitboard of the squares reached from a square with single steps.
+
+    Args:
+        square (int): The starting square index.
+        steps (tuple): The (row, col) steps of the piece.
+
+    Returns:
+        int: The bitboard of the reachable squares.
+    """
+    r, c = divmod(square, 8)
+    attacks = 0
+    for dr, dc in steps:
+        if 0 <= r + dr <= 7 and 0 <= c + dc <= 7:
+            attacks |= SQUARE_BB[(r + dr) * 8 + c + dc]
+    return attacks
+
+
+def _ray(square, direction):
+    """
+    Build the bitboard of the squares from a square to the edge of the board in one direction.
+
+    Args:
+        square (int): The starting square index (not included in the ray).
+        direction (int): One of the eight ray directions.
+
+    Returns:
+        int: The bitboard of the ray.
+    """
+    dr, dc = DIRECTION_STEPS[direction]
+    r, c = divmod(square, 8)
+    ray = 0
+    r, c = r + dr, c + dc
+    while 0 <= r <= 7 and 0 <= c <= 7:
+        ray |= SQUARE_BB[r * 8 + c]
+        r, c = r + dr, c + dc
+    return ray
+
+
+KNIGHT_ATTACKS = [_step_attacks(square, KNIGHT_STEPS) for square in range(64)]
+KING_ATTACKS = [_step_attacks(square, KING_STEPS) for square in range(64)]
+# squares attacked by a pawn of each color, white pawns capture towards row 0
+PAWN_ATTACKS = [[_step_attacks(square, ((-1, -1), (-1, 1))) for square in range(64)],
+                [_step_attacks(square, ((1, -1), (1, 1))) for square in range(64)]]
+RAYS = [[_ray(square, direction) for square in range(64)] for direction in range(8)]
+
+
+def ray_attacks(square, occupied, directions):
+    """
+    Compute the attacks of a sliding piece along the given directions.
+
+    Args:
+        square (int): The square of the sliding piece.
+        occupied (int): The occupancy bitboard of all the pieces.
+        directions (tuple): The ray directions the piece slides along.
+
+    Returns:
+        int: The bitboard of the attacked squares, including the first blocker of every ray.
+
+    Every ray is cut at its first blocker: the nearest occupied square is the lowest set bit for the
+    directions going towards higher square indexes and the highest set bit for the other ones.
+    """
+    attacks = 0
+    for direction in directions:
+        ray = RAYS[direction][square]
+        blockers = ray & occupied
+        if blockers:
+            blocker = lsb(blockers) if direction < WEST else msb(blockers)
+            ray ^= RAYS[direction][blocker]
+        attacks |= ray
+    return attacks
+
+
+def _between_and_line(a, b):
+    """
+    Build the bitboards of the squares between two squares and of the whole line through them.
+
+    Args:
+        a (int): The first square index.
+        b (int): The second square index.
+
+    Returns:
+        tuple: The (between, line) bitboards, both empty if the squares are not on a common row, column or diagonal.
+    """
+    for direction in range(8):
+        if RAYS[direction][a] & SQUARE_BB[b]:
+            opposite = (direction + 4) % 8
+            between = RAYS[direction][a] & RAYS[opposite][b]
+            line = RAYS[direction][a] | RAYS[opposite][a] | SQUARE_BB[a]
+            return between, line
+    return 0, 0
+
+
+# BETWEEN[a][b] holds the squares strictly between a and b, LINE[a][b] the full line through both of them
+BETWEEN = [[_between_and_line(a, b)[0] for b in range(64)] for a in range(64)]
+LINE = [[_between_and_line(a, b)[1] for b in range(64)] for a in range(64)]
+
+
+# Magic bitboards: the attacks of a slider only depend on the pieces standing on its relevant occupancy mask (its
+# rays without the board edges), and multiplying those pieces by a "magic" number gathers them into the top bits of
+# the product, which index a table holding the precomputed attack set for every occupancy.
+# The magics are found with a seeded search, the seeds below are the first ones producing a valid magic for every
+# square, so generating the tables only needs one candidate per square and is fully deterministic.
+ROOK_MAGIC_SEEDS = (
+    67100, 542946, 27319, 624340, 579157, 415158, 9220, 224743,
+    103045, 52445, 113407, 31338, 113571, 341, 15141, 15617,
+    6152, 172716, 19410, 67013, 363043, 109178, 142637, 2422,
+    26994, 73024, 67734, 72172, 152256, 59289, 144026, 57626,
+    6152, 16615, 109399, 66792, 209758, 59289, 113328, 52993,
+    26994, 28931, 77340, 174316, 295296, 36061, 102123, 82115,
+    14219, 33649, 53438, 47578, 219762, 99234, 15141, 20150,
+    20397, 56986, 387292, 688688, 582164, 29060, 4253, 297590,
+)
+BISHOP_MAGIC_SEEDS = (
+    5880, 925, 2468, 1907, 115, 1805, 3800, 13375,
+    3031, 4374, 1538, 551, 189, 1523, 9753, 1387,
+    5015, 4184, 11425, 4476, 41539, 9256, 267, 596,
+    449, 4699, 6183, 15948, 24952, 2574, 473, 513,
+    180, 3793, 17130, 130130, 167069, 11172, 558, 5958,
+    5821, 5574, 32812, 2306, 18656, 179, 158, 133,
+    3800, 52, 562, 1366, 179, 6771, 179, 925,
+    13375, 1387, 2630, 1876, 828, 3666, 3031, 5880,
+)
+
+MAGIC_CACHE_VERSION = 1
+MAGIC_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "magic_attacks.bin")
+
+
+def relevant_occupancy_mask(square, directions):
+    """
+    Build the relevant occupancy mask of a slider: its rays without their last square on the board edge.
+
+    Args:
+        square (int): The square of the sliding piece.
+        directions (tuple): The ray directions the piece slides along.
+
+    Returns:
+        int: The bitboard of the squares whose occupancy changes the attacks of the piece.
+    """
+    mask = 0
+    for direction in directions:
+        ray = RAYS[direction][square]
+        if ray:
+            edge = msb(ray) if direction < WEST else lsb(ray)
+            mask |= ray ^ SQUARE_BB[edge]
+    return mask
+
+
+def _occupancy_subsets(mask):
+    """
+    Enumerate every subset of an occupancy mask.
+
+    Args:
+        mask (int): The relevant occupancy mask.
+
+    Returns:
+        list: All the bitboards whose bits are a subset of the mask, starting with the empty one.
+    """
+    subsets = []
+    subset = 0
+    while True:
+        subsets.append(subset)
+        subset = (subset - mask) & mask
+        if subset == 0:
+            return subsets
+
+
+def _magic_candidate(seed):
+    """
+    Generate the magic candidate of a seed, a random number with few bits set.
+
+    Args:
+        seed (int): The seed of the candidate.
+
+    Returns:
+        int: A 64-bit magic candidate.
+    """
+    rng = random.Random(seed)
+    return rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+
+
+def _magic_table(mask, magic, subsets, attacks):
+    """
+    Try to build the attack table of a magic number.
+
+    Args:
+        mask (int): The relevant occupancy mask.
+        magic (int): The magic candidate.
+        subsets (list): Every occupancy of the mask.
+        attacks (list): The attack set of every occupancy.
+
+    Returns:
+        list: The attack table indexed by the magic index, or None if two occupancies with different attacks collide.
+    """
+    shift = 64 - mask.bit_count()
+    table = [None] * (1 << mask.bit_count())
+    for occupancy, attack in zip(subsets, attacks):
+        index = ((occupancy * magic) & FULL_BOARD) >> shift
+        if table[index] is None:
+            table[index] = attack
+        elif table[index] != attack:
+            return None
+    return [attack or 0 for attack in table]
+
+
+def find_magic(square, directions, seed=0):
+    """
+    Search a magic number for a slider standing on a square.
+
+    Args:
+        square (int): The square of the sliding piece.
+        directions (tuple): The ray directions the piece slides along.
+        seed (int): The first seed to try, the following ones are tried in order until one works.
+
+    Returns:
+        tuple: The (seed, magic, table) found for the square.
+    """
+    mask = relevant_occupancy_mask(square, directions)
+    subsets = _occupancy_subsets(mask)
+    attacks = [ray_attacks(square, occupancy, directions) for occupancy in subsets]
+    while True:
+        magic = _magic_candidate(seed)
+        if (((mask * magic) & FULL_BOARD) >> 56).bit_count() >= 6:
+            table = _magic_table(mask, magic, subsets, attacks)
+            if table is not None:
+                return seed, magic, table
+        seed += 1
+
+
+def _cache_tag():
+    """
+    Compute the tag identifying the magic seeds a cache file was generated from.
+
+    Returns:
+        int: The tag stored in the header of the cache file.
+    """
+    return zlib.crc32(repr((ROOK_MAGIC_SEEDS, BISHOP_MAGIC_SEEDS)).encode())
+
+
+def _load_magic_tables(path):
+    """
+    Load the magic numbers and attack tables from the cache file.
+
+    Args:
+        path (str): The path of the cache file.
+
+    Returns:
+        tuple: The (rook magics, rook tables, bishop magics, bishop tables), or None if the file is missing or stale.
+    """
+    sizes = [1 << mask.bit_count() for mask in ROOK_MASKS + BISHOP_MASKS]
+    data = array('Q')
+    try:
+        with open(path, "rb") as file:
+            data.frombytes(file.read())
+    except (OSError, ValueError):
+        return None
+    if sys.byteorder == "big":
+        data.byteswap()
+    if len(data) != 2 + 128 + sum(sizes) or data[0] != MAGIC_CACHE_VERSION or data[1] != _cache_tag():
+        return None
+
+    magics = data[2:130].tolist()
+    tables = []
+    offset = 130
+    for size in sizes:
+        tables.append(data[offset:offset + size].tolist())
+        offset += size
+    return magics[:64], tables[:64], magics[64:], tables[64:]
+
+
+def _save_magic_tables(path, rook_magics, rook_tables, bishop_magics, bishop_tables):
+    """
+    Write the magic numbers and attack tables to the cache file.
+
+    Args:
+        path (str): The path of the cache file.
+        rook_magics (list): The rook magic of every square.
+        rook_tables (list): The rook attack table of every square.
+        bishop_magics (list): The bishop magic of every square.
+        bishop_tables (list): The bishop attack table of every square.
+
+    The file is written next to its final location and renamed, so processes starting at the same time never read a
+    partially written cache. A cache that cannot be written is not an error, the tables are rebuilt on the next start.
+    """
+    data = array('Q', [MAGIC_CACHE_VERSION, _cache_tag()] + rook_magics + bishop_magics)
+    for table in rook_tables + bishop_tables:
+        data.extend(table)
+    if sys.byteorder == "big":
+        data.byteswap()
+    try:
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            data.tofile(file)
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+
+
+def _init_magic_tables(path=MAGIC_CACHE_PATH):
+    """
+    Load the magic attack tables from the cache file, generating and caching them if needed.
+
+    Args:
+        path (str): The path of the cache file.
+
+    Returns:
+        tuple: The (rook magics, rook tables, bishop magics, bishop tables).
+    """
+    loaded = _load_magic_tables(path)
+    if loaded is not None:
+        return loaded
+
+    rook_magics, rook_tables, bishop_magics, bishop_tables = [], [], [], []
+    for square in range(64):
+        _, magic, table = find_magic(square, ROOK_DIRECTIONS, ROOK_MAGIC_SEEDS[square])
+        rook_magics.append(magic)
+        rook_tables.append(table)
+        _, magic, table = find_magic(square, BISHOP_DIRECTIONS, BISHOP_MAGIC_SEEDS[square])
+        bishop_magics.append(magic)
+        bishop_tables.append(table)
+    _save_magic_tables(path, rook_magics, rook_tables, bishop_magics, bishop_tables)
+    return rook_magics, rook_tables, bishop_magics, bishop_tables
+
+
+ROOK_MASKS = [relevant_occupancy_mask(square, ROOK_DIRECTIONS) for square in range(64)]
+BISHOP_MASKS = [relevant_occupancy_mask(square, BISHOP_DIRECTIONS) for square in range(64)]
+ROOK_SHIFTS = [64 - mask.bit_count() for mask in ROOK_MASKS]
+BISHOP_SHIFTS = [64 - mask.bit_count() for mask in BISHOP_MASKS]
+ROOK_MAGICS, ROOK_TABLES, BISHOP_MAGICS, BISHOP_TABLES = _init_magic_tables()
+
+
+def rook_attacks(square, occupied):
+    """
+    Look up the squares attacked by a rook in the magic attack tables.
+
+    Args:
+        square (int): The square of the rook.
+        occupied (int): The occupancy bitboard of all the pieces.
+
+    Returns:
+        int: The bitboard of the attacked squares.
+    """
+    return ROOK_TABLES[square][(((occupied & ROOK_MASKS[square]) * ROOK_MAGICS[square]) & FULL_BOARD)
+                               >> ROOK_SHIFTS[square]]
+
+
+def bishop_attacks(square, occupied):
+    """
+    Look up the squares attacked by a bishop in the magic attack tables.
+
+    Args:
+        square (int): The square of the bishop.
+        occupied (int): The occupancy bitboard of all the pieces.
+
+    Returns:
+        int: The bitboard of the attacked squares.
+    """
+    return BISHOP_TABLES[square][(((occupied & BISHOP_MASKS[square]) * BISHOP_MAGICS[square]) & FULL_BOARD)
+                                 >> BISHOP_SHIFTS[square]]
+
+
+def queen_attacks(square, occupied):
+    """
+    Look up the squares attacked by a queen, the union of the rook and bishop attacks.
+
+    Args:
+        square (int): The square of the queen.
+        occupied (int): The occupancy bitboard of all the pieces.
+
+    Returns:
+        int: The bitboard of the attacked squares.
+    """
+    return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
+
+
+def attackers_to(bitboards, square, occupied):
+    """
+    Find the pieces of both colors attacking a square.
+
+    Args:
+        bitboards (Bitboards): The bitboards of the position.
+        square (int): The attacked square.
+        occupied (int): The occupancy used to block the sliding pieces, which may differ from the one of the position.
+
+    Returns:
+        int: The bitboard of the attacking pieces.
+
+    The attacks are looked up from the square outwards: a piece of some type attacks the square exactly when a piece
+    of the same type standing on the square would attack it.
+    """
+    pieces = bitboards.pieces
+    rooks = pieces[W_ROOK] | pieces[B_ROOK] | pieces[W_QUEEN] | pieces[B_QUEEN]
+    bishops = pieces[W_BISHOP] | pieces[B_BISHOP] | pieces[W_QUEEN] | pieces[B_QUEEN]
+    return ((PAWN_ATTACKS[BLACK][square] & pieces[W_PAWN]) | (PAWN_ATTACKS[WHITE][square] & pieces[B_PAWN])
+            | (KNIGHT_ATTACKS[square] & (pieces[W_KNIGHT] | pieces[B_KNIGHT]))
+            | (KING_ATTACKS[square] & (pieces[W_KING] | pieces[B_KING]))
+            | (rook_attacks(square, occupied) & rooks) | (bishop_attacks(square, occupied) & bishops))
+
+
+def is_square_attacked(bitboards, square, by_color, occupied):
+    """
+    Determine if a square is attacked by any piece of the given color.
+
+    Args:
+        bitboards (Bitboards): The bitboards of the position.
+        square (int): The square to test.
+        by_color (int): The color of the attacking side.
+        occupied (int): The occupancy used to block the sliding pieces.
+
+    Returns:
+        bool: True if at least one piece of by_color attacks the square.
+
+    Like attackers_to, the attacks are looked up outwards from the square, but the pieces are tested one type at a
+    time, the cheap table lookups first, and the answer is returned as soon as an attacker is found.
+    """
+    pieces = bitboards.pieces
+    base = by_color * 6
+    if PAWN_ATTACKS[by_color ^ 1][square] & pieces[base + PAWN]:
+        return True
+    if KNIGHT_ATTACKS[square] & pieces[base + KNIGHT]:
+        return True
+    if KING_ATTACKS[square] & pieces[base + KING]:
+        return True
+    queens = pieces[base + QUEEN]
+    rooks = pieces[base + ROOK] | queens
+    if rooks and rook_attacks(square, occupied) & rooks:
+        return True
+    bishops = pieces[base + BISHOP] | queens
+    return bool(bishops and bishop_attacks(square, occupied) & bishops)
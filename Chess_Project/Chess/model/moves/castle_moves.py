@@ -1,4 +1,19 @@
-from .move_class import Move
+from .move_class import KING_CASTLE, QUEEN_CASTLE, encode_move
+from ..bitboard import SQUARE_BB
+
+# castling rights bits of GameState.castling_rights
+WKS, WQS, BKS, BQS = 1, 2, 4, 8
+ALL_CASTLING_RIGHTS = WKS | WQS | BKS | BQS
+
+# castling rights kept when a move starts or ends on a square: moving the king or a rook, or capturing a rook on its
+# starting square, loses the matching rights
+CASTLING_RIGHTS_MASK = [ALL_CASTLING_RIGHTS] * 64
+CASTLING_RIGHTS_MASK[56] &= ~WQS  # a1
+CASTLING_RIGHTS_MASK[63] &= ~WKS  # h1
+CASTLING_RIGHTS_MASK[60] &= ~(WKS | WQS)  # e1
+CASTLING_RIGHTS_MASK[0] &= ~BQS  # a8
+CASTLING_RIGHTS_MASK[7] &= ~BKS  # h8
+CASTLING_RIGHTS_MASK[4] &= ~(BKS | BQS)  # e8
 
 
 class CastleRights:
@@ -19,6 +34,28 @@ class CastleRights:
         self.wqs = wqs
         self.bqs = bqs
 
+    @classmethod
+    def from_bits(cls, rights):
+        """
+            Create the castling rights of a castling rights bitmask.
+
+            Args:
+                rights (int): The castling rights bits (WKS, WQS, BKS, BQS).
+
+            Returns:
+                CastleRights: The castling rights object.
+        """
+        return cls(bool(rights & WKS), bool(rights & BKS), bool(rights & WQS), bool(rights & BQS))
+
+    def to_bits(self):
+        """
+            Pack the castling rights into a bitmask.
+
+            Returns:
+                int: The castling rights bits (WKS, WQS, BKS, BQS).
+        """
+        return (WKS if self.wks else 0) | (WQS if self.wqs else 0) | (BKS if self.bks else 0) | (BQS if self.bqs else 0)
+
 
 def get_castle_moves(gs, r, c, moves):
     """
@@ -28,19 +65,19 @@ def get_castle_moves(gs, r, c, moves):
             gs (GameState): The current game state.
             r (int): Row of the king.
             c (int): Column of the king.
-            moves (list): List to store the generated moves.
+            moves (array): Move buffer to store the generated move codes.
 
         This method generates castle moves for the king at the specified position on the chessboard.
-        It considers both king-side and queen-side castling moves if they are valid.
+        It considers both king-side and queen-side castling moves if they are valid: the squares between the king
+        and the rook must be empty, and the king must not be in check or pass through an attacked square.
     """
     if gs.square_under_attack(r, c):
         return
-    if ((gs.white_to_move and gs.current_castling_rights.wks) or
-            (not gs.white_to_move and gs.current_castling_rights.bks)):
-        get_king_side_castle_moves(gs.board, r, c, moves)
-    if ((gs.white_to_move and gs.current_castling_rights.wqs) or
-            (not gs.white_to_move and gs.current_castling_rights.bqs)):
-        get_queen_side_castle_moves(gs.board, r, c, moves)
+    king_side, queen_side = (WKS, WQS) if gs.white_to_move else (BKS, BQS)
+    if gs.castling_rights & king_side:
+        get_king_side_castle_moves(gs, r, c, moves)
+    if gs.castling_rights & queen_side:
+        get_queen_side_castle_moves(gs, r, c, moves)
 
 
 def get_king_side_castle_moves(gs, r, c, moves):
@@ -51,14 +88,15 @@ def get_king_side_castle_moves(gs, r, c, moves):
             gs (GameState): The current game state.
             r (int): Row of the king.
             c (int): Column of the king.
-            moves (list): List to store the generated moves.
+            moves (array): Move buffer to store the generated move codes.
 
         This method generates king-side castle moves for the king at the specified position on the chessboard.
 
     """
-    if gs.board[r][c+1] == '--' and gs.board[r][c+2] == '--':
+    square = r * 8 + c
+    if not gs.bitboards.occupied & (SQUARE_BB[square + 1] | SQUARE_BB[square + 2]):
         if not gs.square_under_attack(r, c+1) and not gs.square_under_attack(r, c+2):
-            moves.append(Move((r, c), (r, c+2), gs.board, is_castle_move=True))
+            moves.append(encode_move(square, square + 2, KING_CASTLE))
 
 
 def get_queen_side_castle_moves(gs, r, c, moves):
@@ -69,11 +107,12 @@ def get_queen_side_castle_moves(gs, r, c, moves):
             gs (GameState): The current game state.
             r (int): Row of the king.
             c (int): Column of the king.
-            moves (list): List to store the generated moves.
+            moves (array): Move buffer to store the generated move codes.
 
         This method generates queen-side castle moves for the king at the specified position on the chessboard.
 
     """
-    if gs.board[r][c-1] == '--' and gs.board[r][c-2] == '--' and gs.board[r][c-3] == '--':
+    square = r * 8 + c
+    if not gs.bitboards.occupied & (SQUARE_BB[square - 1] | SQUARE_BB[square - 2] | SQUARE_BB[square - 3]):
         if not gs.square_under_attack(r, c-1) and not gs.square_under_attack(r, c-2):
-            moves.append(Move((r, c), (r, c-2), gs.board, is_castle_move=True))
+            moves.append(encode_move(square, square - 2, QUEEN_CASTLE))
@@ -0,0 +1,209 @@
+from .move_class import DOUBLE_PAWN_PUSH, CAPTURE, EN_PASSANT, PROMOTION
+from .attacks import (KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, BETWEEN, LINE, rook_attacks, bishop_attacks,
+                      attackers_to, is_square_attacked)
+from . import castle_moves
+from ..bitboard import WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, SQUARE_BB, FULL_BOARD, lsb
+
+
+# rows where the pawns of each color are promoted
+PROMOTION_ROWS = 0xFF | 0xFF << 56
+
+
+def _add_moves(square, targets, enemy, moves):
+    """
+        Add the code of a move from a square to every square of a target bitboard.
+
+        Args:
+            square (int): The square of the moving piece.
+            targets (int): Bitboard of the destination squares.
+            enemy (int): Bitboard of the enemy pieces, whose squares are captures.
+            moves (array): Move buffer to store the generated move codes.
+    """
+    captures = targets & enemy
+    targets ^= captures
+    while captures:
+        low = captures & -captures
+        moves.append(square | (low.bit_length() - 1) << 6 | CAPTURE << 12)
+        captures ^= low
+    while targets:
+        low = targets & -targets
+        moves.append(square | (low.bit_length() - 1) << 6)
+        targets ^= low
+
+
+def _add_pawn_moves(square, targets, flags, moves):
+    """
+        Add the codes of the pawn moves from a square to every square of a target bitboard.
+
+        Args:
+            square (int): The square of the pawn.
+            targets (int): Bitboard of the destination squares.
+            flags (int): The move flags, QUIET or CAPTURE.
+            moves (array): Move buffer to store the generated move codes.
+
+        A pawn reaching the last row is promoted, and a move is added for every piece it can become, the queen first.
+    """
+    while targets:
+        low = targets & -targets
+        code = square | (low.bit_length() - 1) << 6
+        if low & PROMOTION_ROWS:
+            for promoted in (3, 2, 1, 0):
+                moves.append(code | (flags | PROMOTION | promoted) << 12)
+        else:
+            moves.append(code | flags << 12)
+        targets ^= low
+
+
+def get_pinned_pieces(bitboards, king, us):
+    """
+        Find the pieces of the side to move which are pinned to their king.
+
+        Args:
+            bitboards (Bitboards): The bitboards of the position.
+            king (int): The square of the king of the side to move.
+            us (int): The color of the side to move.
+
+        Returns:
+            int: The bitboard of the pinned pieces.
+
+        An enemy slider pins a piece when it would attack the king if the enemy pieces were the only blockers, and
+        exactly one piece, of the side to move, stands between the two.
+    """
+    pieces = bitboards.pieces
+    them = us ^ 1
+    enemy = bitboards.colors[them]
+    snipers = ((rook_attacks(king, enemy) & (pieces[them * 6 + ROOK] | pieces[them * 6 + QUEEN]))
+               | (bishop_attacks(king, enemy) & (pieces[them * 6 + BISHOP] | pieces[them * 6 + QUEEN])))
+    pinned = 0
+    while snipers:
+        low = snipers & -snipers
+        blockers = BETWEEN[king][low.bit_length() - 1] & bitboards.occupied
+        if blockers and not blockers & (blockers - 1) and blockers & bitboards.colors[us]:
+            pinned |= blockers
+        snipers ^= low
+    return pinned
+
+
+def generate_legal_moves(game_state, moves, captures_only=False):
+    """
+        Generate all the legal moves of the side to move.
+
+        Args:
+            game_state (GameState): The current game state.
+            moves (array): Move buffer, usually an array('H'), to store the generated move codes.
+            captures_only (bool): True to only generate the captures, en passant included, and the promotions.
+
+        Returns:
+            int: The bitboard of the enemy pieces giving check, 0 if the side to move is not in check.
+
+        The checkers and the pinned pieces are computed once for the position, so that only legal moves are emitted
+        and no move has to be made and taken back to be verified:
+
+        - King moves: the destination must not be attacked once the king left its square.
+        - Double check: only the king can move.
+        - Single check: the other pieces must capture the checker or block its ray.
+        - Pins: a pinned piece can only move along the line between its king and the pinning slider.
+        - En passant: both pawns leave their row at once, so the king is tested against sliders directly.
+        - Castling: the king must not be in check or pass through an attacked square.
+    """
+    bitboards = game_state.bitboards
+    pieces = bitboards.pieces
+    us, them = (WHITE, BLACK) if game_state.white_to_move else (BLACK, WHITE)
+    own = bitboards.colors[us]
+    enemy = bitboards.colors[them]
+    occupied = bitboards.occupied
+    king = lsb(pieces[us * 6 + KING])
+
+    checkers = attackers_to(bitboards, king, occupied) & enemy
+    pinned = get_pinned_pieces(bitboards, king, us)
+
+    # king moves, with the king removed so it cannot hide behind itself on a checking ray
+    occupied_without_king = occupied ^ SQUARE_BB[king]
+    targets = KING_ATTACKS[king] & (enemy if captures_only else ~own)
+    safe = 0
+    while targets:
+        low = targets & -targets
+        if not is_square_attacked(bitboards, low.bit_length() - 1, them, occupied_without_king):
+            safe |= low
+        targets ^= low
+    _add_moves(king, safe, enemy, moves)
+
+    if checkers & (checkers - 1):  # double check
+        return checkers
+
+    if checkers:
+        allowed = checkers | BETWEEN[king][lsb(checkers)]
+    else:
+        allowed = FULL_BOARD
+        if not captures_only:
+            castle_moves.get_castle_moves(game_state, king >> 3, king & 7, moves)
+    allowed &= ~own
+    # pawn advances are only kept for promotions, and the other pieces only capture
+    push_allowed = allowed & PROMOTION_ROWS if captures_only else allowed
+    if captures_only:
+        allowed &= enemy
+
+    # knights, a pinned knight can never move
+    knights = pieces[us * 6 + KNIGHT] & ~pinned
+    while knights:
+        low = knights & -knights
+        square = low.bit_length() - 1
+        _add_moves(square, KNIGHT_ATTACKS[square] & allowed, enemy, moves)
+        knights ^= low
+
+    # sliders, a pinned slider keeps moving along the pin line
+    for kinds, slider_attacks in (((BISHOP, QUEEN), bishop_attacks), ((ROOK, QUEEN), rook_attacks)):
+        sliders = pieces[us * 6 + kinds[0]] | pieces[us * 6 + kinds[1]]
+        while sliders:
+            low = sliders & -sliders
+            square = low.bit_length() - 1
+            targets = slider_attacks(square, occupied) & allowed
+            if pinned & low:
+                targets &= LINE[king][square]
+            _add_moves(square, targets, enemy, moves)
+            sliders ^= low
+
+    # pawns
+    forward, start_row = (-8, 6) if us == WHITE else (8, 1)
+    en_passant = game_state.en_passant_square
+    pawns = pieces[us * 6 + PAWN]
+    while pawns:
+        low = pawns & -pawns
+        square = low.bit_length() - 1
+        pawn_allowed, pawn_push_allowed = ((allowed & LINE[king][square], push_allowed & LINE[king][square])
+                                           if pinned & low else (allowed, push_allowed))
+
+        one = square + forward
+        if not occupied & SQUARE_BB[one]:  # one square pawn advance
+            _add_pawn_moves(square, SQUARE_BB[one] & pawn_push_allowed, 0, moves)
+            two = one + forward
+            if square >> 3 == start_row and not occupied & SQUARE_BB[two] and pawn_push_allowed & SQUARE_BB[two]:
+                moves.append(square | two << 6 | DOUBLE_PAWN_PUSH << 12)  # two square pawn advance - first move
+
+        _add_pawn_moves(square, PAWN_ATTACKS[us][square] & enemy & pawn_allowed, CAPTURE, moves)
+
+        if en_passant >= 0 and PAWN_ATTACKS[us][square] & SQUARE_BB[en_passant]:
+            captured = en_passant - forward
+            occupied_after = occupied ^ low ^ SQUARE_BB[captured] | SQUARE_BB[en_passant]
+            if not attackers_to(bitboards, king, occupied_after) & enemy & ~SQUARE_BB[captured]:
+                moves.append(square | en_passant << 6 | EN_PASSANT << 12)
+        pawns ^= low
+
+    return checkers
+
+
+def generate_legal_captures(game_state, moves):
+    """
+        Generate the legal captures and promotions of the side to move, for the quiescence search.
+
+        Args:
+            game_state (GameState): The current game state.
+            moves (array): Move buffer, usually an array('H'), to store the generated move codes.
+
+        Returns:
+            int: The bitboard of the enemy pieces giving check, 0 if the side to move is not in check.
+
+        Quiet moves are never generated, rather than generated and filtered out: the king and the pieces only target
+        enemy squares, pawns only advance to the last row, and castling is skipped.
+    """
+    return generate_legal_moves(game_state, moves, captures_only=True)
@@ -1,32 +1,65 @@
+# Moves are encoded in 16 bits: the start square (bits 0-5), the end square (bits 6-11) and four flag bits (12-15).
+# The flag bit 4 marks captures and the flag bit 8 promotions, whose last two bits select the promoted piece.
+QUIET, DOUBLE_PAWN_PUSH, KING_CASTLE, QUEEN_CASTLE, CAPTURE, EN_PASSANT = 0, 1, 2, 3, 4, 5
+PROMOTION = 8
+PROMOTION_PIECES = "NBRQ"  # promoted piece of the flags 0-3 (the piece type is KNIGHT + flags & 3)
+NULL_MOVE = 0  # a1 to a1 in theory, never a legal move: the code of a pass, used by the null move search
+
+
+def encode_move(start, end, flags=QUIET):
+    """
+    Pack a move into its 16-bit code.
+
+    Args:
+        start (int): The start square index (row * 8 + col).
+        end (int): The end square index.
+        flags (int): The move flags.
+
+    Returns:
+        int: The move code.
+    """
+    return start | end << 6 | flags << 12
+
+
 class Move:
     """
     Represents a chess move.
 
+    The engine works on 16-bit move codes (see encode_move), Move objects are only created for the user interface
+    and the notation, with Move.from_code or from the squares clicked on the board.
+
     Attributes:
+        code (int): The 16-bit code of the move.
         start_row (int): Starting row of the move.
         start_col (int): Starting column of the move.
         end_row (int): Ending row of the move.
         end_col (int): Ending column of the move.
         piece_moved (str): Piece being moved (e.g., 'wp' for white pawn).
         piece_captured (str): Piece captured during the move.
-        move_id (int): Unique identifier for the move.
+        move_id (int): Unique identifier for the move, the code without the capture, castle and en passant flags.
         is_pawn_promotion (bool): Indicates if the move is a pawn promotion.
+        promotion_piece (str): The piece type a pawn is promoted to ('Q', 'R', 'B' or 'N'), None if not a promotion.
         is_en_passant_move (bool): Indicates if the move is an en passant capture.
         is_castle_move (bool): Indicates if the move is a castling move.
 
     Methods:
+        from_code(code, board): Creates the Move object of a move code.
         __eq__(self, other): Overrides the equals method for Move objects.
         get_chess_notation(self): Returns the move in chess notation.
         get_rank_file(self, row, col): Converts row and column to chess rank and file notation.
 
     """
+    __slots__ = ("code", "start_row", "start_col", "end_row", "end_col", "piece_moved", "piece_captured", "move_id",
+                 "is_pawn_promotion", "promotion_piece", "is_en_passant_move", "is_castle_move")
+
     ranks_to_rows = {"1": 7, "2": 6, "3": 5, "4": 4, "5": 3, "6": 2, "7": 1, "8": 0}
     rows_to_ranks = {v: k for k, v in ranks_to_rows.items()}
 
     files_to_cols = {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4, "f": 5, "g": 6, "h": 7}
     cols_to_files = {v: k for k, v in files_to_cols.items()}
 
-    def __init__(self, start_square, end_square, board, enpassant_possible=False, is_castle_move=False):
+    def __init__(self, start_square, end_square, board, enpassant_possible=False, is_castle_move=False,
+                 promotion_piece='Q'):
         """
         Initializes a Move object.
 
@@ -36,25 +69,74 @@ class Move:
             board (list): The current chess board.
             enpassant_possible (bool): Indicates if en passant capture is possible.
             is_castle_move (bool): Indicates if the move is a castling move.
+            promotion_piece (str): The piece type a pawn reaching the last row is promoted to.
+
+        """
+        start_row, start_col = start_square
+        end_row, end_col = end_square
+        piece_moved = board[start_row][start_col]
+
+        if is_castle_move:
+            flags = KING_CASTLE if end_col > start_col else QUEEN_CASTLE
+        elif enpassant_possible:
+            flags = EN_PASSANT
+        else:
+            flags = CAPTURE if board[end_row][end_col] != "--" else QUIET
+            if piece_moved[1] == 'p':
+                if end_row == 0 or end_row == 7:
+                    flags |= PROMOTION | PROMOTION_PIECES.index(promotion_piece)
+                elif abs(end_row - start_row) == 2:
+                    flags = DOUBLE_PAWN_PUSH
+
+        self._load(encode_move(start_row * 8 + start_col, end_row * 8 + end_col, flags), board)
+
+    @classmethod
+    def from_code(cls, code, board):
+        """
+        Creates the Move object of a move code.
+
+        Args:
+            code (int): The 16-bit move code.
+            board (list): The chess board before the move.
+
+        Returns:
+            Move: The move object.
+
+        """
+        move = cls.__new__(cls)
+        move._load(code, board)
+        return move
+
+    def _load(self, code, board):
+        """
+        Fills the attributes of the move from its code.
+
+        Args:
+            code (int): The 16-bit move code.
+            board (list): The chess board before the move.
 
         """
-        self.start_row, self.start_col = start_square
-        self.end_row, self.end_col = end_square
+        flags = code >> 12
+        self.code = code
+        self.start_row = start_row = code >> 3 & 7
+        self.start_col = start_col = code & 7
+        self.end_row = end_row = code >> 9 & 7
+        self.end_col = end_col = code >> 6 & 7
 
-        self.piece_moved = board[self.start_row][self.start_col]
-        self.piece_captured = board[self.end_row][self.end_col]
+        self.piece_moved = board[start_row][start_col]
+        self.piece_captured = board[end_row][end_col]
 
-        self.move_id = self.start_row * 1000 + self.start_col * 100 + self.end_row * 10 + self.end_col
+        # promotions keep their piece in the id, so a move clicked on the board matches the queen promotion
+        self.move_id = code & 0xFFF | (code & 0xB000 if flags & PROMOTION else 0)
 
-        self.is_pawn_promotion = False
-        if (self.piece_moved == 'wp' and self.end_row == 0) or (self.piece_moved == 'bp' and self.end_row == 7):
-            self.is_pawn_promotion = True
+        self.is_pawn_promotion = bool(flags & PROMOTION)
+        self.promotion_piece = PROMOTION_PIECES[flags & 3] if self.is_pawn_promotion else None
 
-        self.is_en_passant_move = enpassant_possible
+        self.is_en_passant_move = flags == EN_PASSANT
         if self.is_en_passant_move:
             self.piece_captured = 'wp' if self.piece_moved == 'bp' else 'bp'
 
-        self.is_castle_move = is_castle_move
+        self.is_castle_move = flags == KING_CASTLE or flags == QUEEN_CASTLE
 
     def __eq__(self, other):
         """
@@ -76,10 +158,13 @@ class Move:
         Returns the move in chess notation.
 
         Returns:
-            str: Chess notation for the move.
+            str: Chess notation for the move, followed by the promoted piece for promotions (e.g. 'e7e8q').
 
         """
-        return self.get_rank_file(self.start_row, self.start_col) + self.get_rank_file(self.end_row, self.end_col)
+        notation = self.get_rank_file(self.start_row, self.start_col) + self.get_rank_file(self.end_row, self.end_col)
+        if self.is_pawn_promotion:
+            notation += self.promotion_piece.lower()
+        return notation
 
     def get_rank_file(self, row, col):
         """
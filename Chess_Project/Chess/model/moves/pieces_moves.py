@@ -1,9 +1,48 @@
 from .move_class import Move
-from ..game_state_class import GameState
-import random
+from .attacks import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, rook_attacks, bishop_attacks, queen_attacks
+from ..bitboard import WHITE, BLACK, SQUARE_BB
 
 
-def get_pawn_moves(game_state: GameState, r, c, moves):
+def add_target_moves(game_state, r, c, targets, moves):
+    """
+        Add a move from the square (r, c) to every square of a target bitboard.
+
+        Args:
+            game_state (GameState): The current game state.
+            r (int): Row of the moving piece.
+            c (int): Column of the moving piece.
+            targets (int): Bitboard of the destination squares.
+            moves (list): List to store the generated moves.
+
+        The moves are added from the lowest square index to the highest, which is the order of a row by row scan
+        of the board.
+    """
+    board = game_state.board
+    while targets:
+        low = targets & -targets
+        target = low.bit_length() - 1
+        moves.append(Move((r, c), (target >> 3, target & 7), board))
+        targets ^= low
+
+
+def add_pawn_move(board, start, end, moves):
+    """
+        Add a pawn move, or a move for every piece the pawn can become if it reaches the last row.
+
+        Args:
+            board (list): The current chess board.
+            start (tuple): Starting square of the pawn (row, column).
+            end (tuple): Ending square of the pawn (row, column).
+            moves (list): List to store the generated moves.
+    """
+    if end[0] == 0 or end[0] == 7:
+        for piece in "QRBN":
+            moves.append(Move(start, end, board, promotion_piece=piece))
+    else:
+        moves.append(Move(start, end, board))
+
+
+def get_pawn_moves(game_state, r, c, moves):
     """
        Get all possible moves for a pawn at the given position (r, c).
 
@@ -14,40 +53,30 @@ def get_pawn_moves(game_state: GameState, r, c, moves):
             moves (list): List to store the generated moves.
 
         This method generates all possible moves for a pawn at the specified position on the chessboard.
-        It considers one and two square advances, captures diagonally, and en passant captures.
+        It considers one and two square advances, captures diagonally, en passant captures and the promotions to
+        every piece.
 
     """
-    if game_state.white_to_move:
-        if game_state.board[r - 1][c] == "--":  # one square pawn advance
-            moves.append(Move((r, c), (r - 1, c), game_state.board))
-            if r == 6 and game_state.board[r - 2][c] == "--":
-                moves.append(Move((r, c), (r - 2, c), game_state.board))  # two square pawn advance - first move
-        if c - 1 >= 0:
-            if game_state.board[r - 1][c - 1][0] == 'b':
-                moves.append(Move((r, c), (r - 1, c - 1), game_state.board))
-            elif (r - 1, c - 1) == game_state.en_passant_possible:
-                moves.append(Move((r, c), (r - 1, c - 1), game_state.board, enpassant_possible=True))
-
-        if c + 1 <= 7:
-            if game_state.board[r - 1][c + 1][0] == 'b':
-                moves.append(Move((r, c), (r - 1, c + 1), game_state.board))
-            elif (r - 1, c + 1) == game_state.en_passant_possible:
-                moves.append(Move((r, c), (r - 1, c + 1), game_state.board, enpassant_possible=True))
-    else:
-        if game_state.board[r + 1][c] == "--":  # one square pawn advance
-            moves.append(Move((r, c), (r + 1, c), game_state.board))
-            if r == 1 and game_state.board[r + 2][c] == "--":
-                moves.append(Move((r, c), (r + 2, c), game_state.board))
-        if c - 1 >= 0:
-            if game_state.board[r + 1][c - 1][0] == 'w':
-                moves.append(Move((r, c), (r + 1, c - 1), game_state.board))
-            elif (r + 1, c - 1) == game_state.en_passant_possible:
-                moves.append(Move((r, c), (r + 1, c - 1), game_state.board, enpassant_possible=True))
-        if c + 1 <= 7:
-            if game_state.board[r + 1][c + 1][0] == 'w':
-                moves.append(Move((r, c), (r + 1, c + 1), game_state.board))
-            elif (r + 1, c + 1) == game_state.en_passant_possible:
-                moves.append(Move((r, c), (r + 1, c + 1), game_state.board, enpassant_possible=True))
+    bitboards = game_state.bitboards
+    board = game_state.board
+    us, them = (WHITE, BLACK) if game_state.white_to_move else (BLACK, WHITE)
+    forward, start_row = (-1, 6) if us == WHITE else (1, 1)
+
+    if not bitboards.occupied & SQUARE_BB[(r + forward) * 8 + c]:  # one square pawn advance
+        add_pawn_move(board, (r, c), (r + forward, c), moves)
+        if r == start_row and not bitboards.occupied & SQUARE_BB[(r + 2 * forward) * 8 + c]:
+            moves.append(Move((r, c), (r + 2 * forward, c), board))  # two square pawn advance - first move
+
+    targets = PAWN_ATTACKS[us][r * 8 + c]
+    while targets:
+        low = targets & -targets
+        target_square = low.bit_length() - 1
+        target = (target_square >> 3, target_square & 7)
+        if bitboards.colors[them] & low:
+            add_pawn_move(board, (r, c), target, moves)
+        elif target == game_state.en_passant_possible:
+            moves.append(Move((r, c), target, board, enpassant_possible=True))
+        targets ^= low
 
 
 def get_rook_moves(game_state, r, c, moves):
@@ -63,72 +92,9 @@ def get_rook_moves(game_state, r, c, moves):
         This method generates all possible moves for a rook at the specified position on the chessboard.
         It considers moves along the rows and columns until it encounters a piece or the edge of the board.
     """
-    if game_state.white_to_move:
-        for row in range(r-1, -1, -1):
-            if game_state.board[row][c] == "--":
-                moves.append(Move((r, c), (row, c), game_state.board))
-            elif game_state.board[row][c][0] == 'b':
-                moves.append(Move((r, c), (row, c), game_state.board))
-                break
-            else:
-                break
-        for row in range(r+1, 8):
-            if game_state.board[row][c] == "--":
-                moves.append(Move((r, c), (row, c), game_state.board))
-            elif game_state.board[row][c][0] == 'b':
-                moves.append(Move((r, c), (row, c), game_state.board))
-                break
-            else:
-                break
-        for col in range(c-1, -1, -1):
-            if game_state.board[r][col] == "--":
-                moves.append(Move((r, c), (r, col), game_state.board))
-            elif game_state.board[r][col][0] == 'b':
-                moves.append(Move((r, c), (r, col), game_state.board))
-                break
-            else:
-                break
-        for col in range(c+1, 8):
-            if game_state.board[r][col] == "--":
-                moves.append(Move((r, c), (r, col), game_state.board))
-            elif game_state.board[r][col][0] == 'b':
-                moves.append(Move((r, c), (r, col), game_state.board))
-                break
-            else:
-                break
-    else:
-        for row in range(r-1, -1, -1):
-            if game_state.board[row][c] == "--":
-                moves.append(Move((r, c), (row, c), game_state.board))
-            elif game_state.board[row][c][0] == 'w':
-                moves.append(Move((r, c), (row, c), game_state.board))
-                break
-            else:
-                break
-        for row in range(r+1, 8):
-            if game_state.board[row][c] == "--":
-                moves.append(Move((r, c), (row, c), game_state.board))
-            elif game_state.board[row][c][0] == 'w':
-                moves.append(Move((r, c), (row, c), game_state.board))
-                break
-            else:
-                break
-        for col in range(c-1, -1, -1):
-            if game_state.board[r][col] == "--":
-                moves.append(Move((r, c), (r, col), game_state.board))
-            elif game_state.board[r][col][0] == 'w':
-                moves.append(Move((r, c), (r, col), game_state.board))
-                break
-            else:
-                break
-        for col in range(c+1, 8):
-            if game_state.board[r][col] == "--":
-                moves.append(Move((r, c), (r, col), game_state.board))
-            elif game_state.board[r][col][0] == 'w':
-                moves.append(Move((r, c), (r, col), game_state.board))
-                break
-            else:
-                break
+    bitboards = game_state.bitboards
+    own = bitboards.colors[WHITE if game_state.white_to_move else BLACK]
+    add_target_moves(game_state, r, c, rook_attacks(r * 8 + c, bitboards.occupied) & ~own, moves)
 
 
 def get_knight_moves(game_state, r, c, moves):
@@ -145,88 +111,8 @@ def get_knight_moves(game_state, r, c, moves):
         It considers all eight possible knight moves, checking for validity and capturing opponent pieces.
 
         """
-    if game_state.white_to_move:
-        if r-2 >= 0 and c-1 >= 0:
-            if game_state.board[r-2][c-1] == "--":
-                moves.append(Move((r, c), (r-2, c-1), game_state.board))
-            elif game_state.board[r-2][c-1][0] == 'b':
-                moves.append(Move((r, c), (r-2, c-1), game_state.board))
-        if r-2 >= 0 and c+1 <= 7:
-            if game_state.board[r-2][c+1] == "--":
-                moves.append(Move((r, c), (r-2, c+1), game_state.board))
-            elif game_state.board[r-2][c+1][0] == 'b':
-                moves.append(Move((r, c), (r-2, c+1), game_state.board))
-        if r-1 >= 0 and c-2 >= 0:
-            if game_state.board[r-1][c-2] == "--":
-                moves.append(Move((r, c), (r-1, c-2), game_state.board))
-            elif game_state.board[r-1][c-2][0] == 'b':
-                moves.append(Move((r, c), (r-1, c-2), game_state.board))
-        if r-1 >= 0 and c+2 <= 7:
-            if game_state.board[r-1][c+2] == "--":
-                moves.append(Move((r, c), (r-1, c+2), game_state.board))
-            elif game_state.board[r-1][c+2][0] == 'b':
-                moves.append(Move((r, c), (r-1, c+2), game_state.board))
-        if r+1 <= 7 and c-2 >= 0:
-            if game_state.board[r+1][c-2] == "--":
-                moves.append(Move((r, c), (r+1, c-2), game_state.board))
-            elif game_state.board[r+1][c-2][0] == 'b':
-                moves.append(Move((r, c), (r+1, c-2), game_state.board))
-        if r+1 <= 7 and c+2 <= 7:
-            if game_state.board[r+1][c+2] == "--":
-                moves.append(Move((r, c), (r+1, c+2), game_state.board))
-            elif game_state.board[r+1][c+2][0] == 'b':
-                moves.append(Move((r, c), (r+1, c+2), game_state.board))
-        if r+2 <= 7 and c-1 >= 0:
-            if game_state.board[r+2][c-1] == "--":
-                moves.append(Move((r, c), (r+2, c-1), game_state.board))
-            elif game_state.board[r+2][c-1][0] == 'b':
-                moves.append(Move((r, c), (r+2, c-1), game_state.board))
-        if r+2 <= 7 and c+1 <= 7:
-            if game_state.board[r+2][c+1] == "--":
-                moves.append(Move((r, c), (r+2, c+1), game_state.board))
-            elif game_state.board[r+2][c+1][0] == 'b':
-                moves.append(Move((r, c), (r+2, c+1), game_state.board))
-    else:
-        if r-2 >= 0 and c-1 >= 0:
-            if game_state.board[r-2][c-1] == "--":
-                moves.append(Move((r, c), (r-2, c-1), game_state.board))
-            elif game_state.board[r-2][c-1][0] == 'w':
-                moves.append(Move((r, c), (r-2, c-1), game_state.board))
-        if r-2 >= 0 and c+1 <= 7:
-            if game_state.board[r-2][c+1] == "--":
-                moves.append(Move((r, c), (r-2, c+1), game_state.board))
-            elif game_state.board[r-2][c+1][0] == 'w':
-                moves.append(Move((r, c), (r-2, c+1), game_state.board))
-        if r-1 >= 0 and c-2 >= 0:
-            if game_state.board[r-1][c-2] == "--":
-                moves.append(Move((r, c), (r-1, c-2), game_state.board))
-            elif game_state.board[r-1][c-2][0] == 'w':
-                moves.append(Move((r, c), (r-1, c-2), game_state.board))
-        if r-1 >= 0 and c+2 <= 7:
-            if game_state.board[r-1][c+2] == "--":
-                moves.append(Move((r, c), (r-1, c+2), game_state.board))
-            elif game_state.board[r-1][c+2][0] == 'w':
-                moves.append(Move((r, c), (r-1, c+2), game_state.board))
-        if r+1 <= 7 and c-2 >= 0:
-            if game_state.board[r+1][c-2] == "--":
-                moves.append(Move((r, c), (r+1, c-2), game_state.board))
-            elif game_state.board[r+1][c-2][0] == 'w':
-                moves.append(Move((r, c), (r+1, c-2), game_state.board))
-        if r+1 <= 7 and c+2 <= 7:
-            if game_state.board[r+1][c+2] == "--":
-                moves.append(Move((r, c), (r+1, c+2), game_state.board))
-            elif game_state.board[r+1][c+2][0] == 'w':
-                moves.append(Move((r, c), (r+1, c+2), game_state.board))
-        if r+2 <= 7 and c-1 >= 0:
-            if game_state.board[r+2][c-1] == "--":
-                moves.append(Move((r, c), (r+2, c-1), game_state.board))
-            elif game_state.board[r+2][c-1][0] == 'w':
-                moves.append(Move((r, c), (r+2, c-1), game_state.board))
-        if r+2 <= 7 and c+1 <= 7:
-            if game_state.board[r+2][c+1] == "--":
-                moves.append(Move((r, c), (r+2, c+1), game_state.board))
-            elif game_state.board[r+2][c+1][0] == 'w':
-                moves.append(Move((r, c), (r+2, c+1), game_state.board))
+    own = game_state.bitboards.colors[WHITE if game_state.white_to_move else BLACK]
+    add_target_moves(game_state, r, c, KNIGHT_ATTACKS[r * 8 + c] & ~own, moves)
 
 
 def get_bishop_moves(game_state, r, c, moves):
@@ -243,80 +129,9 @@ def get_bishop_moves(game_state, r, c, moves):
             It considers all diagonal moves, checking for validity and capturing opponent pieces.
 
     """
-    if game_state.white_to_move:
-        for i in range(1, 8):
-            if r-i >= 0 and c-i >= 0:
-                if game_state.board[r-i][c-i] == "--":
-                    moves.append(Move((r, c), (r-i, c-i), game_state.board))
-                elif game_state.board[r-i][c-i][0] == 'b':
-                    moves.append(Move((r, c), (r-i, c-i), game_state.board))
-                    break
-                else:
-                    break
-        for i in range(1, 8):
-            if r-i >= 0 and c+i <= 7:
-                if game_state.board[r-i][c+i] == "--":
-                    moves.append(Move((r, c), (r-i, c+i), game_state.board))
-                elif game_state.board[r-i][c+i][0] == 'b':
-                    moves.append(Move((r, c), (r-i, c+i), game_state.board))
-                    break
-                else:
-                    break
-        for i in range(1, 8):
-            if r+i <= 7 and c-i >= 0:
-                if game_state.board[r+i][c-i] == "--":
-                    moves.append(Move((r, c), (r+i, c-i), game_state.board))
-                elif game_state.board[r+i][c-i][0] == 'b':
-                    moves.append(Move((r, c), (r+i, c-i), game_state.board))
-                    break
-                else:
-                    break
-        for i in range(1, 8):
-            if r+i <= 7 and c+i <= 7:
-                if game_state.board[r+i][c+i] == "--":
-                    moves.append(Move((r, c), (r+i, c+i), game_state.board))
-                elif game_state.board[r+i][c+i][0] == 'b':
-                    moves.append(Move((r, c), (r+i, c+i), game_state.board))
-                    break
-                else:
-                    break
-    else:
-        for i in range(1, 8):
-            if r-i >= 0 and c-i >= 0:
-                if game_state.board[r-i][c-i] == "--":
-                    moves.append(Move((r, c), (r-i, c-i), game_state.board))
-                elif game_state.board[r-i][c-i][0] == 'w':
-                    moves.append(Move((r, c), (r-i, c-i), game_state.board))
-                    break
-                else:
-                    break
-        for i in range(1, 8):
-            if r-i >= 0 and c+i <= 7:
-                if game_state.board[r-i][c+i] == "--":
-                    moves.append(Move((r, c), (r-i, c+i), game_state.board))
-                elif game_state.board[r-i][c+i][0] == 'w':
-                    moves.append(Move((r, c), (r-i, c+i), game_state.board))
-                    break
-                else:
-                    break
-        for i in range(1, 8):
-            if r+i <= 7 and c-i >= 0:
-                if game_state.board[r+i][c-i] == "--":
-                    moves.append(Move((r, c), (r+i, c-i), game_state.board))
-                elif game_state.board[r+i][c-i][0] == 'w':
-                    moves.append(Move((r, c), (r+i, c-i), game_state.board))
-                    break
-                else:
-                    break
-        for i in range(1, 8):
-            if r+i <= 7 and c+i <= 7:
-                if game_state.board[r+i][c+i] == "--":
-                    moves.append(Move((r, c), (r+i, c+i), game_state.board))
-                elif game_state.board[r+i][c+i][0] == 'w':
-                    moves.append(Move((r, c), (r+i, c+i), game_state.board))
-                    break
-                else:
-                    break
+    bitboards = game_state.bitboards
+    own = bitboards.colors[WHITE if game_state.white_to_move else BLACK]
+    add_target_moves(game_state, r, c, bishop_attacks(r * 8 + c, bitboards.occupied) & ~own, moves)
 
 
 def get_queen_moves(game_state, r, c, moves):
@@ -333,8 +148,9 @@ def get_queen_moves(game_state, r, c, moves):
         It combines the moves of a rook and a bishop, checking for validity and capturing opponent pieces.
 
     """
-    game_state.get_rook_moves(r, c, moves)
-    game_state.get_bishop_moves(r, c, moves)
+    bitboards = game_state.bitboards
+    own = bitboards.colors[WHITE if game_state.white_to_move else BLACK]
+    add_target_moves(game_state, r, c, queen_attacks(r * 8 + c, bitboards.occupied) & ~own, moves)
 
 
 def get_king_moves(game_state, r, c, moves):
@@ -351,89 +167,5 @@ def get_king_moves(game_state, r, c, moves):
         It considers the king's possible moves in all directions, checking for validity and capturing opponent pieces.
 
     """
-    if game_state.white_to_move:
-        if r-1 >= 0:
-            if game_state.board[r-1][c] == "--":
-                moves.append(Move((r, c), (r-1, c), game_state.board))
-            elif game_state.board[r-1][c][0] == 'b':
-                moves.append(Move((r, c), (r-1, c), game_state.board))
-        if r-1 >= 0 and c-1 >= 0:
-            if game_state.board[r-1][c-1] == "--":
-                moves.append(Move((r, c), (r-1, c-1), game_state.board))
-            elif game_state.board[r-1][c-1][0] == 'b':
-                moves.append(Move((r, c), (r-1, c-1), game_state.board))
-        if r-1 >= 0 and c+1 <= 7:
-            if game_state.board[r-1][c+1] == "--":
-                moves.append(Move((r, c), (r-1, c+1), game_state.board))
-            elif game_state.board[r-1][c+1][0] == 'b':
-                moves.append(Move((r, c), (r-1, c+1), game_state.board))
-        if c-1 >= 0:
-            if game_state.board[r][c-1] == "--":
-                moves.append(Move((r, c), (r, c-1), game_state.board))
-            elif game_state.board[r][c-1][0] == 'b':
-                moves.append(Move((r, c), (r, c-1), game_state.board))
-        if c+1 <= 7:
-            if game_state.board[r][c+1] == "--":
-                moves.append(Move((r, c), (r, c+1), game_state.board))
-            elif game_state.board[r][c+1][0] == 'b':
-                moves.append(Move((r, c), (r, c+1), game_state.board))
-        if r+1 <= 7:
-            if game_state.board[r+1][c] == "--":
-                moves.append(Move((r, c), (r+1, c), game_state.board))
-            elif game_state.board[r+1][c][0] == 'b':
-                moves.append(Move((r, c), (r+1, c), game_state.board))
-        if r+1 <= 7 and c-1 >= 0:
-            if game_state.board[r+1][c-1] == "--":
-                moves.append(Move((r, c), (r+1, c-1), game_state.board))
-            elif game_state.board[r+1][c-1][0] == 'b':
-                moves.append(Move((r, c), (r+1, c-1), game_state.board))
-        if r+1 <= 7 and c+1 <= 7:
-            if game_state.board[r+1][c+1] == "--":
-                moves.append(Move((r, c), (r+1, c+1), game_state.board))
-            elif game_state.board[r+1][c+1][0] == 'b':
-                moves.append(Move((r, c), (r+1, c+1), game_state.board))
-    else:
-        if r-1 >= 0:
-            if game_state.board[r-1][c] == "--":
-                moves.append(Move((r, c), (r-1, c), game_state.board))
-            elif game_state.board[r-1][c][0] == 'w':
-                moves.append(Move((r, c), (r-1, c), game_state.board))
-        if r-1 >= 0 and c-1 >= 0:
-            if game_state.board[r-1][c-1] == "--":
-                moves.append(Move((r, c), (r-1, c-1), game_state.board))
-            elif game_state.board[r-1][c-1][0] == 'w':
-                moves.append(Move((r, c), (r-1, c-1), game_state.board))
-        if r-1 >= 0 and c+1 <= 7:
-            if game_state.board[r-1][c+1] == "--":
-                moves.append(Move((r, c), (r-1, c+1), game_state.board))
-            elif game_state.board[r-1][c+1][0] == 'w':
-                moves.append(Move((r, c), (r-1, c+1), game_state.board))
-        if c-1 >= 0:
-            if game_state.board[r][c-1] == "--":
-                moves.append(Move((r, c), (r, c-1), game_state.board))
-            elif game_state.board[r][c-1][0] == 'w':
-                moves.append(Move((r, c), (r, c-1), game_state.board))
-        if c+1 <= 7:
-            if game_state.board[r][c+1] == "--":
-                moves.append(Move((r, c), (r, c+1), game_state.board))
-            elif game_state.board[r][c+1][0] == 'w':
-                moves.append(Move((r, c), (r, c+1), game_state.board))
-        if r+1 <= 7:
-            if game_state.board[r+1][c] == "--":
-                moves.append(Move((r, c), (r+1, c), game_state.board))
-            elif game_state.board[r+1][c][0] == 'w':
-                moves.append(Move((r, c), (r+1, c), game_state.board))
-        if r+1 <= 7 and c-1 >= 0:
-            if game_state.board[r+1][c-1] == "--":
-                moves.append(Move((r, c), (r+1, c-1), game_state.board))
-            elif game_state.board[r+1][c-1][0] == 'w':
-                moves.append(Move((r, c), (r+1, c-1), game_state.board))
-        if r+1 <= 7 and c+1 <= 7:
-            if game_state.board[r+1][c+1] == "--":
-                moves.append(Move((r, c), (r+1, c+1), game_state.board))
-            elif game_state.board[r+1][c+1][0] == 'w':
-                moves.append(Move((r, c), (r+1, c+1), game_state.board))
-
-
-def random_move(valid_moves):
-    return valid_moves[random.randint(0, len(valid_moves) - 1)]
+    own = game_state.bitboards.colors[WHITE if game_state.white_to_move else BLACK]
+    add_target_moves(game_state, r, c, KING_ATTACKS[r * 8 + c] & ~own, moves)
@@ -0,0 +1,77 @@
+"""
+Zobrist Module for Chess Game
+
+This module contains the Zobrist hashing of chess positions. Every feature of a position (a piece on a square, the
+side to move, each of the four castling rights, the file of a possible en passant capture) gets a fixed random
+64-bit number, and the key of a position is the XOR of the numbers of its features. Making a move only changes a few
+features, so GameState updates its key incrementally instead of calling compute_key.
+"""
+from .moves.attacks import PAWN_ATTACKS
+from .bitboard import WHITE, BLACK, PAWN, EMPTY
+import random
+
+ZOBRIST_SEED = 0x5EED_C4E55
+
+_rng = random.Random(ZOBRIST_SEED)
+
+# PIECE_KEYS[piece][square], piece being the bitboard piece index (color * 6 + piece type)
+PIECE_KEYS = [[_rng.getrandbits(64) for _ in range(64)] for _ in range(12)]
+
+# XORed in when black is to move
+SIDE_KEY = _rng.getrandbits(64)
+
+# one key for each castling right (WKS, WQS, BKS, BQS), combined for the 16 possible rights bitmasks
+_CASTLING_RIGHT_KEYS = [_rng.getrandbits(64) for _ in range(4)]
+CASTLING_KEYS = [0] * 16
+for _rights in range(16):
+    for _bit in range(4):
+        if _rights >> _bit & 1:
+            CASTLING_KEYS[_rights] ^= _CASTLING_RIGHT_KEYS[_bit]
+
+# EN_PASSANT_KEYS[file] of the en passant square
+EN_PASSANT_KEYS = [_rng.getrandbits(64) for _ in range(8)]
+
+del _rng
+
+
+def en_passant_key(game_state):
+    """
+    Get the en passant part of the key of a position.
+
+    Args:
+        game_state (GameState): The game state to hash.
+
+    Returns:
+        int: The key of the en passant file, 0 if no pawn of the side to move can capture en passant.
+
+    The en passant square is only hashed when a pawn stands next to it, so that a double pawn push nobody can take
+    does not tell two otherwise identical positions apart.
+    """
+    square = game_state.en_passant_square
+    if square < 0:
+        return 0
+    us, them = (WHITE, BLACK) if game_state.white_to_move else (BLACK, WHITE)
+    # the squares a pawn of the side to move captures from are the ones an enemy pawn on the square would attack
+    if PAWN_ATTACKS[them][square] & game_state.bitboards.pieces[us * 6 + PAWN]:
+        return EN_PASSANT_KEYS[square & 7]
+    return 0
+
+
+def compute_key(game_state):
+    """
+    Compute the Zobrist key of a position from scratch.
+
+    Args:
+        game_state (GameState): The game state to hash.
+
+    Returns:
+        int: The 64-bit Zobrist key of the position.
+    """
+    key = 0
+    for square, piece in enumerate(game_state.bitboards.squares):
+        if piece != EMPTY:
+            key ^= PIECE_KEYS[piece][square]
+    if not game_state.white_to_move:
+        key ^= SIDE_KEY
+    key ^= CASTLING_KEYS[game_state.castling_rights]
+    return key ^ en_passant_key(game_state)
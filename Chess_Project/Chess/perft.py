@@ -0,0 +1,386 @@
+"""
+Perft Module for Chess Game
+
+This module counts the leaf nodes of the legal move tree of a position up to a fixed depth (perft), the standard
+way to validate a move generator: the counts of the reference positions are known, and any difference points to a
+bug. The divide output gives the count below every root move, so a wrong count can be narrowed down move by move.
+
+The root moves can be shared among worker processes: every worker rebuilds the position below a root move (or below
+a root move and a reply, when there are few root moves for many workers) from its FEN, and the counts are added up in
+the order of the root moves, so the output does not depend on which worker finishes first.
+
+With --hash, the node counts of the subtrees are kept in a fixed-size table keyed on the Zobrist key and the depth,
+so a position reached again by another move order is counted once.
+
+Usage:
+    python -m Chess_Project.Chess.perft DEPTH [FEN] [--bulk] [--jobs JOBS] [--hash MB]
+
+"""
+from Chess_Project.Chess.model.game_state_class import GameState
+from Chess_Project.Chess.model.moves.move_class import CAPTURE, KING_CASTLE, QUEEN_CASTLE, EN_PASSANT, PROMOTION
+from Chess_Project.Chess.model.fen import START_FEN
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+import argparse
+import os
+import time
+
+
+class PerftStats:
+    """
+    Counts of the leaf nodes of a perft run, by kind of the last move.
+
+    Attributes:
+        nodes (int): The number of leaf nodes.
+        captures (int): The leaf moves capturing a piece, en passant included.
+        en_passants (int): The en passant captures.
+        castles (int): The castling moves.
+        promotions (int): The promotions.
+        checks (int): The leaf moves giving check.
+        mates (int): The leaf moves giving checkmate.
+
+    Methods:
+        add(other): Adds the counts of another PerftStats.
+    """
+    FIELDS = ("nodes", "captures", "en_passants", "castles", "promotions", "checks", "mates")
+
+    def __init__(self):
+        """
+        Initializes all the counts to zero.
+        """
+        self.nodes = 0
+        self.captures = 0
+        self.en_passants = 0
+        self.castles = 0
+        self.promotions = 0
+        self.checks = 0
+        self.mates = 0
+
+    def add(self, other):
+        """
+        Adds the counts of another PerftStats to this one.
+
+        Args:
+            other (PerftStats): The counts to add.
+        """
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+
+class PerftTable:
+    """
+    Fixed-size hash table of the node counts of perft subtrees.
+
+    The table is made of two-entry buckets stored in two arrays of 64-bit integers: the Zobrist keys, and the node
+    count shifted left by 8 bits with the depth in the low byte. The first entry of a bucket keeps the deepest
+    subtree, the most expensive to count again, and the second one always takes the newest subtree otherwise.
+
+    Attributes:
+        size (int): The number of entries, a power of two.
+        keys (array): The Zobrist keys of the entries.
+        values (array): The node counts and depths of the entries.
+        probes (int): The number of lookups.
+        hits (int): The number of lookups which found the subtree.
+
+    Methods:
+        probe(key, depth): Returns the node count of a subtree, -1 if it is not in the table.
+        store(key, depth, nodes): Stores the node count of a subtree.
+    """
+    ENTRY_BYTES = 16
+
+    def __init__(self, megabytes):
+        """
+        Allocates the table.
+
+        Args:
+            megabytes (float): The memory budget; the size is rounded down to a power of two entries.
+        """
+        entries = max(2, int(megabytes * 1024 * 1024) // self.ENTRY_BYTES)
+        self.size = 1 << (entries.bit_length() - 1)
+        self.keys = array('Q', bytes(8 * self.size))
+        self.values = array('Q', bytes(8 * self.size))
+        self.probes = 0
+        self.hits = 0
+
+    def probe(self, key, depth):
+        """
+        Looks up the node count of a subtree.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            depth (int): The depth of the subtree.
+
+        Returns:
+            int: The node count, -1 if the subtree is not in the table.
+        """
+        self.probes += 1
+        index = key & (self.size - 2)
+        for slot in (index, index + 1):
+            value = self.values[slot]
+            if self.keys[slot] == key and value & 0xFF == depth:
+                self.hits += 1
+                return value >> 8
+        return -1
+
+    def store(self, key, depth, nodes):
+        """
+        Stores the node count of a subtree.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            depth (int): The depth of the subtree.
+            nodes (int): The node count.
+        """
+        index = key & (self.size - 2)
+        if depth < self.values[index] & 0xFF:
+            index += 1
+        self.keys[index] = key
+        self.values[index] = nodes << 8 | depth
+
+
+def count_leaf(game_state, code, stats):
+    """
+    Count a leaf move in the perft statistics, once it has been made.
+
+    Args:
+        game_state (GameState): The game state, after the move.
+        code (int): The 16-bit code of the move.
+        stats (PerftStats): The counts to update.
+    """
+    flags = code >> 12
+    stats.nodes += 1
+    if flags & CAPTURE:
+        stats.captures += 1
+        if flags == EN_PASSANT:
+            stats.en_passants += 1
+    if flags == KING_CASTLE or flags == QUEEN_CASTLE:
+        stats.castles += 1
+    if flags & PROMOTION:
+        stats.promotions += 1
+    if game_state.in_check():
+        stats.checks += 1
+        replies = array('H')
+        game_state.generate_moves(replies)
+        if not replies:
+            stats.mates += 1
+
+
+def perft(game_state, depth, stats=None, table=None):
+    """
+    Count the leaf nodes of the legal move tree of a position.
+
+    Args:
+        game_state (GameState): The position to explore, left unchanged.
+        depth (int): The depth of the tree, in plies.
+        stats (PerftStats): The counts to update with the leaf moves, None to only count the nodes.
+        table (PerftTable): The table of the subtree counts, only used without statistics, None for no table.
+
+    Returns:
+        int: The number of leaf nodes.
+
+    Without statistics the last ply is counted in bulk, as the length of the move list, which does not make the
+    leaf moves at all.
+    """
+    if depth == 0:
+        if stats is not None:
+            stats.nodes += 1
+        return 1
+    if table is not None and depth > 1:
+        nodes = table.probe(game_state.zobrist_key, depth)
+        if nodes >= 0:
+            return nodes
+    moves = array('H')
+    game_state.generate_moves(moves)
+    if depth == 1 and stats is None:
+        return len(moves)
+
+    nodes = 0
+    for code in moves:
+        game_state.push_move(code)
+        if depth == 1:
+            count_leaf(game_state, code, stats)
+            nodes += 1
+        else:
+            nodes += perft(game_state, depth - 1, stats, table)
+        game_state.pop_move()
+    if table is not None:
+        table.store(game_state.zobrist_key, depth, nodes)
+    return nodes
+
+
+def divide(game_state, depth, stats=None, table=None):
+    """
+    Count the leaf nodes below every root move.
+
+    Args:
+        game_state (GameState): The position to explore, left unchanged.
+        depth (int): The depth of the tree, in plies, at least 1.
+        stats (PerftStats): The counts to update with the leaf moves, None to only count the nodes.
+        table (PerftTable): The table of the subtree counts, None for no table.
+
+    Returns:
+        list: (notation, nodes) pairs, one per legal root move, in generation order.
+
+    The root moves go through get_valid_moves, make_move and undo_move, as in a game, and the subtrees below them
+    through the move codes those methods are built on.
+    """
+    results = []
+    for move in game_state.get_valid_moves():
+        game_state.make_move(move)
+        if depth == 1:
+            if stats is not None:
+                count_leaf(game_state, move.code, stats)
+            nodes = 1
+        else:
+            nodes = perft(game_state, depth - 1, stats, table)
+        game_state.undo_move()
+        results.append((move.get_chess_notation(), nodes))
+    return results
+
+
+# the hash table of the current worker process, kept from one task to the next
+_worker_table = None
+
+
+def perft_task(fen, depth, with_stats, hash_megabytes=0):
+    """
+    Run perft on a position shipped to a worker process.
+
+    Args:
+        fen (str): The position in FEN.
+        depth (int): The depth of the tree, in plies, at least 1.
+        with_stats (bool): True to count the leaf moves by kind.
+        hash_megabytes (float): The size of the hash table of the worker, 0 for no table.
+
+    Returns:
+        tuple: (nodes, stats, probes, hits), stats being a PerftStats or None, probes and hits the hash table
+        lookups made by the task.
+    """
+    global _worker_table
+    if hash_megabytes and _worker_table is None:
+        _worker_table = PerftTable(hash_megabytes)
+    table = _worker_table if hash_megabytes else None
+    probes, hits = (table.probes, table.hits) if table is not None else (0, 0)
+
+    stats = PerftStats() if with_stats else None
+    nodes = perft(GameState(fen), depth, stats, table)
+    if table is not None:
+        probes, hits = table.probes - probes, table.hits - hits
+    return nodes, stats, probes, hits
+
+
+def parallel_divide(game_state, depth, jobs, stats=None, hash_megabytes=0):
+    """
+    Count the leaf nodes below every root move, sharing the subtrees among worker processes.
+
+    Args:
+        game_state (GameState): The position to explore, left unchanged.
+        depth (int): The depth of the tree, in plies, at least 2.
+        jobs (int): The number of worker processes.
+        stats (PerftStats): The counts to update with the leaf moves, None to only count the nodes.
+        hash_megabytes (float): The size of the hash table of every worker, 0 for no table.
+
+    Returns:
+        tuple: (results, probes, hits), results being (notation, nodes) pairs, one per legal root move, in
+        generation order, and probes and hits the hash table lookups of all the workers.
+
+    The work is split at the root, or two plies deep when there are fewer than four root moves per worker and the
+    tree is deep enough. The tasks are FEN strings rather than pickled game states, and their results are merged
+    in task order.
+    """
+    moves = game_state.get_valid_moves()
+    split_replies = depth >= 3 and len(moves) < 4 * jobs
+    roots = []
+    task_roots, fens = [], []
+    for move in moves:
+        game_state.make_move(move)
+        if split_replies:
+            replies = array('H')
+            game_state.generate_moves(replies)
+            for code in replies:
+                game_state.push_move(code)
+                task_roots.append(len(roots))
+                fens.append(game_state.to_fen())
+                game_state.pop_move()
+        else:
+            task_roots.append(len(roots))
+            fens.append(game_state.to_fen())
+        game_state.undo_move()
+        roots.append(move.get_chess_notation())
+
+    task_depth = depth - 2 if split_replies else depth - 1
+    counts = [0] * len(roots)
+    probes = hits = 0
+    chunk_size = max(1, len(fens) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(perft_task, fens, [task_depth] * len(fens), [stats is not None] * len(fens),
+                               [hash_megabytes] * len(fens), chunksize=chunk_size)
+        for root, (nodes, task_stats, task_probes, task_hits) in zip(task_roots, results):
+            counts[root] += nodes
+            probes += task_probes
+            hits += task_hits
+            if stats is not None:
+                stats.add(task_stats)
+    return list(zip(roots, counts)), probes, hits
+
+
+def main(argv=None):
+    """
+    Run perft on a position and print the divide, the total, the statistics and the node rate.
+
+    Args:
+        argv (list): The command line arguments, sys.argv when None.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Count the leaf nodes of the legal move tree of a position.")
+    parser.add_argument("depth", type=int, help="depth of the tree, in plies")
+    parser.add_argument("fen", nargs="?", default=START_FEN, help="position in FEN (the starting position by default)")
+    parser.add_argument("--bulk", action="store_true",
+                        help="only count the nodes, counting the last ply in bulk, which is much faster")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="number of worker processes, 0 for one per CPU (default: 1, no worker)")
+    parser.add_argument("--hash", type=float, default=0, metavar="MB",
+                        help="size of the hash table of the subtree counts, per process, requires --bulk "
+                             "(default: 0, no table)")
+    args = parser.parse_args(argv)
+    if args.depth < 1:
+        parser.error("the depth must be at least 1")
+    if args.hash < 0:
+        parser.error("the hash table size cannot be negative")
+    if args.hash and not args.bulk:
+        parser.error("the hash table only stores node counts, use --hash with --bulk")
+    try:
+        game_state = GameState(args.fen)
+    except ValueError as error:
+        parser.error(str(error))
+
+    jobs = args.jobs or os.cpu_count() or 1
+    stats = None if args.bulk else PerftStats()
+    start = time.perf_counter()
+    if jobs > 1 and args.depth > 1:
+        results, probes, hits = parallel_divide(game_state, args.depth, jobs, stats, args.hash)
+    else:
+        table = PerftTable(args.hash) if args.hash else None
+        results = divide(game_state, args.depth, stats, table)
+        probes, hits = (table.probes, table.hits) if table is not None else (0, 0)
+    elapsed = time.perf_counter() - start
+
+    nodes = sum(count for _, count in results)
+    for notation, count in results:
+        print(f"{notation}: {count}")
+    print()
+    print(f"moves: {len(results)}")
+    print(f"nodes: {nodes}")
+    if stats is not None:
+        for field in PerftStats.FIELDS[1:]:
+            print(f"{field.replace('_', ' ')}: {getattr(stats, field)}")
+    if args.hash:
+        print(f"hash hits: {hits}/{probes} ({hits / probes if probes else 0:.1%})")
+    print(f"time: {elapsed:.3f}s")
+    print(f"nodes/s: {nodes / elapsed if elapsed > 0 else 0:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Board Renderer Module for Chess Game
+
+This module contains the retained-mode renderer of the game screen. Instead of redrawing the whole board and move log
+on every frame, it remembers what it drew last: the piece and the highlight of every square, the move log and the
+end of game state. Every frame it only redraws what changed and returns the changed areas, which the game loop
+passes to pygame.display.update instead of flipping the whole display, so an idle board costs almost nothing.
+
+The renderer also plays the move animations: while a piece moves, only the squares it leaves are redrawn before the
+piece is drawn at its new location.
+
+Usage:
+    renderer = BoardRenderer()
+    p.display.update(renderer.render(screen, game_state, square_selected))
+"""
+import pygame as p
+
+from .board_rendering import DIMENSION, SQ_SIZE, IMAGES, draw_square, draw_background, highlighted_squares
+from .move_log_panel import MoveLogPanel
+from .move_animation import MoveAnimator
+
+
+class BoardRenderer:
+    """
+    Draws the game screen, redrawing only the squares and panels which changed since the previous frame.
+
+    Attributes:
+        - drawn_squares (list): The (piece, highlight) drawn on every square, by row and column.
+        - move_log (MoveLogPanel): The move log panel, following the move log of the game.
+        - drawn_log (int): The version of the move log panel drawn.
+        - drawn_state (tuple): The summary of the last frame drawn, to skip the comparisons when nothing changed.
+        - animator (MoveAnimator): The move animations to play.
+        - drawn_piece (pygame.Rect): The area of the moving piece drawn at the last frame, None if none was.
+        - full_redraw (bool): True when the whole screen must be redrawn at the next frame.
+
+    Methods:
+        - invalidate(): Forces a full redraw at the next frame.
+        - render(screen, game_state, square_selected): Draws the changes and returns the changed areas.
+    """
+
+    def __init__(self):
+        """
+        Initialize the renderer; the first frame is a full redraw.
+        """
+        self.drawn_squares = [[None] * DIMENSION for _ in range(DIMENSION)]
+        self.move_log = MoveLogPanel()
+        self.drawn_log = None
+        self.drawn_state = None
+        self.animator = MoveAnimator()
+        self.drawn_piece = None
+        self.full_redraw = True
+
+    def invalidate(self):
+        """
+        Force a full redraw at the next frame, after something else drew on the screen (a new display mode, an
+        animation).
+        """
+        self.full_redraw = True
+
+    def render(self, screen, game_state, square_selected):
+        """
+        Draw what changed since the previous frame.
+
+        Parameters:
+        - screen (pygame.Surface): The game screen.
+        - game_state (GameState): The current game state.
+        - square_selected (tuple): The selected square coordinates.
+
+        Returns:
+        list: The pygame.Rect areas of the screen drawn, empty when nothing changed.
+        """
+        self.move_log.sync(game_state.move_log)
+        log = self.move_log.version
+        state = (game_state, game_state.zobrist_key, square_selected, log, game_state.check_mate,
+                 game_state.stale_mate)
+        now = p.time.get_ticks()
+        animation = self.animator.current(now)
+        if not self.full_redraw and state == self.drawn_state and animation is None and self.drawn_piece is None:
+            return []
+        if self.drawn_state is not None and state[4:] != self.drawn_state[4:]:
+            self.full_redraw = True  # the end of game message appears or must be erased
+        self.drawn_state = state
+
+        dirty = []
+        if self.full_redraw:
+            draw_background(screen)
+            self.drawn_squares = [[None] * DIMENSION for _ in range(DIMENSION)]
+            self.drawn_log = None
+
+        if self.drawn_piece is not None:
+            # the squares under the moving piece of the last frame are redrawn to erase it
+            rect = self.drawn_piece
+            for r in range(rect.top // SQ_SIZE, min((rect.bottom - 1) // SQ_SIZE + 1, DIMENSION)):
+                for c in range(rect.left // SQ_SIZE, min((rect.right - 1) // SQ_SIZE + 1, DIMENSION)):
+                    self.drawn_squares[r][c] = None
+            self.drawn_piece = None
+
+        highlights = highlighted_squares(game_state, game_state.get_valid_moves(), square_selected)
+        # during an animation, the board after the animated move without the moving piece
+        board = animation.board if animation is not None else game_state.board
+        covered = animation.covered if animation is not None else {}
+        for r in range(DIMENSION):
+            drawn_row = self.drawn_squares[r]
+            for c in range(DIMENSION):
+                square = (covered.get((r, c), board[r][c]), highlights.get((r, c)))
+                if drawn_row[c] != square:
+                    dirty.append(draw_square(screen, r, c, *square))
+                    drawn_row[c] = square
+
+        if animation is not None:
+            row, col = animation.position(now)
+            self.drawn_piece = screen.blit(IMAGES[animation.move.piece_moved],
+                                           (round(col * SQ_SIZE) + 5, round(row * SQ_SIZE) + 5))
+            dirty.append(self.drawn_piece)
+
+        if log != self.drawn_log:
+            dirty.append(self.move_log.draw(screen))
+            self.drawn_log = log
+
+        if self.full_redraw:
+            dirty = [screen.get_rect()]
+            self.full_redraw = False
+        return dirty
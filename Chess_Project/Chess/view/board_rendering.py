@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pygame as p
 
 B_WIDTH = 600  # width of the chessboard display window
@@ -11,6 +13,23 @@ SQ_SIZE = B_HEIGHT // DIMENSION  # size of each square on the chessboard
 MAX_FPS = 60  # maximum frames per second for the display
 IMAGES = {}
 
+SQUARE_COLORS = (p.Color(227, 193, 111), p.Color(184, 139, 74))  # light and dark squares
+SELECTED, TARGET = "selected", "target"  # kinds of highlighted squares
+HIGHLIGHT_COLORS = {SELECTED: p.Color(253, 185, 201), TARGET: p.Color(187, 246, 243)}
+HIGHLIGHT_ALPHA = 100  # transparency value -> 0 transparent; 255 opaque
+MOVE_LOG_RECT = p.Rect(B_WIDTH + 20, 0, LEFT_PANEL_WIDTH, LEFT_PANEL_HEIGHT + 25)
+SCREEN_SIZE = (B_WIDTH + LEFT_PANEL_WIDTH, B_HEIGHT + 25)  # the size of the game screen
+
+NOTATION_FONT_SIZE = 24
+MOVE_LOG_FONT_SIZE = 20
+END_GAME_FONT_SIZE = 32
+MOVE_LOG_LINE_HEIGHT = 15  # the line size of the move log font
+MOVE_LOG_LINES = (LEFT_PANEL_HEIGHT + 25 - 10) // MOVE_LOG_LINE_HEIGHT  # lines visible in the move log panel
+TEXT_CACHE_SIZE = 512  # rendered texts kept by render_text
+
+FONTS = {}  # the fonts by size, created on first use
+ASSETS = {}  # the surfaces composited on first use: the background and the highlights
+
 
 def load_images():
     """
@@ -26,163 +45,206 @@ def load_images():
             IMAGES[piece] = p.transform.scale(p.image.load(path + piece + ".png"), (SQ_SIZE - 14, SQ_SIZE - 14))
         else:
             IMAGES[piece] = p.transform.scale(p.image.load(path + piece + ".png"), (SQ_SIZE - 10, SQ_SIZE - 10))
+        if p.display.get_surface() is not None:
+            IMAGES[piece] = IMAGES[piece].convert_alpha()  # the pixel format of the display blits faster
 
 
-def draw_game_state(screen, gs, square_selected):
+def get_font(size):
     """
-    Draw all the graphics within a current game state.
+    Get the default font in the given size, created once.
 
     Parameters:
-    - screen (pygame.Surface): The game screen.
-    - gs (GameState): The current game state.
-    - square_selected (tuple): The selected square coordinates.
+    - size (int): The font size.
 
     Returns:
-    None
+    pygame.font.Font: The font.
     """
-    draw_board(screen)  # draw squares on the board
+    font = FONTS.get(size)
+    if font is None:
+        font = FONTS[size] = p.font.Font(None, size)
+    return font
 
-    highlight_squares(screen, gs, gs.get_valid_moves(), square_selected)
 
-    draw_pieces(screen, gs.board)  # draw pieces on top of those squares
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(text, size, color, antialias=True):
+    """
+    Render a text in the default font, keeping the most recently used renderings.
 
-    draw_notation(screen)
+    Parameters:
+    - text (str): The text.
+    - size (int): The font size.
+    - color (str): The color name (e.g. "black").
+    - antialias (bool): True for smooth edges.
 
-    draw_move_log(screen, gs)
+    Returns:
+    pygame.Surface: The rendered text, shared by the callers, which must not draw on it.
+    """
+    return get_font(size).render(text, antialias, p.Color(color))
 
 
-def draw_board(screen):
+def get_background():
     """
-    Draw the chessboard squares on the screen.
+    Get the background of the game screen, composited on first use: the board squares, the notation and the
+    border lines, on white.
+
+    Returns:
+    pygame.Surface: The background, of the size of the game screen.
+    """
+    background = ASSETS.get("background")
+    if background is None:
+        background = p.Surface(SCREEN_SIZE)
+        background.fill(p.Color("white"))
+        for r in range(DIMENSION):
+            for c in range(DIMENSION):
+                p.draw.rect(background, SQUARE_COLORS[(r + c) % 2], square_rect(r, c))
+        for i in range(DIMENSION):
+            # row and column notation
+            background.blit(render_text(str(DIMENSION - i), NOTATION_FONT_SIZE, "black"),
+                            (B_WIDTH + 5, i * SQ_SIZE + 25))
+            background.blit(render_text(chr(ord('a') + i), NOTATION_FONT_SIZE, "black"),
+                            (25 + i * SQ_SIZE + 5, B_HEIGHT + 5))
+        p.draw.rect(background, p.Color("black"), p.Rect(B_WIDTH, 0, 3, B_HEIGHT))
+        p.draw.rect(background, p.Color("black"), p.Rect(0, B_HEIGHT, B_WIDTH + 3, 3))
+        if p.display.get_surface() is not None:
+            background = background.convert()
+        ASSETS["background"] = background
+    return background
+
+
+def get_highlight(kind):
+    """
+    Get the translucent surface highlighting a square, created once per kind.
 
     Parameters:
-    - screen (pygame.Surface): The game screen.
+    - kind (str): SELECTED or TARGET.
 
     Returns:
-    None
+    pygame.Surface: The highlight, of the size of a square.
     """
-    
-    colors = [p.Color(227, 193, 111), p.Color(184, 139, 74)]
-
-    for r in range(DIMENSION):
-        for c in range(DIMENSION):
-            color = colors[((r + c) % 2)]  # Alternating colors for chessboard squares
-            rect = p.Rect(c * SQ_SIZE, r * SQ_SIZE, SQ_SIZE, SQ_SIZE)
-            p.draw.rect(screen, color, rect)
+    surface = ASSETS.get(kind)
+    if surface is None:
+        surface = ASSETS[kind] = p.Surface((SQ_SIZE, SQ_SIZE))
+        surface.set_alpha(HIGHLIGHT_ALPHA)
+        surface.fill(HIGHLIGHT_COLORS[kind])
+    return surface
 
 
-def draw_pieces(screen, board):
+def draw_background(screen):
     """
-    Draw the chess pieces on the board using the current game state.
+    Draw the background of the game screen: the empty board, the notation and the border lines.
 
     Parameters:
     - screen (pygame.Surface): The game screen.
-    - board (list): The 2D list representing the chessboard.
 
     Returns:
-    None
+    pygame.Rect: The area of the screen drawn.
     """
-    for r in range(DIMENSION):
-        for c in range(DIMENSION):
-            piece = board[r][c]
-            if piece != "--":
-                # Draw the piece on the screen at the appropriate position
-                screen.blit(IMAGES[piece], p.Rect(c * SQ_SIZE + 5, r * SQ_SIZE + 5, SQ_SIZE, SQ_SIZE))
+    return screen.blit(get_background(), (0, 0))
 
 
-def highlight_squares(screen, game_state, valid_moves, square_selected):
+def square_rect(row, col):
     """
-    Highlight square selected and moves for the selected piece.
+    Get the screen rectangle of a square.
+
+    Parameters:
+    - row (int): The row of the square.
+    - col (int): The column of the square.
+
+    Returns:
+    pygame.Rect: The area of the square on the screen.
+    """
+    return p.Rect(col * SQ_SIZE, row * SQ_SIZE, SQ_SIZE, SQ_SIZE)
+
+
+def highlighted_squares(game_state, valid_moves, square_selected):
+    """
+    Get the squares to highlight: the selected square, when it holds a piece of the side to move, and the squares
+    its moves go to.
 
     Parameters:
-    - screen (pygame.display): The game screen.
     - game_state (ChessGameState): The current state of the chess game.
-    - valid_moves (list): List of valid moves for the selected piece.
+    - valid_moves (list): List of valid moves of the position.
     - square_selected (tuple): Tuple containing the (row, column) of the selected square.
 
     Returns:
-    None
+    dict: The kind of highlight (SELECTED or TARGET) of each highlighted (row, column) square.
     """
+    highlights = {}
     if square_selected != ():
         r, c = square_selected
-        if game_state.board[r][c][0] == ('w' if game_state.white_to_move else 'b'):  
-            # square selected is a piece that can be moved
-            # highlight selected square
-            s = p.Surface((SQ_SIZE, SQ_SIZE))
-            s.set_alpha(100)  # transparency value -> 0 transparent; 255 opaque
-            s.fill(p.Color(253, 185, 201))
-            screen.blit(s, (c * SQ_SIZE, r * SQ_SIZE))
-            # highlight moves from that square
-            s.fill(p.Color(187, 246, 243))
+        if game_state.board[r][c][0] == ('w' if game_state.white_to_move else 'b'):
             for move in valid_moves:
                 if move.start_row == r and move.start_col == c:
-                    screen.blit(s, (move.end_col * SQ_SIZE, move.end_row * SQ_SIZE))
+                    highlights[(move.end_row, move.end_col)] = TARGET
+            highlights[(r, c)] = SELECTED
+    return highlights
 
 
-def draw_notation(screen):
+def draw_square(screen, row, col, piece, highlight=None):
     """
-    Draw chess notation on the side of the chessboard.
+    Draw one square of the board with its highlight and its piece.
 
     Parameters:
     - screen (pygame.Surface): The game screen.
+    - row (int): The row of the square.
+    - col (int): The column of the square.
+    - piece (str): The code of the piece on the square, "--" when it is empty.
+    - highlight (str): SELECTED, TARGET or None for no highlight.
 
     Returns:
-    None
+    pygame.Rect: The area of the screen drawn.
     """
-    font = p.font.Font(None, 24)
-    for i in range(DIMENSION):
-        notation_text = font.render(str(DIMENSION - i), True, p.Color("black"))
-        screen.blit(notation_text, (B_WIDTH + 5, i * SQ_SIZE + 25))  # Display row notation
+    rect = square_rect(row, col)
+    screen.blit(get_background(), rect, rect)
+    if highlight is not None:
+        screen.blit(get_highlight(highlight), rect)
+    if piece != "--":
+        screen.blit(IMAGES[piece], rect.move(5, 5))
+    return rect
 
-    for i in range(DIMENSION):
-        notation_text = font.render(chr(ord('a') + i), True, p.Color("black"))
-        screen.blit(notation_text, (25 + i * SQ_SIZE + 5, B_HEIGHT + 5))  # Display column notation
 
-    line = p.Rect(B_WIDTH, 0, 3, B_HEIGHT)
-    p.draw.rect(screen, p.Color("black"), line)
-    line = p.Rect(0, B_HEIGHT, B_WIDTH+3, 3)
-    p.draw.rect(screen, p.Color("black"), line)
+def render_move_log_line(number, moves):
+    """
+    Render a line of the move log: the number of a full move and its white and black moves.
 
+    Parameters:
+    - number (int): The full move number, from 1.
+    - moves (list): The white move and, once played, the black move.
 
-def draw_move_log(screen, gs):
+    Returns:
+    pygame.Surface: The rendered line, owned by the caller.
     """
-    Draw the move log on the game screen.
+    text = f"{number}. " + " ".join(move.get_chess_notation() for move in moves)
+    return get_font(MOVE_LOG_FONT_SIZE).render(text, True, p.Color('white'))
+
+
+def draw_move_log(screen, lines, first_line=0):
+    """
+    Draw the visible window of the move log on the game screen, with a scroll bar when the log is longer.
 
     Parameters:
     - screen (pygame.Surface): The game screen.
-    - gs (GameState): The current game state.
+    - lines (list): The rendered lines of the move log, one per full move (see render_move_log_line).
+    - first_line (int): The index in lines of the first line shown.
 
     Returns:
-    None
+    pygame.Rect: The area of the screen drawn.
     """
-    left_panel = p.Rect(B_WIDTH + 20, 0, LEFT_PANEL_WIDTH, LEFT_PANEL_HEIGHT + 25)
+    left_panel = MOVE_LOG_RECT
     p.draw.rect(screen, p.Color('black'), left_panel)
-    move_log = gs.move_log
-    font = p.font.Font(None, 20)
-    text_color = p.Color('white')
     text_y = 5
-    cond = 0
-    first = 0
-
-    for i in range(0, len(move_log), 2):
-        text = move_log[i].get_chess_notation()
-        text_object = font.render(text, True, text_color)
-        text_location = left_panel.move(5 + cond, text_y)
-        if text_location.top > B_HEIGHT:
-            if first == 0:
-                cond = 50
-                text_location = left_panel.move(5 + cond, 5)
-                text_y = 5
-                first = 1
-        if text_location.top > B_HEIGHT:
-            if first == 1:
-                cond = 100
-                text_location = left_panel.move(5 + cond, 5)
-                text_y = 5
-                first = 2
-
-        screen.blit(text_object, text_location)
-        text_y += text_object.get_height()
+    for text_object in lines[first_line:first_line + MOVE_LOG_LINES]:
+        screen.blit(text_object, left_panel.move(5, text_y))
+        text_y += MOVE_LOG_LINE_HEIGHT
+
+    line_count = len(lines)
+    if line_count > MOVE_LOG_LINES:
+        # the scroll bar, against the right edge of the screen
+        top = left_panel.height * first_line // line_count
+        height = max(left_panel.height * MOVE_LOG_LINES // line_count, 10)
+        scroll_bar = p.Rect(B_WIDTH + LEFT_PANEL_WIDTH - 4, top, 3, height)
+        p.draw.rect(screen, p.Color('gray'), scroll_bar)
+    return left_panel
 
 
 def draw_end_game(screen, text):
@@ -194,12 +256,12 @@ def draw_end_game(screen, text):
     - text (str): The text to be displayed on the end game screen.
 
     Returns:
-    None
+    pygame.Rect: The area of the screen drawn.
     """
-    font = p.font.Font(None, 32)
-    text_object = font.render(text, 0, p.Color('Gray'))
+    text_object = render_text(text, END_GAME_FONT_SIZE, 'Gray', False)
     text_location = p.Rect(0, 0, B_WIDTH, B_HEIGHT).move(B_WIDTH / 2 - text_object.get_width() / 2,
                                                          B_HEIGHT / 2 - text_object.get_height() / 2)
     screen.blit(text_object, text_location)
-    text_object = font.render(text, 0, p.Color('Black'))
+    text_object = render_text(text, END_GAME_FONT_SIZE, 'Black', False)
     screen.blit(text_object, text_location.move(2, 2))
+    return text_location.inflate(2, 2).move(1, 1)
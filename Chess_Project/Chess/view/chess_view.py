@@ -1,7 +1,9 @@
 import pygame as p
 
 from .board_rendering import *
+from .board_renderer import BoardRenderer
 from Chess_Project.Chess.view import menu_buttons_view as menu
+from Chess_Project.Chess.model.game_state_class import GameState
 
 B_WIDTH = 600  # width of the chessboard display window
 B_HEIGHT = 600  # height of the chessboard display window
@@ -14,6 +16,8 @@ MAX_FPS = 60  # maximum frames per second for the display
 
 FONT_SIZE = 32
 
+RATE_INTERVAL = 1000  # milliseconds between two updates of the move generation counter in the window caption
+
 
 class ChessView:
     """
@@ -26,18 +30,25 @@ class ChessView:
         - white_player (bool): Flag indicating whether the white player is controlled by AI.
         - black_player (bool): Flag indicating whether the black player is controlled by AI.
         - running (bool): Flag indicating whether the game is currently running.
+        - rate_time (int): The pygame.time.get_ticks() value of the last move generation counter update.
+        - rate_count (int): The number of move generations at the last counter update.
+        - renderer (BoardRenderer): The renderer of the game screen, redrawing only what changed.
 
     Methods:
         - __init__(self): Initializes the ChessView object.
-        - draw(self, game_state, square_selected=(), game_situation="game"): Draws the game state.
+        - draw(self, game_state, square_selected=(), game_situation="game"): Draws the game state and returns the
+          areas of the screen drawn.
         - create_buttons(self, screen): Creates buttons for the menu.
         - draw_menu(self): Draws the menu screen.
         - start_game(self): Initiates the chess game.
         - set_ai_white(self): Toggles AI control for the white player.
         - set_ai_black(self): Toggles AI control for the black player.
         - quit_game(self): Quits the game.
-        - draw_board(self, game_state, square_selected=()): Draws the chessboard.
-        - animate_move(self, move, screen, board, clock): Animates a chess move on the screen.
+        - draw_board(self, game_state, square_selected=()): Draws the changes of the chessboard.
+        - update_move_generation_rate(self): Shows the move generations per second in the window caption.
+        - scroll_move_log(self, amount): Scrolls the move log panel.
+        - animate_move(self, move, board): Queues the animation of a chess move.
+        - skip_animations(self): Completes the move animations at once.
         - game_initialization(self): Initializes the game.
 
     """
@@ -62,6 +73,9 @@ class ChessView:
         self.white_player = True
         self.black_player = True
         self.running = True
+        self.rate_time = p.time.get_ticks()
+        self.rate_count = GameState.move_generations
+        self.renderer = BoardRenderer()
 
         self.create_buttons(self.screen)
 
@@ -75,12 +89,14 @@ class ChessView:
                 - game_situation (str): The current situation of the game.
 
             Returns:
-                None
+                list: The pygame.Rect areas of the screen drawn, to pass to pygame.display.update.
         """
         if game_situation == "menu":
             self.draw_menu()
+            return [self.screen.get_rect()]
         elif game_situation == "game":
-            self.draw_board(game_state, square_selected)
+            return self.draw_board(game_state, square_selected)
+        return []
 
     def create_buttons(self, screen):
         """
@@ -176,51 +192,67 @@ class ChessView:
 
     def draw_board(self, game_state, square_selected=()):
         """
-        Draw the chessboard on the screen.
+        Draw the changes of the chessboard and the move log since the previous frame.
 
         Parameters:
             - game_state (ChessGameState): The current state of the chess game.
             - square_selected (tuple): The selected square coordinates.
 
+        Returns:
+            list: The pygame.Rect areas of the screen drawn.
+        """
+        dirty = self.renderer.render(self.screen, game_state, square_selected)
+        self.update_move_generation_rate()
+        return dirty
+
+    def update_move_generation_rate(self):
+        """
+        Show in the window caption how many times per second the legal moves were generated, once per second.
+
         Returns:
             None
         """
-        draw_game_state(self.screen, game_state, square_selected)
+        now = p.time.get_ticks()
+        if now - self.rate_time >= RATE_INTERVAL:
+            rate = (GameState.move_generations - self.rate_count) * 1000 / (now - self.rate_time)
+            p.display.set_caption(f"Chess - {rate:.0f} move generations/s")
+            self.rate_time = now
+            self.rate_count = GameState.move_generations
+
+    def scroll_move_log(self, amount):
+        """
+        Scroll the move log panel.
+
+        Parameters:
+        - amount (int): The number of lines to scroll, negative to scroll up towards the first moves.
+
+        Returns:
+        None
+        """
+        self.renderer.move_log.scroll(amount)
 
-    @staticmethod
-    def animate_move(move, screen, board, clock):
+    def animate_move(self, move, board):
         """
-        Animate a chess move on the screen.
+        Animate a chess move on the screen. The animation is queued and played by the following frames of the game
+        loop, which keeps handling the events meanwhile.
 
         Parameters:
-        - move (ChessMove): The move to animate.
-        - screen (pygame.Surface): The game screen.
-        - board (list): The 2D list representing the chessboard.
-        - clock (pygame.time.Clock): The game clock.
+        - move (ChessMove): The move to animate, just made.
+        - board (list): The 2D list representing the chessboard after the move.
 
         Returns:
         None
         """
-        colors = [p.Color(227, 193, 111), p.Color(184, 139, 74)]
-        dR = move.end_row - move.start_row
-        dC = move.end_col - move.start_col
-        frames_per_square = 5  # frames to move one square
-        frame_count = (abs(dR) + abs(dC)) * frames_per_square
-        for frame in range(frame_count + 1):
-            r, c = (move.start_row + dR * frame / frame_count, move.start_col + dC * frame / frame_count)
-            draw_board(screen)
-            draw_pieces(screen, board)
-            # erase the piece moved from its ending square
-            color = colors[(move.end_row + move.end_col) % 2]
-            end_square = p.Rect(move.end_col * SQ_SIZE, move.end_row * SQ_SIZE, SQ_SIZE, SQ_SIZE)
-            p.draw.rect(screen, color, end_square)
-            # draw captured piece onto rectangle
-            if move.piece_captured != '--':
-                screen.blit(IMAGES[move.piece_captured], end_square)
-            # draw moving piece
-            screen.blit(IMAGES[move.piece_moved], p.Rect(c * SQ_SIZE, r * SQ_SIZE, SQ_SIZE, SQ_SIZE))
-            p.display.flip()
-            clock.tick(60)
+        self.renderer.animator.add(move, board)
+
+    def skip_animations(self):
+        """
+        Complete the move animations at once, so that the board shown is the board of the game.
+
+        Returns:
+        None
+        """
+        self.renderer.animator.skip()
 
     def game_initialization(self):
         """
@@ -234,23 +266,5 @@ class ChessView:
         """
         self.screen = p.display.set_mode((B_WIDTH + LEFT_PANEL_WIDTH, B_HEIGHT + 25))
         self.screen.fill(p.Color("white"))
+        self.renderer.invalidate()
 
-
-def draw_end_game(screen, text):
-    """
-    Draw the end game screen with the specified text.
-
-    Parameters:
-    - screen (pygame.Surface): The game screen.
-    - text (str): The text to be displayed on the end game screen.
-
-    Returns:
-    None
-    """
-    font = p.font.Font(None, 32)
-    text_object = font.render(text, 0, p.Color('Gray'))
-    text_location = p.Rect(0, 0, B_WIDTH, B_HEIGHT).move(B_WIDTH / 2 - text_object.get_width() / 2,
-                                                         B_HEIGHT / 2 - text_object.get_height() / 2)
-    screen.blit(text_object, text_location)
-    text_object = font.render(text, 0, p.Color('Black'))
-    screen.blit(text_object, text_location.move(2, 2))
@@ -0,0 +1,147 @@
+"""
+Move Animation Module for Chess Game
+
+This module contains the move animations as tweens: an animation only knows when it started and where the moved piece
+is at a given time, and the game loop advances it by drawing a frame whenever it draws the board, so the events keep
+being handled while a piece moves. The animations of moves made in quick succession (AI against AI) wait in a queue
+and play one after the other, and the input of the player skips them all so that the board shown catches up with
+the game before the input is handled.
+
+Usage:
+    animator = MoveAnimator()
+    animator.add(move, game_state.board)
+    animation = animator.current(p.time.get_ticks())
+"""
+from collections import deque
+
+from .board_rendering import MAX_FPS
+
+ANIMATION_MS_PER_SQUARE = 5 * 1000 // MAX_FPS  # 5 frames per square at the maximum frame rate
+MAX_QUEUED_ANIMATIONS = 2  # animations waiting behind the running one, the oldest are skipped beyond
+
+
+class MoveAnimation:
+    """
+    The tween of a piece moving from its start square to its end square.
+
+    Attributes:
+        - move (Move): The move animated.
+        - board (list): A copy of the board after the move, shown under the moving piece.
+        - covered (dict): The pieces shown instead of the board on some squares while the piece moves: the captured
+          piece, or an empty square, on the end square, and the pawn captured en passant on its square.
+        - duration (int): The length of the animation in milliseconds.
+        - start (int): The pygame.time.get_ticks() value when the animation started, None while it waits.
+
+    Methods:
+        - position(now): Returns the location of the moving piece on the board.
+        - done(now): Returns True when the animation is complete.
+    """
+
+    def __init__(self, move, board):
+        """
+        Initialize the animation of a move, not started yet.
+
+        Parameters:
+        - move (Move): The move to animate.
+        - board (list): The board after the move, copied.
+        """
+        self.move = move
+        self.board = [row[:] for row in board]
+        if move.is_en_passant_move:
+            self.covered = {(move.end_row, move.end_col): '--', (move.start_row, move.end_col): move.piece_captured}
+        else:
+            self.covered = {(move.end_row, move.end_col): move.piece_captured}
+        squares = abs(move.end_row - move.start_row) + abs(move.end_col - move.start_col)
+        self.duration = squares * ANIMATION_MS_PER_SQUARE
+        self.start = None
+
+    def position(self, now):
+        """
+        Get the location of the moving piece.
+
+        Parameters:
+        - now (int): The current pygame.time.get_ticks() value.
+
+        Returns:
+        tuple: The (row, col) location, in squares, fractional between two squares.
+        """
+        move = self.move
+        progress = min((now - self.start) / self.duration, 1.0) if self.duration else 1.0
+        return (move.start_row + (move.end_row - move.start_row) * progress,
+                move.start_col + (move.end_col - move.start_col) * progress)
+
+    def done(self, now):
+        """
+        Check if the animation is complete.
+
+        Parameters:
+        - now (int): The current pygame.time.get_ticks() value.
+
+        Returns:
+        bool: True once the piece has reached its end square.
+        """
+        return now - self.start >= self.duration
+
+
+class MoveAnimator:
+    """
+    The queue of the move animations, played one after the other.
+
+    Attributes:
+        - queue (deque): The running animation first, followed by the waiting ones.
+
+    Methods:
+        - add(move, board): Queues the animation of a move.
+        - skip(): Completes all the animations at once.
+        - current(now): Returns the running animation, starting the next one when it is complete.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty animation queue.
+        """
+        self.queue = deque()
+
+    def add(self, move, board):
+        """
+        Queue the animation of a move, skipping the oldest animations when too many are waiting.
+
+        Parameters:
+        - move (Move): The move made.
+        - board (list): The board after the move.
+
+        Returns:
+        None
+        """
+        self.queue.append(MoveAnimation(move, board))
+        while len(self.queue) > MAX_QUEUED_ANIMATIONS + 1:
+            self.queue.popleft()
+
+    def skip(self):
+        """
+        Complete all the animations at once, the board shown becoming the board of the game.
+
+        Returns:
+        None
+        """
+        self.queue.clear()
+
+    def current(self, now):
+        """
+        Get the running animation, dropping the complete ones and starting the next one.
+
+        Parameters:
+        - now (int): The current pygame.time.get_ticks() value.
+
+        Returns:
+        MoveAnimation: The running animation, None when there is none.
+        """
+        queue = self.queue
+        while queue:
+            animation = queue[0]
+            if animation.start is None:
+                animation.start = now
+            if not animation.done(now):
+                return animation
+            queue.popleft()
+        return None
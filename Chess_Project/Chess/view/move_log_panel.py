@@ -0,0 +1,105 @@
+"""
+Move Log Panel Module for Chess Game
+
+This module contains the view model of the move log panel. It keeps a rendered line for every full move and mirrors
+the move log of the game incrementally: every frame it only compares the end of the log with the moves it already
+shows, renders the lines of the new moves and drops the lines of the undone ones, and the panel only draws the lines
+of its visible window. The cost of a frame does not grow with the length of the game.
+
+Usage:
+    panel = MoveLogPanel()
+    panel.sync(game_state.move_log)
+    panel.draw(screen)
+"""
+from .board_rendering import MOVE_LOG_LINES, draw_move_log, render_move_log_line
+
+
+class MoveLogPanel:
+    """
+    The rendered lines of the move log and the window of them which is visible.
+
+    Attributes:
+        - moves (list): The moves shown, a copy of the move log of the game at the last sync.
+        - lines (list): The rendered line of every full move.
+        - first_line (int): The index of the first visible line.
+        - follow (bool): True while the window shows the latest moves and scrolls down with the game.
+        - version (int): Incremented whenever the panel changes, to know when it must be redrawn.
+
+    Methods:
+        - sync(move_log): Follows the moves made and undone since the last sync.
+        - scroll(amount): Scrolls the visible window by a number of lines.
+        - draw(screen): Draws the visible window and returns the area drawn.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty panel, following the latest moves.
+        """
+        self.moves = []
+        self.lines = []
+        self.first_line = 0
+        self.follow = True
+        self.version = 0
+
+    def sync(self, move_log):
+        """
+        Follow the moves made and undone since the last sync. The log only changes at its end, so the moves shown
+        are compared from their end until they are a prefix of the log, and the rest of the log is appended.
+
+        Parameters:
+        - move_log (list): The move log of the game.
+
+        Returns:
+        None
+        """
+        moves = self.moves
+        lines = self.lines
+        if len(moves) == len(move_log) and (not moves or moves[-1] is move_log[-1]):
+            return  # nothing changed, the common case
+
+        while moves and (len(moves) > len(move_log) or moves[-1] is not move_log[len(moves) - 1]):
+            moves.pop()
+            if len(moves) % 2 == 0:
+                lines.pop()  # the white move of the line undone
+            else:
+                lines[-1] = render_move_log_line(len(lines), moves[-1:])
+        for move in move_log[len(moves):]:
+            moves.append(move)
+            if len(moves) % 2 == 1:
+                lines.append(render_move_log_line(len(lines) + 1, moves[-1:]))
+            else:
+                lines[-1] = render_move_log_line(len(lines), moves[-2:])
+
+        last_window = max(0, len(lines) - MOVE_LOG_LINES)
+        if self.follow or self.first_line > last_window:
+            self.first_line = last_window
+        self.version += 1
+
+    def scroll(self, amount):
+        """
+        Scroll the visible window; scrolling down to the latest moves follows the game again.
+
+        Parameters:
+        - amount (int): The number of lines to scroll, negative to scroll up towards the first moves.
+
+        Returns:
+        None
+        """
+        last_window = max(0, len(self.lines) - MOVE_LOG_LINES)
+        first_line = min(max(self.first_line + amount, 0), last_window)
+        self.follow = first_line == last_window
+        if first_line != self.first_line:
+            self.first_line = first_line
+            self.version += 1
+
+    def draw(self, screen):
+        """
+        Draw the visible window of the move log.
+
+        Parameters:
+        - screen (pygame.Surface): The game screen.
+
+        Returns:
+        pygame.Rect: The area of the screen drawn.
+        """
+        return draw_move_log(screen, self.lines, self.first_line)